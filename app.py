@@ -12,16 +12,15 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import PAGE_CONFIG, config
 from data_pipeline import build_dashboard_dataset, get_regime_inputs
-from indicators import RegimeClassifier
+from indicators import RegimeClassifier, RegimeFrame
 from loaders import CSVLoader
 from components.styles import get_global_css
 from views.dashboard_sections import (
-    DIAGNOSTIC_VIEW_OPTIONS,
     PRIMARY_SECTION_OPTIONS,
     build_view_context,
     render_action_center,
     render_command_center,
-    render_diagnostics,
+    render_diagnostics_workspace,
     render_framework_expander,
 )
 
@@ -101,7 +100,12 @@ def _render_sidebar() -> tuple[bool, bool]:
                         for error in validation['errors']:
                             st.error(f"업로드 검증 실패: {error}")
                     else:
-                        custom_df = csv_loader.load_from_dataframe(upload_df, indicator_name)
+                        custom_df = csv_loader.load_from_dataframe(
+                            upload_df,
+                            indicator_name,
+                            date_col=validation['detected_date_col'],
+                            value_col=validation['detected_value_col'],
+                        )
                         existing_frames = [
                             frame for frame in st.session_state['custom_indicator_frames']
                             if frame.empty or frame['indicator'].iloc[0] != indicator_name
@@ -134,7 +138,7 @@ df, data_dict, load_status = build_dashboard_dataset(
 )
 
 classifier = RegimeClassifier()
-regime_data = get_regime_inputs(data_dict)
+regime_data = RegimeFrame.from_series(get_regime_inputs(data_dict))
 regime_result = classifier.classify(regime_data)
 
 try:
@@ -176,17 +180,6 @@ primary_section = st.segmented_control(
 if primary_section:
     st.session_state['ui_state']['primary_section'] = primary_section
 
-if st.session_state['ui_state']['primary_section'] == 'Diagnostics':
-    diagnostic_view = st.segmented_control(
-        "Diagnostics",
-        options=DIAGNOSTIC_VIEW_OPTIONS,
-        default=st.session_state['ui_state'].get('diagnostic_view', 'Liquidity Engine'),
-        selection_mode='single',
-        label_visibility='collapsed',
-    )
-    if diagnostic_view:
-        st.session_state['ui_state']['diagnostic_view'] = diagnostic_view
-
 st.session_state['ui_state']['show_framework'] = False
 
 if st.session_state['ui_state']['primary_section'] == 'Command Center':
@@ -198,11 +191,10 @@ if st.session_state['ui_state']['primary_section'] == 'Command Center':
         alert_config=view_context['alert_config'],
     )
 elif st.session_state['ui_state']['primary_section'] == 'Diagnostics':
-    render_diagnostics(
+    render_diagnostics_workspace(
         data_dict=data_dict,
         regime_result=regime_result,
         alert_config=view_context['alert_config'],
-        diagnostic_view=st.session_state['ui_state']['diagnostic_view'],
     )
 else:
     render_action_center(
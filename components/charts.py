@@ -58,6 +58,14 @@ HEIGHT_PRESETS = {
     'tall': 480,
 }
 
+# Traces longer than this are thinned to coarser calendar buckets before plotting
+MAX_TRACE_POINTS = 1500
+_RESAMPLE_PERIODS = ('W', 'M', 'Q', 'Y')
+
+# Line trace values are sent as float32 (plotly encodes them as typed arrays,
+# so this halves the y payload; 7 significant digits is plenty on screen)
+TRACE_DTYPE = np.float32
+
 
 def get_active_timeframe(timeframe: Optional[str] = None) -> str:
     """Resolve the active chart timeframe."""
@@ -106,6 +114,34 @@ def filter_dataframe_by_timeframe(
     return working_df[working_df[date_col] >= cutoff]
 
 
+def _viz_resample(series: pd.Series, target: int = MAX_TRACE_POINTS) -> pd.Series:
+    """
+    Thin a long time series for plotting by keeping the last observation per calendar bucket.
+    차트용 시계열 축소 (구간별 마지막 관측치 유지)
+
+    The bucket is the finest of weekly/monthly/quarterly/yearly that brings the
+    series under `target` points. Kept points are real observations, so the
+    latest value and date are unchanged.
+
+    Args:
+        series: Time series sorted by a DatetimeIndex
+        target: Maximum number of points to plot
+
+    Returns:
+        The series itself if short enough (or not date-indexed), else the thinned series
+    """
+    if len(series) <= target or not isinstance(series.index, pd.DatetimeIndex):
+        return series
+
+    keep = None
+    for period in _RESAMPLE_PERIODS:
+        codes = series.index.to_period(period).asi8
+        keep = np.append(codes[1:] != codes[:-1], True)
+        if np.count_nonzero(keep) <= target:
+            break
+    return series[keep]
+
+
 def _resolve_height(height: int, height_preset: Optional[str]) -> int:
     if height_preset and height_preset in HEIGHT_PRESETS:
         return HEIGHT_PRESETS[height_preset]
@@ -117,16 +153,64 @@ def _apply_threshold_lines(
     threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]] = None,
 ) -> None:
     for line in threshold_lines or []:
+        # Any annotation_* argument makes Plotly add an annotation, even an empty one
+        annotation = {}
+        if line.get('label'):
+            annotation = {
+                'annotation_text': line['label'],
+                'annotation_position': str(line.get('annotation_position', 'right')),
+            }
         fig.add_hline(
             y=float(line['value']),
             line_dash=str(line.get('dash', 'dash')),
             line_color=str(line.get('color', COLORS['neutral'])),
             opacity=float(line.get('opacity', 0.55)),
-            annotation_text=line.get('label'),
-            annotation_position=str(line.get('annotation_position', 'right')),
+            **annotation,
         )
 
 
+def add_horizontal_bands(
+    fig: go.Figure,
+    bands: List[Dict[str, Union[float, str]]],
+) -> None:
+    """
+    Shade labelled horizontal zones (same result as add_hrect per band) in one layout update.
+    라벨이 있는 수평 구간 음영을 한 번의 레이아웃 갱신으로 추가
+
+    Each add_hrect call is a separate validated layout mutation; appending all
+    shapes and labels at once is several times faster for 3-4 bands.
+
+    Args:
+        fig: Figure to modify in place
+        bands: Dicts with y0, y1, fillcolor, label and optional line_color/line_width
+            (without either, the default rect border is drawn, as with add_hrect)
+    """
+    shapes = []
+    annotations = []
+    for band in bands:
+        shape = {
+            'type': 'rect',
+            'xref': 'x domain', 'x0': 0, 'x1': 1,
+            'yref': 'y', 'y0': band['y0'], 'y1': band['y1'],
+            'fillcolor': band['fillcolor'],
+            'layer': 'below',
+        }
+        line = {attr: band['line_' + attr] for attr in ('color', 'width') if 'line_' + attr in band}
+        if line:
+            shape['line'] = line
+        shapes.append(shape)
+        annotations.append({
+            'text': band['label'],
+            'showarrow': False,
+            'xref': 'x domain', 'x': 1, 'xanchor': 'right',
+            'yref': 'y', 'y': (band['y0'] + band['y1']) / 2, 'yanchor': 'middle',
+        })
+    fig.update_layout(
+        shapes=[*fig.layout.shapes, *shapes],
+        annotations=[*fig.layout.annotations, *annotations],
+    )
+
+
 def _annotate_latest_points(fig: go.Figure, max_annotations: int = 3) -> None:
     added = 0
     for trace in fig.data:
@@ -175,7 +259,7 @@ def _apply_common_layout(fig: go.Figure, title: str, height: int) -> None:
 
 
 def create_timeseries_chart(
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, pd.Series],
     title: str = '',
     date_col: str = 'date',
     value_col: str = 'value',
@@ -187,13 +271,15 @@ def create_timeseries_chart(
     height_preset: Optional[str] = None,
     threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]] = None,
     latest_annotation: bool = False,
+    horizontal_bands: Optional[List[Dict[str, Union[float, str]]]] = None,
 ) -> go.Figure:
     """
     Create a single time series chart.
     단일 타임시리즈 차트 생성
     
     Args:
-        df: DataFrame with date and value columns
+        df: DataFrame with date and value columns, or a date-indexed Series
+            (plotted directly; date_col/value_col/indicator_col are ignored)
         title: Chart title
         date_col: Name of date column
         value_col: Name of value column
@@ -201,6 +287,7 @@ def create_timeseries_chart(
         highlight_recent: Whether to highlight recent 3 months
         show_trend: Whether to show trend line
         height: Chart height in pixels
+        horizontal_bands: Labelled y-zones to shade (see add_horizontal_bands)
         
     Returns:
         Plotly Figure
@@ -208,48 +295,59 @@ def create_timeseries_chart(
     if df is None or df.empty:
         return go.Figure()
 
-    df = filter_dataframe_by_timeframe(df, date_col=date_col, timeframe=timeframe)
+    if isinstance(df, pd.Series):
+        line = filter_series_by_timeframe(df, timeframe=timeframe)
+        if not line.index.is_monotonic_increasing:
+            line = line.sort_index()
+        indicator_col = None
+    else:
+        line = None
+        df = filter_dataframe_by_timeframe(df, date_col=date_col, timeframe=timeframe)
     resolved_height = _resolve_height(height, height_preset)
     fig = go.Figure()
     
     # Handle multi-indicator data
-    if indicator_col and indicator_col in df.columns:
+    if line is None and indicator_col and indicator_col in df.columns:
         indicators = df[indicator_col].unique()
         for i, ind in enumerate(indicators):
             ind_df = df[df[indicator_col] == ind].sort_values(date_col)
+            points = _viz_resample(ind_df.set_index(date_col)[value_col])
             color = SERIES_COLORS[i % len(SERIES_COLORS)]
             fig.add_trace(go.Scatter(
-                x=ind_df[date_col],
-                y=ind_df[value_col],
+                x=points.index,
+                y=points.to_numpy(dtype=TRACE_DTYPE),
                 name=ind,
                 mode='lines',
                 line=dict(color=color, width=2.2),
             ))
+        dates, values = pd.Index(df[date_col]), df[value_col]
     else:
-        df = df.sort_values(date_col)
+        if line is None:
+            line = df.sort_values(date_col).set_index(date_col)[value_col]
+        points = _viz_resample(line)
         fig.add_trace(go.Scatter(
-            x=df[date_col],
-            y=df[value_col],
+            x=points.index,
+            y=points.to_numpy(dtype=TRACE_DTYPE),
             name=title or 'Value',
             mode='lines',
             line=dict(color=COLORS['primary'], width=2.4),
         ))
+        dates, values = line.index, line
     
     # Highlight recent 3 months
-    if highlight_recent and len(df) > 63:
-        recent_start = df[date_col].iloc[-63]
+    if highlight_recent and len(dates) > 63:
         fig.add_vrect(
-            x0=recent_start, x1=df[date_col].iloc[-1],
+            x0=dates[-63], x1=dates[-1],
             fillcolor="rgba(96, 165, 250, 0.08)",
             layer="below",
             line_width=0,
         )
 
-    if show_trend and len(df) >= 2:
-        trend = np.polyfit(np.arange(len(df)), df[value_col], deg=1)
-        trend_values = trend[0] * np.arange(len(df)) + trend[1]
+    if show_trend and len(dates) >= 2:
+        trend = np.polyfit(np.arange(len(dates)), values, deg=1)
+        trend_values = trend[0] * np.arange(len(dates)) + trend[1]
         fig.add_trace(go.Scatter(
-            x=df[date_col],
+            x=dates,
             y=trend_values,
             name='Trend',
             mode='lines',
@@ -257,6 +355,8 @@ def create_timeseries_chart(
         ))
 
     _apply_threshold_lines(fig, threshold_lines)
+    if horizontal_bands:
+        add_horizontal_bands(fig, horizontal_bands)
     if latest_annotation:
         _annotate_latest_points(fig, max_annotations=1 if not indicator_col else 3)
     _apply_common_layout(fig, title, resolved_height)
@@ -303,9 +403,10 @@ def create_multi_line_chart(
         if series is None or len(series) == 0:
             continue
             
-        values = filter_series_by_timeframe(series.copy(), timeframe=timeframe)
+        values = filter_series_by_timeframe(series, timeframe=timeframe)
         if values is None or len(values) == 0:
             continue
+        values = _viz_resample(values)
         if normalize and len(values) > 0:
             values = (values / values.iloc[0]) * 100
         
@@ -314,7 +415,7 @@ def create_multi_line_chart(
         
         trace = go.Scatter(
             x=values.index if hasattr(values, 'index') else range(len(values)),
-            y=values,
+            y=values.to_numpy(dtype=TRACE_DTYPE),
             name=name,
             mode='lines',
             line=dict(color=color, width=2.2, dash='dash' if is_secondary else 'solid'),
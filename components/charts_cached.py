@@ -0,0 +1,152 @@
+"""
+Cached chart builders.
+캐시된 차트 생성기
+
+Plotly figure construction (trace validation, layout, annotations) dominates
+chart cost on reruns where the data has not changed. These wrappers return the
+same Figure object for identical data and options.
+
+The returned figures are shared across reruns and sessions, so callers must
+not mutate them (pass threshold_lines instead of calling fig.add_hline).
+"""
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.charts import (
+    create_multi_line_chart,
+    create_timeseries_chart,
+    get_active_timeframe,
+)
+
+# Figures kept per builder; one per chart slot across the diagnostic views is plenty
+_MAX_CACHED_FIGURES = 64
+
+
+@st.cache_resource(max_entries=_MAX_CACHED_FIGURES, show_spinner=False)
+def _cached_multi_line_chart(
+    data: Dict[str, pd.Series],
+    title: str,
+    normalize: bool,
+    height: int,
+    secondary_y: Optional[List[str]],
+    timeframe: str,
+    height_preset: Optional[str],
+    threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]],
+    latest_annotation: bool,
+) -> go.Figure:
+    return create_multi_line_chart(
+        data,
+        title=title,
+        normalize=normalize,
+        height=height,
+        secondary_y=secondary_y,
+        timeframe=timeframe,
+        height_preset=height_preset,
+        threshold_lines=threshold_lines,
+        latest_annotation=latest_annotation,
+    )
+
+
+@st.cache_resource(max_entries=_MAX_CACHED_FIGURES, show_spinner=False)
+def _cached_timeseries_chart(
+    df: Union[pd.DataFrame, pd.Series],
+    title: str,
+    date_col: str,
+    value_col: str,
+    indicator_col: Optional[str],
+    highlight_recent: bool,
+    show_trend: bool,
+    height: int,
+    timeframe: str,
+    height_preset: Optional[str],
+    threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]],
+    latest_annotation: bool,
+    horizontal_bands: Optional[List[Dict[str, Union[float, str]]]],
+) -> go.Figure:
+    return create_timeseries_chart(
+        df,
+        title=title,
+        date_col=date_col,
+        value_col=value_col,
+        indicator_col=indicator_col,
+        highlight_recent=highlight_recent,
+        show_trend=show_trend,
+        height=height,
+        timeframe=timeframe,
+        height_preset=height_preset,
+        threshold_lines=threshold_lines,
+        latest_annotation=latest_annotation,
+        horizontal_bands=horizontal_bands,
+    )
+
+
+def cached_multi_line_chart(
+    data: Dict[str, pd.Series],
+    title: str = '',
+    normalize: bool = False,
+    height: int = 400,
+    secondary_y: Optional[List[str]] = None,
+    timeframe: Optional[str] = None,
+    height_preset: Optional[str] = None,
+    threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]] = None,
+    latest_annotation: bool = False,
+) -> go.Figure:
+    """
+    Cached create_multi_line_chart (same arguments; returned figure is shared).
+    캐시된 다중 라인 차트
+    """
+    # Resolve the session timeframe here so it is part of the cache key
+    return _cached_multi_line_chart(
+        data,
+        title,
+        normalize,
+        height,
+        secondary_y,
+        get_active_timeframe(timeframe),
+        height_preset,
+        threshold_lines,
+        latest_annotation,
+    )
+
+
+def cached_timeseries_chart(
+    df: Union[pd.DataFrame, pd.Series],
+    title: str = '',
+    date_col: str = 'date',
+    value_col: str = 'value',
+    indicator_col: Optional[str] = None,
+    highlight_recent: bool = True,
+    show_trend: bool = False,
+    height: int = 400,
+    timeframe: Optional[str] = None,
+    height_preset: Optional[str] = None,
+    threshold_lines: Optional[List[Dict[str, Union[float, str, int]]]] = None,
+    latest_annotation: bool = False,
+    horizontal_bands: Optional[List[Dict[str, Union[float, str]]]] = None,
+) -> go.Figure:
+    """
+    Cached create_timeseries_chart (same arguments; returned figure is shared).
+    캐시된 단일 타임시리즈 차트
+    """
+    return _cached_timeseries_chart(
+        df,
+        title,
+        date_col,
+        value_col,
+        indicator_col,
+        highlight_recent,
+        show_trend,
+        height,
+        get_active_timeframe(timeframe),
+        height_preset,
+        threshold_lines,
+        latest_annotation,
+        horizontal_bands,
+    )
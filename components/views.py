@@ -0,0 +1,75 @@
+"""
+Per-series snapshots for page rendering.
+페이지 렌더링용 시리즈 스냅샷
+
+Metric cards only need a handful of scalars per indicator (latest value,
+length, latest date, recent change). Collecting them once per render keeps
+the card code free of repeated dict lookups, len() guards and .iloc[-1] calls.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Card display scale and unit for indicators not shown in raw units
+DISPLAY_UNITS: Dict[str, Tuple[float, str]] = {
+    'fed_assets': (1e-12, 'T'),
+    'bank_credit': (1e-12, 'T'),
+    'm2': (1e-12, 'T'),
+    'reserve_balances': (1e-12, 'T'),
+    'fed_lending': (1e-9, 'B'),
+    'reverse_repo': (1e-9, 'B'),
+    'tga_balance': (1e-9, 'B'),
+    'hy_spread': (100.0, ' bps'),
+    'ig_spread': (100.0, ' bps'),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SeriesView:
+    """Latest-value snapshot of one indicator series."""
+    series: pd.Series
+    values: np.ndarray  # float64, oldest first
+    last: float
+    length: int
+    last_date: pd.Timestamp
+    display_last: float  # last * scale, ready to print with unit
+    unit: str = ''
+    scale: float = 1.0
+
+    def change(self, periods: int) -> float:
+        """Latest value minus the value `periods` observations earlier (0.0 if too short)."""
+        if self.length <= periods:
+            return 0.0
+        return self.last - float(self.values[-periods - 1])
+
+
+def build_views(data_dict: Dict[str, Optional[pd.Series]]) -> Dict[str, SeriesView]:
+    """
+    Build a SeriesView for every non-empty series in the data dict.
+    데이터 딕셔너리의 각 시리즈에 대한 스냅샷 생성
+
+    Args:
+        data_dict: Dict of indicator name -> time series
+
+    Returns:
+        Dict of indicator name -> SeriesView (missing or empty series are omitted)
+    """
+    views: Dict[str, SeriesView] = {}
+    for key, series in data_dict.items():
+        if series is None or len(series) == 0:
+            continue
+        values = series.to_numpy(dtype=np.float64)
+        scale, unit = DISPLAY_UNITS.get(key, (1.0, ''))
+        views[key] = SeriesView(
+            series=series,
+            values=values,
+            last=float(values[-1]),
+            length=len(values),
+            last_date=pd.Timestamp(series.index[-1]),
+            display_last=float(values[-1]) * scale,
+            unit=unit,
+            scale=scale,
+        )
+    return views
@@ -76,6 +76,12 @@ class AppConfig:
     default_lookback_years: int = 5
     zscore_window_years: int = 3
     
+    # Loader disk cache directory, opt-in (환경변수 LIQUIDITY_CACHE_DIR, 미설정 시 비활성화)
+    # Entries are pickles, so point it only at a directory other users cannot write
+    data_cache_dir: Optional[str] = field(
+        default_factory=lambda: os.environ.get('LIQUIDITY_CACHE_DIR') or None
+    )
+    
     # FRED API key (Streamlit Secrets 또는 환경변수 FRED_API_KEY에서 로드)
     fred_api_key: Optional[str] = field(default_factory=_get_fred_api_key)
     
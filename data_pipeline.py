@@ -1,18 +1,26 @@
 """
 Shared data loading and assembly pipeline for the dashboard.
 """
+import os
 from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import streamlit as st
 
-from config import INDICATOR_LABEL_TO_KEY
-from loaders import FREDLoader, SampleDataLoader, YFinanceLoader
+from config import INDICATOR_LABEL_TO_KEY, config
+from loaders import DataLoader, FREDLoader, SampleDataLoader, YFinanceLoader
 
 
 REQUIRED_DATA_COLUMNS = ['date', 'value', 'indicator']
 
 
+def _loader_cache_dir(source: str) -> Optional[str]:
+    """Disk cache directory for a live data source (None when disabled)."""
+    if not config.data_cache_dir:
+        return None
+    return os.path.join(config.data_cache_dir, source)
+
+
 @st.cache_data(ttl=3600 * 6)
 def load_source_data(
     use_sample: bool = True,
@@ -26,32 +34,31 @@ def load_source_data(
     data_frames: List[pd.DataFrame] = []
     load_status: List[str] = []
 
-    fred = FREDLoader(api_key=fred_api_key)
+    fred = FREDLoader(api_key=fred_api_key, cache_dir=_loader_cache_dir('fred'))
     if fred.is_ready():
         try:
             fred_data = fred.load_all_minimum_set()
+            fred_frames = [fred_data] if not fred_data.empty else []
 
-            if load_fed_balance_sheet and not fred_data.empty:
+            if load_fed_balance_sheet and fred_frames:
                 try:
                     fed_bs_extra = fred.load('H41RESPPALDNNWW')
                     if not fed_bs_extra.empty:
-                        fred_data = pd.concat(
-                            [fred_data, fed_bs_extra],
-                            ignore_index=True,
-                        )
+                        fred_frames.append(fed_bs_extra)
                 except Exception:
                     pass
 
-            if not fred_data.empty:
-                data_frames.append(fred_data)
-                indicator_count = len(fred_data['indicator'].unique())
+            # Frames are collected and concatenated once below
+            if fred_frames:
+                data_frames.extend(fred_frames)
+                indicator_count = len(set().union(*(frame['indicator'].unique() for frame in fred_frames)))
                 load_status.append(f"FRED: {indicator_count}개 지표 로딩됨")
         except Exception as error:
             load_status.append(f"FRED: 로딩 실패 - {error}")
     else:
         load_status.append(f"FRED: {fred.get_status_message()}")
 
-    yf = YFinanceLoader()
+    yf = YFinanceLoader(cache_dir=_loader_cache_dir('yfinance'))
     if yf.is_available():
         try:
             yf_data = yf.load_all_minimum_set()
@@ -63,7 +70,7 @@ def load_source_data(
             load_status.append(f"yfinance: 로딩 실패 - {error}")
 
     if data_frames:
-        return pd.concat(data_frames, ignore_index=True), load_status
+        return DataLoader.concat_frames(data_frames), load_status
 
     load_status.append("실시간 데이터를 가져올 수 없어 샘플 데이터를 사용합니다.")
     return SampleDataLoader().load_all(), load_status
@@ -77,12 +84,12 @@ def merge_indicator_frames(
     frames: List[pd.DataFrame] = []
 
     if base_df is not None and not base_df.empty:
-        frames.append(base_df.loc[:, REQUIRED_DATA_COLUMNS].copy())
+        frames.append(base_df.loc[:, REQUIRED_DATA_COLUMNS])
 
     for frame in custom_frames or []:
         if frame is None or frame.empty:
             continue
-        frames.append(frame.loc[:, REQUIRED_DATA_COLUMNS].copy())
+        frames.append(frame.loc[:, REQUIRED_DATA_COLUMNS])
 
     if not frames:
         return pd.DataFrame(columns=REQUIRED_DATA_COLUMNS)
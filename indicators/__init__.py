@@ -9,9 +9,14 @@ from .transforms import (
     detect_inflection,
     calc_percentile,
     calc_rolling_stats,
+    latest_pct_change,
+    latest_3m_annualized,
+    latest_zscore,
+    latest_percentile,
 )
 from .regime import (
     RegimeClassifier,
+    RegimeFrame,
     calculate_regime_scores,
     determine_regime,
 )
@@ -33,8 +38,13 @@ __all__ = [
     'detect_inflection',
     'calc_percentile',
     'calc_rolling_stats',
+    'latest_pct_change',
+    'latest_3m_annualized',
+    'latest_zscore',
+    'latest_percentile',
     # Regime
     'RegimeClassifier',
+    'RegimeFrame',
     'calculate_regime_scores',
     'determine_regime',
     # Alerts
@@ -13,14 +13,105 @@ Implements calculations defined in config.py DERIVED_METRICS:
 
 All functions follow pandas convention with proper error handling and NaN propagation.
 """
+from dataclasses import dataclass
 from typing import Dict, Tuple, Optional
 import pandas as pd
 import numpy as np
 
 
+# Shared empty results for the guard paths below. Callers treat metric
+# outputs as read-only, so these are safe to hand out without copying.
+_EMPTY_FLOAT = pd.Series(dtype=float)
+_EMPTY_OBJECT = pd.Series(dtype=object)
+_EMPTY_BOOL = pd.Series(dtype=bool)
+
+_EMPTY_IDENTITY: Dict[str, pd.Series] = {
+    'identity_lhs': _EMPTY_FLOAT,
+    'identity_rhs': _EMPTY_FLOAT,
+    'residual': _EMPTY_FLOAT,
+    'is_balanced': _EMPTY_BOOL,
+    'imbalance_magnitude': _EMPTY_FLOAT,
+}
+_EMPTY_MONEY_MARKET: Dict[str, pd.Series] = {
+    'rrp_level': _EMPTY_FLOAT,
+    'stress_regime': _EMPTY_OBJECT,
+    'stress_score': _EMPTY_FLOAT,
+    'rrp_change_1m': _EMPTY_FLOAT,
+    'rrp_acceleration': _EMPTY_FLOAT,
+}
+_EMPTY_LENDING: Dict[str, pd.Series] = {
+    'lending_level': _EMPTY_FLOAT,
+    'stress_regime': _EMPTY_OBJECT,
+    'stress_score': _EMPTY_FLOAT,
+    'lending_yoy': _EMPTY_FLOAT,
+    'lending_percentile_3y': _EMPTY_FLOAT,
+}
+_EMPTY_TGA_DRAG: Dict[str, pd.Series] = {
+    'tga_ratio': _EMPTY_FLOAT,
+    'drag_regime': _EMPTY_OBJECT,
+    'drag_score': _EMPTY_FLOAT,
+    'tga_level': _EMPTY_FLOAT,
+    'effective_reserves': _EMPTY_FLOAT,
+}
+_EMPTY_RESERVE_DEMAND: Dict[str, pd.Series] = {
+    'demand_proxy_ratio': _EMPTY_FLOAT,
+    'demand_regime': _EMPTY_OBJECT,
+    'demand_score': _EMPTY_FLOAT,
+    'total_overnight_liquidity': _EMPTY_FLOAT,
+    'crisis_indicator': _EMPTY_BOOL,
+}
+
+
+@dataclass(frozen=True)
+class MetricsContext:
+    """
+    Pre-validated Fed balance sheet inputs shared across metric functions.
+    파생 지표 공통 입력 (1회 검증/변환)
+
+    Each field is either None (indicator unavailable) or a non-empty float64
+    series in billions USD. Build once per render with from_data_dict() and
+    pass as ctx= to the functions below instead of re-casting and re-scaling
+    the same series for every metric. The functions keep their own None and
+    length guards, since explicit arguments may override any field.
+    """
+    fed_assets: Optional[pd.Series] = None
+    reserves: Optional[pd.Series] = None
+    reverse_repo: Optional[pd.Series] = None
+    tga: Optional[pd.Series] = None
+    fed_lending: Optional[pd.Series] = None
+
+    @classmethod
+    def from_data_dict(
+        cls,
+        data_dict: Dict[str, pd.Series],
+        unit: float = 1e9,
+    ) -> 'MetricsContext':
+        """
+        Build a context from the dashboard data_dict (values in dollars).
+
+        Args:
+            data_dict: Dict of indicator key -> series, as built by prepare_data_dict()
+            unit: Divisor converting raw values to billions USD (default: 1e9)
+        """
+        def prepare(key: str) -> Optional[pd.Series]:
+            series = data_dict.get(key)
+            if series is None or len(series) == 0:
+                return None
+            return series.astype(np.float64) / unit
+
+        return cls(
+            fed_assets=prepare('fed_assets'),
+            reserves=prepare('reserve_balances'),
+            reverse_repo=prepare('reverse_repo'),
+            tga=prepare('tga_balance'),
+            fed_lending=prepare('fed_lending'),
+        )
+
+
 def calculate_qt_pace(
-    fed_assets: pd.Series,
+    fed_assets: Optional[pd.Series] = None,
     periods_1m: int = 21,
+    ctx: Optional[MetricsContext] = None,
 ) -> pd.Series:
     """
     Calculate monthly QT (Quantitative Tightening) pace.
@@ -32,6 +123,7 @@ def calculate_qt_pace(
     Args:
         fed_assets: Fed total assets (WALCL) in billions USD
         periods_1m: Trading days in 1 month (default: 21)
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Monthly percentage change in Fed assets
@@ -42,19 +134,23 @@ def calculate_qt_pace(
         >>> qt_pace = calculate_qt_pace(fed_assets)
         >>> qt_pace.iloc[-1]  # Latest month's pace
     """
+    if ctx is not None:
+        fed_assets = fed_assets if fed_assets is not None else ctx.fed_assets
+
     if fed_assets is None or len(fed_assets) < 2:
-        return pd.Series(dtype=float)
+        return _EMPTY_FLOAT
 
     # Percentage change over 1 month
     return fed_assets.pct_change(periods=periods_1m) * 100
 
 
 def classify_reserve_regime(
-    reserves: pd.Series,
+    reserves: Optional[pd.Series] = None,
     reverse_repo: Optional[pd.Series] = None,
     abundant_threshold: float = 2500.0,
     ample_threshold: float = 1500.0,
     tight_threshold: float = 500.0,
+    ctx: Optional[MetricsContext] = None,
 ) -> pd.Series:
     """
     Classify reserve regime: Abundant, Ample, Tight, or Scarce.
@@ -72,6 +168,7 @@ def classify_reserve_regime(
         abundant_threshold: Level for "Abundant" classification
         ample_threshold: Level for "Ample" classification
         tight_threshold: Level for "Tight" classification
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Series with string classifications: 'Abundant', 'Ample', 'Tight', 'Scarce'
@@ -80,8 +177,12 @@ def classify_reserve_regime(
         >>> regime = classify_reserve_regime(reserves)
         >>> regime.value_counts()
     """
+    if ctx is not None:
+        reserves = reserves if reserves is not None else ctx.reserves
+        reverse_repo = reverse_repo if reverse_repo is not None else ctx.reverse_repo
+
     if reserves is None or len(reserves) == 0:
-        return pd.Series(dtype=object)
+        return _EMPTY_OBJECT
 
     # Compute effective liquidity available to banks
     effective_reserves = reserves.copy()
@@ -99,12 +200,13 @@ def classify_reserve_regime(
 
 
 def verify_balance_sheet_identity(
-    reserves: pd.Series,
-    soma_assets: pd.Series,
-    fed_lending: pd.Series,
-    reverse_repo: pd.Series,
-    tga: pd.Series,
+    reserves: Optional[pd.Series] = None,
+    soma_assets: Optional[pd.Series] = None,
+    fed_lending: Optional[pd.Series] = None,
+    reverse_repo: Optional[pd.Series] = None,
+    tga: Optional[pd.Series] = None,
     tolerance: float = 50.0,
+    ctx: Optional[MetricsContext] = None,
 ) -> Dict[str, pd.Series]:
     """
     Verify Fed balance sheet identity: ΔReserves = ΔSOMA + ΔLending - ΔRRP - ΔTGA
@@ -121,6 +223,7 @@ def verify_balance_sheet_identity(
         reverse_repo: Overnight reverse repo (RRPONTSYD) in billions USD
         tga: Treasury General Account balance (WTREGEN) in billions USD
         tolerance: Acceptable deviation in billions USD (default: 50)
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Dictionary with:
@@ -134,14 +237,15 @@ def verify_balance_sheet_identity(
         >>> result = verify_balance_sheet_identity(reserves, soma, lending, rrp, tga)
         >>> result['is_balanced'].sum() / len(result['is_balanced'])  # % balanced
     """
+    if ctx is not None:
+        reserves = reserves if reserves is not None else ctx.reserves
+        soma_assets = soma_assets if soma_assets is not None else ctx.fed_assets
+        fed_lending = fed_lending if fed_lending is not None else ctx.fed_lending
+        reverse_repo = reverse_repo if reverse_repo is not None else ctx.reverse_repo
+        tga = tga if tga is not None else ctx.tga
+
     if any(s is None or len(s) == 0 for s in [reserves, soma_assets, fed_lending, reverse_repo, tga]):
-        return {
-            'identity_lhs': pd.Series(dtype=float),
-            'identity_rhs': pd.Series(dtype=float),
-            'residual': pd.Series(dtype=float),
-            'is_balanced': pd.Series(dtype=bool),
-            'imbalance_magnitude': pd.Series(dtype=float),
-        }
+        return dict(_EMPTY_IDENTITY)
 
     # Calculate changes (first differences)
     dr_reserves = reserves.diff()  # LHS: change in reserves
@@ -171,11 +275,12 @@ def verify_balance_sheet_identity(
 
 
 def detect_money_market_stress(
-    reverse_repo: pd.Series,
+    reverse_repo: Optional[pd.Series] = None,
     reserves: Optional[pd.Series] = None,
     normal_threshold: Tuple[float, float] = (0, 500),
     elevated_threshold: Tuple[float, float] = (500, 1500),
     stress_threshold: Tuple[float, float] = (1500, 2200),
+    ctx: Optional[MetricsContext] = None,
 ) -> Dict[str, pd.Series]:
     """
     Detect money market stress via reverse repo demand.
@@ -192,6 +297,7 @@ def detect_money_market_stress(
         normal_threshold: Normal RRP range (billions)
         elevated_threshold: Elevated stress range
         stress_threshold: Acute stress range (2023 crisis ~1500-2200B)
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Dictionary with:
@@ -205,14 +311,12 @@ def detect_money_market_stress(
         >>> stress = detect_money_market_stress(rrp, reserves)
         >>> stress['stress_regime'].value_counts()
     """
+    if ctx is not None:
+        reverse_repo = reverse_repo if reverse_repo is not None else ctx.reverse_repo
+        reserves = reserves if reserves is not None else ctx.reserves
+
     if reverse_repo is None or len(reverse_repo) == 0:
-        return {
-            'rrp_level': pd.Series(dtype=float),
-            'stress_regime': pd.Series(dtype=object),
-            'stress_score': pd.Series(dtype=float),
-            'rrp_change_1m': pd.Series(dtype=float),
-            'rrp_acceleration': pd.Series(dtype=float),
-        }
+        return dict(_EMPTY_MONEY_MARKET)
 
     # Initialize classification
     stress_regime = pd.Series('Normal', index=reverse_repo.index, dtype=object)
@@ -246,9 +350,13 @@ def detect_money_market_stress(
     # 1-month change
     rrp_change_1m = reverse_repo.pct_change(periods=21) * 100
 
-    # Acceleration: 2nd derivative
-    velocity = reverse_repo.diff(21)
-    rrp_acceleration = velocity.diff(21)
+    # Acceleration: 2nd derivative, as a single second-difference stencil
+    # a[t] - 2*a[t-21] + a[t-42] (equivalent to .diff(21).diff(21))
+    rrp = reverse_repo.to_numpy(dtype=np.float64)
+    acceleration = np.full_like(rrp, np.nan)
+    if len(rrp) > 42:
+        acceleration[42:] = rrp[42:] - 2.0 * rrp[21:-21] + rrp[:-42]
+    rrp_acceleration = pd.Series(acceleration, index=reverse_repo.index)
 
     return {
         'rrp_level': reverse_repo,
@@ -259,11 +367,20 @@ def detect_money_market_stress(
     }
 
 
+def _pct_at_or_below_last(window: np.ndarray) -> float:
+    """Share (%) of valid observations in a raw window at or below its last value."""
+    valid = np.count_nonzero(~np.isnan(window))
+    if valid == 0:
+        return np.nan
+    return np.count_nonzero(window <= window[-1]) / valid * 100
+
+
 def calculate_fed_lending_stress(
-    fed_lending: pd.Series,
+    fed_lending: Optional[pd.Series] = None,
     normal_threshold: Tuple[float, float] = (0, 100),
     elevated_threshold: Tuple[float, float] = (100, 300),
     stress_threshold: Tuple[float, float] = (300, 1000),
+    ctx: Optional[MetricsContext] = None,
 ) -> Dict[str, pd.Series]:
     """
     Calculate Fed lending stress index from total lending facilities.
@@ -279,6 +396,7 @@ def calculate_fed_lending_stress(
         normal_threshold: Normal usage range
         elevated_threshold: Elevated stress range
         stress_threshold: Acute stress range (GFC peak ~900B, COVID ~600B)
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Dictionary with:
@@ -292,14 +410,11 @@ def calculate_fed_lending_stress(
         >>> lending_stress = calculate_fed_lending_stress(fed_lending)
         >>> lending_stress['stress_score'].tail()
     """
+    if ctx is not None:
+        fed_lending = fed_lending if fed_lending is not None else ctx.fed_lending
+
     if fed_lending is None or len(fed_lending) == 0:
-        return {
-            'lending_level': pd.Series(dtype=float),
-            'stress_regime': pd.Series(dtype=object),
-            'stress_score': pd.Series(dtype=float),
-            'lending_yoy': pd.Series(dtype=float),
-            'lending_percentile_3y': pd.Series(dtype=float),
-        }
+        return dict(_EMPTY_LENDING)
 
     # Initialize classification
     stress_regime = pd.Series('Normal', index=fed_lending.index, dtype=object)
@@ -339,7 +454,7 @@ def calculate_fed_lending_stress(
     # Rolling percentile (3-year window)
     window_252 = 3 * 252
     percentile_rank = fed_lending.rolling(window=window_252, min_periods=window_252//2).apply(
-        lambda x: (x.iloc[-1] >= x.dropna()).sum() / len(x.dropna()) * 100 if len(x.dropna()) > 0 else np.nan
+        _pct_at_or_below_last, raw=True
     )
 
     return {
@@ -352,11 +467,12 @@ def calculate_fed_lending_stress(
 
 
 def calculate_tga_reserve_drag(
-    tga: pd.Series,
-    reserves: pd.Series,
+    tga: Optional[pd.Series] = None,
+    reserves: Optional[pd.Series] = None,
     normal_range: Tuple[float, float] = (0.05, 0.15),
     elevated_range: Tuple[float, float] = (0.15, 0.25),
     stress_range: Tuple[float, float] = (0.25, 1.0),
+    ctx: Optional[MetricsContext] = None,
 ) -> Dict[str, pd.Series]:
     """
     Calculate TGA reserve drag: impact of Treasury account on system liquidity.
@@ -379,6 +495,7 @@ def calculate_tga_reserve_drag(
         normal_range: Normal TGA/Total liquidity ratio
         elevated_range: Elevated impact range
         stress_range: Stress impact range
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Dictionary with:
@@ -392,14 +509,12 @@ def calculate_tga_reserve_drag(
         >>> drag = calculate_tga_reserve_drag(tga, reserves)
         >>> drag['tga_ratio'].iloc[-1]  # Current TGA impact
     """
+    if ctx is not None:
+        tga = tga if tga is not None else ctx.tga
+        reserves = reserves if reserves is not None else ctx.reserves
+
     if tga is None or reserves is None or len(tga) != len(reserves):
-        return {
-            'tga_ratio': pd.Series(dtype=float),
-            'drag_regime': pd.Series(dtype=object),
-            'drag_score': pd.Series(dtype=float),
-            'tga_level': pd.Series(dtype=float),
-            'effective_reserves': pd.Series(dtype=float),
-        }
+        return dict(_EMPTY_TGA_DRAG)
 
     # Total liquid assets available to system
     total_liquid = tga + reserves
@@ -457,11 +572,12 @@ def calculate_tga_reserve_drag(
 
 
 def calculate_reserve_demand_proxy(
-    reverse_repo: pd.Series,
-    reserves: pd.Series,
+    reverse_repo: Optional[pd.Series] = None,
+    reserves: Optional[pd.Series] = None,
     normal_range: Tuple[float, float] = (0.0, 0.3),
     elevated_range: Tuple[float, float] = (0.3, 0.5),
     stress_range: Tuple[float, float] = (0.5, 1.0),
+    ctx: Optional[MetricsContext] = None,
 ) -> Dict[str, pd.Series]:
     """
     Calculate reserve demand proxy: RRP as % of total overnight liquidity.
@@ -487,6 +603,7 @@ def calculate_reserve_demand_proxy(
         normal_range: Normal RRP/(RRP+Reserves) ratio
         elevated_range: Elevated stress range
         stress_range: Acute stress range (2023 crisis >50%)
+        ctx: Optional MetricsContext supplying any series not passed explicitly
 
     Returns:
         Dictionary with:
@@ -501,14 +618,12 @@ def calculate_reserve_demand_proxy(
         >>> demand['demand_proxy_ratio'].iloc[-1]  # Current ratio
         >>> demand['crisis_indicator'].any()  # Any crisis periods?
     """
+    if ctx is not None:
+        reverse_repo = reverse_repo if reverse_repo is not None else ctx.reverse_repo
+        reserves = reserves if reserves is not None else ctx.reserves
+
     if reverse_repo is None or reserves is None or len(reverse_repo) != len(reserves):
-        return {
-            'demand_proxy_ratio': pd.Series(dtype=float),
-            'demand_regime': pd.Series(dtype=object),
-            'demand_score': pd.Series(dtype=float),
-            'total_overnight_liquidity': pd.Series(dtype=float),
-            'crisis_indicator': pd.Series(dtype=bool),
-        }
+        return dict(_EMPTY_RESERVE_DEMAND)
 
     # Total overnight liquidity available
     total_liquidity = reverse_repo + reserves
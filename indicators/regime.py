@@ -10,8 +10,8 @@ Regime classification module.
 
 각 레짐의 조건을 점수화(0~100)하고 가장 높은 레짐을 표시
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 
@@ -20,26 +20,42 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime, REGIME_DESCRIPTIONS
-from .transforms import calc_zscore, calc_3m_annualized, calc_1m_change, calc_percentile
+from .transforms import (
+    calc_1m_change,
+    calc_3m_annualized,
+    calc_percentile,
+    calc_zscore,
+    latest_3m_annualized,
+    latest_pct_change,
+    latest_percentile,
+    latest_zscore,
+)
 
 
-@dataclass
+# Fixed regime order shared by RegimeScore fields (ties resolve to the first)
+_REGIMES = (Regime.EXPANSION, Regime.LATE_CYCLE, Regime.CONTRACTION, Regime.STRESS)
+
+
+@dataclass(slots=True, frozen=True)
 class RegimeScore:
     """Scores for each regime with explanations."""
     expansion: float
     late_cycle: float
     contraction: float
     stress: float
+    _primary: Optional[Regime] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def primary_regime(self) -> Regime:
+        """Regime with the highest score, computed once per instance."""
+        if self._primary is None:
+            primary = _REGIMES[int(np.argmax((self.expansion, self.late_cycle, self.contraction, self.stress)))]
+            object.__setattr__(self, '_primary', primary)
+        return self._primary
     
     def get_primary_regime(self) -> Regime:
         """Get the regime with highest score."""
-        scores = {
-            Regime.EXPANSION: self.expansion,
-            Regime.LATE_CYCLE: self.late_cycle,
-            Regime.CONTRACTION: self.contraction,
-            Regime.STRESS: self.stress,
-        }
-        return max(scores, key=scores.get)
+        return self.primary_regime
     
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary."""
@@ -51,7 +67,7 @@ class RegimeScore:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegimeResult:
     """Complete regime classification result."""
     primary_regime: Regime
@@ -61,6 +77,107 @@ class RegimeResult:
     data_quality_warning: Optional[str] = None
 
 
+class RegimeFrame:
+    """
+    Column-oriented regime inputs sharing a single DatetimeIndex.
+    공통 DatetimeIndex 기반 컬럼형 레짐 입력
+
+    Each indicator is stored once as a contiguous float64 array of its
+    observed values plus the row positions of those observations in the
+    shared index, so slicing every column up to a date is a single
+    searchsorted on the index and zero-copy views on the columns.
+    """
+
+    def __init__(self, index: pd.DatetimeIndex, columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            index: Shared, sorted DatetimeIndex
+            columns: Dict of indicator name -> float64 array aligned to index
+                (NaN where the indicator has no observation)
+        """
+        self.index = pd.DatetimeIndex(index)
+        self._values: Dict[str, np.ndarray] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+        for key, column in columns.items():
+            column = np.asarray(column, dtype=np.float64)
+            rows = np.flatnonzero(~np.isnan(column))
+            self._values[key] = np.ascontiguousarray(column[rows])
+            self._rows[key] = rows
+
+    @classmethod
+    def from_series(cls, data: Dict[str, Optional[pd.Series]]) -> 'RegimeFrame':
+        """
+        Build a frame from a dict of indicator name -> time series.
+        지표별 시계열 딕셔너리로부터 생성
+
+        None and empty series are skipped.
+        """
+        series = {
+            key: s for key, s in data.items()
+            if s is not None and len(s) > 0
+        }
+        if not series:
+            return cls(pd.DatetimeIndex([]), {})
+
+        aligned = pd.concat(series, axis=1, sort=True)
+        return cls(
+            pd.DatetimeIndex(aligned.index),
+            {key: aligned[key].to_numpy(dtype=np.float64) for key in series},
+        )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def keys(self) -> List[str]:
+        """Indicator names in insertion order."""
+        return list(self._values)
+
+    def stop(self, as_of_date: Optional[pd.Timestamp] = None) -> int:
+        """Number of index rows on or before as_of_date (all rows if None)."""
+        if as_of_date is None:
+            return len(self.index)
+        return int(self.index.searchsorted(pd.Timestamp(as_of_date), side='right'))
+
+    def array(self, key: str, as_of_date: Optional[pd.Timestamp] = None) -> np.ndarray:
+        """
+        Observed values of an indicator up to as_of_date.
+        as_of_date까지의 지표 관측값
+
+        Returns:
+            C-contiguous float64 view (empty if the key is missing)
+        """
+        values = self._values.get(key)
+        if values is None:
+            return np.empty(0, dtype=np.float64)
+        if as_of_date is None:
+            return values
+        count = np.searchsorted(self._rows[key], self.stop(as_of_date))
+        return values[:count]
+
+    def observed_counts(self, key: str, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Number of observations of an indicator on or before each date."""
+        stops = self.index.searchsorted(dates, side='right')
+        return np.searchsorted(self._rows[key], stops)
+
+    def last_date(self, key: str) -> Optional[np.datetime64]:
+        """Date of the latest observation of an indicator (raw datetime64)."""
+        rows = self._rows.get(key)
+        if rows is None or len(rows) == 0:
+            return None
+        return self.index.values[rows[-1]]
+
+    def as_series(self, key: str) -> pd.Series:
+        """Adapter returning an indicator as a pandas Series."""
+        return pd.Series(
+            self._values[key],
+            index=self.index[self._rows[key]],
+            name=key,
+        )
+
+
 class RegimeClassifier:
     """
     Regime classification engine.
@@ -92,7 +209,7 @@ class RegimeClassifier:
     
     def classify(
         self,
-        data: Dict[str, pd.Series],
+        data: Union[Dict[str, pd.Series], RegimeFrame],
         as_of_date: Optional[pd.Timestamp] = None,
     ) -> RegimeResult:
         """
@@ -100,7 +217,7 @@ class RegimeClassifier:
         현재 시장 레짐 분류
         
         Args:
-            data: Dict of indicator name -> time series
+            data: Dict of indicator name -> time series, or a RegimeFrame
                 Required keys:
                 - 'credit_growth' or 'bank_credit': Bank credit or similar
                 - 'spread': Credit spread (HY or IG)
@@ -114,8 +231,10 @@ class RegimeClassifier:
         Returns:
             RegimeResult with classification and explanation
         """
+        frame = data if isinstance(data, RegimeFrame) else RegimeFrame.from_series(data)
+
         # Extract latest values
-        metrics = self._extract_metrics(data, as_of_date)
+        metrics = self._extract_metrics(frame, as_of_date)
         
         # Calculate scores for each regime
         scores = self._calculate_scores(metrics)
@@ -129,7 +248,7 @@ class RegimeClassifier:
         confidence = self._calculate_confidence(scores)
         
         # Check data quality
-        warning = self._check_data_quality(data)
+        warning = self._check_data_quality(frame)
         
         return RegimeResult(
             primary_regime=primary,
@@ -141,7 +260,7 @@ class RegimeClassifier:
     
     def classify_history(
         self,
-        data: Dict[str, pd.Series],
+        data: Union[Dict[str, pd.Series], RegimeFrame],
         lookback_years: int = 2,
         freq: str = 'ME',
     ) -> pd.DataFrame:
@@ -159,15 +278,13 @@ class RegimeClassifier:
                 regime (str), confidence (float),
                 expansion, late_cycle, contraction, stress (float 0-100)
         """
+        frame = data if isinstance(data, RegimeFrame) else RegimeFrame.from_series(data)
+
         # Find the date range from available data
-        all_dates = []
-        for series in data.values():
-            if series is not None and len(series) > 0:
-                all_dates.extend(series.index.tolist())
-        if not all_dates:
+        if len(frame) == 0:
             return pd.DataFrame()
 
-        end_date = max(all_dates)
+        end_date = frame.index[-1]
         start_date = end_date - pd.DateOffset(years=lookback_years)
 
         # Generate monthly sample dates
@@ -175,51 +292,69 @@ class RegimeClassifier:
         if len(sample_dates) == 0:
             return pd.DataFrame()
 
-        records = []
-        for date in sample_dates:
-            # Slice each series up to this date
-            sliced = {}
-            for key, series in data.items():
-                if series is not None and len(series) > 0:
-                    s = series[series.index <= date]
-                    if len(s) > 0:
-                        sliced[key] = s
-
-            if not sliced:
-                continue
-
-            try:
-                metrics = self._extract_metrics(sliced, as_of_date=None)
-                scores = self._calculate_scores(metrics)
-                primary = scores.get_primary_regime()
-                confidence = self._calculate_confidence(scores)
-                records.append({
-                    'date': date,
-                    'regime': primary.value,
-                    'confidence': confidence,
-                    'expansion': scores.expansion,
-                    'late_cycle': scores.late_cycle,
-                    'contraction': scores.contraction,
-                    'stress': scores.stress,
-                })
-            except Exception:
-                continue
-
-        if not records:
+        return self.classify_all(frame, dates=sample_dates)
+
+    def classify_all(
+        self,
+        data: Union[Dict[str, pd.Series], RegimeFrame],
+        dates: Optional[pd.DatetimeIndex] = None,
+    ) -> pd.DataFrame:
+        """
+        Classify regime at many dates in one vectorized pass.
+        전체 기간 레짐 일괄 분류
+
+        Each transform is computed once over the full history and read
+        back as of every date, so the result matches calling classify()
+        per date without repeating the rolling work.
+
+        Args:
+            data: Dict of indicator name -> time series, or a RegimeFrame
+            dates: Dates to classify (default: every date in the data)
+
+        Returns:
+            DataFrame indexed by date with the same columns as classify_history()
+        """
+        frame = data if isinstance(data, RegimeFrame) else RegimeFrame.from_series(data)
+        if len(frame) == 0:
+            return pd.DataFrame()
+
+        dates = frame.index if dates is None else pd.DatetimeIndex(dates)
+        dates = dates[dates >= frame.index[0]]
+        if len(dates) == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(records).set_index('date')
-        return df
+        metrics = self._extract_metric_arrays(frame, dates)
+        scores = self._calculate_score_matrix(metrics, len(dates))
+
+        ranked = np.sort(scores, axis=1)
+        top, second = ranked[:, -1], ranked[:, -2]
+        denominator = top + second
+        with np.errstate(divide='ignore', invalid='ignore'):
+            confidence = np.where(denominator > 0, top / denominator, 0.0)
+
+        regime_names = np.array([regime.value for regime in _REGIMES], dtype=object)
+        return pd.DataFrame({
+            'regime': regime_names[np.argmax(scores, axis=1)],
+            'confidence': confidence,
+            'expansion': scores[:, 0],
+            'late_cycle': scores[:, 1],
+            'contraction': scores[:, 2],
+            'stress': scores[:, 3],
+        }, index=pd.DatetimeIndex(dates, name='date'))
 
     @staticmethod
     def _calculate_confidence(scores: RegimeScore) -> float:
         """Measure confidence as the dominance of the top score vs the runner-up."""
-        sorted_scores = sorted(scores.to_dict().values(), reverse=True)
-        if not sorted_scores:
-            return 0.0
+        # Single pass for the top two of the four scores (ties count twice)
+        top_score, second_score = scores.expansion, scores.late_cycle
+        if second_score > top_score:
+            top_score, second_score = second_score, top_score
+        for score in (scores.contraction, scores.stress):
+            if score > top_score:
+                top_score, second_score = score, top_score
+            elif score > second_score:
+                second_score = score
 
-        top_score = sorted_scores[0]
-        second_score = sorted_scores[1] if len(sorted_scores) > 1 else 0.0
         denominator = top_score + second_score
         if denominator <= 0:
             return 0.0
@@ -227,75 +362,183 @@ class RegimeClassifier:
 
     def _extract_metrics(
         self,
-        data: Dict[str, pd.Series],
+        frame: RegimeFrame,
         as_of_date: Optional[pd.Timestamp],
     ) -> Dict[str, float]:
         """Extract relevant metrics from data."""
         metrics = {}
         
-        # Helper to get latest value
-        def get_latest(series, name):
-            if series is None or len(series) == 0:
-                return None
-            if as_of_date:
-                series = series[series.index <= as_of_date]
-            return series.iloc[-1] if len(series) > 0 else None
+        # Helper to get the first available column up to as_of_date
+        # (transforms are trailing, so the latest transformed value only
+        # needs the history up to that date)
+        def values_for(*keys):
+            for key in keys:
+                if key in frame:
+                    return frame.array(key, as_of_date)
+            return None
         
         # Credit growth (3M annualized)
-        credit = data.get('credit_growth')
-        if credit is None:
-            credit = data.get('bank_credit')
-        if credit is not None and len(credit) > 63:
-            credit_3m = calc_3m_annualized(credit, periods_3m=13)  # Weekly data
-            metrics['credit_growth_3m'] = get_latest(credit_3m, 'credit_growth_3m')
+        values = values_for('credit_growth', 'bank_credit')
+        if values is not None and len(values) > 63:
+            metrics['credit_growth_3m'] = latest_3m_annualized(values, periods_3m=13)  # Weekly data
         
         # Spread z-score
-        spread = data.get('spread')
-        if spread is None:
-            spread = data.get('hy_spread')
-        if spread is not None and len(spread) > 156:  # 3 years weekly
-            spread_zscore = calc_zscore(spread, window_years=3, periods_per_year=52)
-            metrics['spread_zscore'] = get_latest(spread_zscore, 'spread_zscore')
-            metrics['spread_level'] = get_latest(spread, 'spread_level')
+        values = values_for('spread', 'hy_spread')
+        if values is not None and len(values) > 156:  # 3 years weekly
+            metrics['spread_zscore'] = latest_zscore(values, window=3 * 52)
+            metrics['spread_level'] = values[-1]
         
         # VIX percentile
-        vix = data.get('vix')
-        if vix is not None and len(vix) > 756:  # 3 years daily
-            vix_pct = calc_percentile(vix, window_years=3, periods_per_year=252)
-            metrics['vix_percentile'] = get_latest(vix_pct, 'vix_percentile')
-            metrics['vix_level'] = get_latest(vix, 'vix_level')
+        values = values_for('vix')
+        if values is not None and len(values) > 756:  # 3 years daily
+            metrics['vix_percentile'] = latest_percentile(values, window=3 * 252)
+            metrics['vix_level'] = values[-1]
         
         # Equity 1M return
-        equity = data.get('equity')
-        if equity is None:
-            equity = data.get('sp500')
-        if equity is not None and len(equity) > 21:
-            equity_1m = calc_1m_change(equity)
-            metrics['equity_1m_return'] = get_latest(equity_1m, 'equity_1m_return')
+        values = values_for('equity', 'sp500')
+        if values is not None and len(values) > 21:
+            metrics['equity_1m_return'] = latest_pct_change(values, 21)
         
         # Valuation vs Earnings gap
-        val_z = data.get('valuation_zscore')
-        earn_z = data.get('earnings_zscore')
-        if val_z is not None and earn_z is not None:
-            gap = val_z - earn_z
-            metrics['val_earn_gap'] = get_latest(gap, 'val_earn_gap')
+        if 'valuation_zscore' in frame and 'earnings_zscore' in frame:
+            gap = frame.as_series('valuation_zscore') - frame.as_series('earnings_zscore')
+            count = len(gap) if as_of_date is None else gap.index.searchsorted(as_of_date, side='right')
+            if count > 0:
+                metrics['val_earn_gap'] = gap.to_numpy()[count - 1]
         
         return metrics
     
+    def _extract_metric_arrays(
+        self,
+        frame: RegimeFrame,
+        dates: pd.DatetimeIndex,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Vectorized _extract_metrics: (values, available mask) per scoring metric at each date."""
+        metrics = {}
+
+        def first_key(*keys):
+            return next((key for key in keys if key in frame), None)
+
+        # Read a transform of a column back as of each date, available once
+        # the indicator has more than min_history observations
+        def as_of(key, transformed, min_history):
+            counts = frame.observed_counts(key, dates)
+            return transformed[np.maximum(counts - 1, 0)], counts > min_history
+
+        key = first_key('credit_growth', 'bank_credit')
+        if key is not None:
+            credit = pd.Series(frame.array(key))
+            metrics['credit_growth_3m'] = as_of(
+                key, calc_3m_annualized(credit, periods_3m=13).to_numpy(), 63
+            )
+
+        key = first_key('spread', 'hy_spread')
+        if key is not None:
+            spread = pd.Series(frame.array(key))
+            metrics['spread_zscore'] = as_of(
+                key, calc_zscore(spread, window_years=3, periods_per_year=52).to_numpy(), 156
+            )
+
+        key = first_key('vix')
+        if key is not None:
+            vix = pd.Series(frame.array(key))
+            metrics['vix_percentile'] = as_of(
+                key, calc_percentile(vix, window_years=3, periods_per_year=252).to_numpy(), 756
+            )
+
+        key = first_key('equity', 'sp500')
+        if key is not None:
+            equity = pd.Series(frame.array(key))
+            metrics['equity_1m_return'] = as_of(
+                key, calc_1m_change(equity, periods_1m=21).to_numpy(), 21
+            )
+
+        if 'valuation_zscore' in frame and 'earnings_zscore' in frame:
+            gap = frame.as_series('valuation_zscore') - frame.as_series('earnings_zscore')
+            counts = gap.index.searchsorted(dates, side='right')
+            metrics['val_earn_gap'] = (gap.to_numpy()[np.maximum(counts - 1, 0)], counts > 0)
+
+        return metrics
+
+    def _calculate_score_matrix(
+        self,
+        metrics: Dict[str, Tuple[np.ndarray, np.ndarray]],
+        n: int,
+    ) -> np.ndarray:
+        """Regime scores from (values, available) metric arrays as an (n, 4) matrix in _REGIMES order."""
+        t = self.thresholds
+        expansion, late_cycle, contraction, stress = np.zeros((4, n))
+        missing = (np.full(n, np.nan), np.zeros(n, dtype=bool))
+
+        # Credit growth component
+        credit, available = metrics.get('credit_growth_3m', missing)
+        high = available & (credit > t['credit_growth_expansion'])
+        low = available & ~high & (credit < t['credit_growth_contraction'])
+        mid = available & ~high & ~low
+        expansion += 30 * high + 15 * mid
+        contraction += 30 * low
+        late_cycle += 15 * mid
+
+        # Spread component
+        spread_z, available = metrics.get('spread_zscore', missing)
+        tight = available & (spread_z < t['spread_zscore_tight'])
+        wide = available & ~tight & (spread_z > t['spread_zscore_wide'])
+        mid = available & ~tight & ~wide
+        expansion += 25 * tight
+        contraction += 20 * wide
+        stress += 15 * wide
+        late_cycle += 15 * mid
+
+        # VIX component
+        vix_pct, available = metrics.get('vix_percentile', missing)
+        low = available & (vix_pct < t['vix_percentile_low'])
+        extreme = available & ~low & (vix_pct > t['vix_stress'])
+        high = available & ~low & ~extreme & (vix_pct > t['vix_percentile_high'])
+        mid = available & ~low & ~extreme & ~high
+        expansion += 25 * low
+        stress += 40 * extreme + 10 * high
+        contraction += 20 * high
+        late_cycle += 10 * mid
+
+        # Equity drawdown (stress amplifier)
+        equity_1m, available = metrics.get('equity_1m_return', missing)
+        drawdown = available & (equity_1m < t['equity_drawdown'])
+        stress += 30 * drawdown
+        contraction += 10 * drawdown
+
+        # Valuation vs Earnings gap (late-cycle detector)
+        gap, available = metrics.get('val_earn_gap', missing)
+        stretched = available & (gap > t['valuation_vs_earnings_gap'])
+        late_cycle += 30 * stretched
+        expansion -= 10 * stretched
+
+        # Normalize to 0-100
+        raw = np.stack([expansion, late_cycle, contraction, stress], axis=1)
+        factor = 100 / np.maximum(raw.max(axis=1), 1)
+        return np.clip(raw * factor[:, None] * 0.7, 0, 100)
+
     def _calculate_scores(self, metrics: Dict[str, float]) -> RegimeScore:
-        """Calculate regime scores based on metrics."""
-        # Initialize scores
-        expansion = 0.0
-        late_cycle = 0.0
-        contraction = 0.0
-        stress = 0.0
+        """Calculate regime scores based on metrics (scalar twin of _calculate_score_matrix)."""
+        # Thresholds read once per call; a single date is cheaper as plain branches
+        t = self.thresholds
+        credit_expansion = t['credit_growth_expansion']
+        credit_contraction = t['credit_growth_contraction']
+        spread_tight = t['spread_zscore_tight']
+        spread_wide = t['spread_zscore_wide']
+        vix_low = t['vix_percentile_low']
+        vix_high = t['vix_percentile_high']
+        vix_stress = t['vix_stress']
+        equity_drawdown = t['equity_drawdown']
+        gap_stretched = t['valuation_vs_earnings_gap']
+        
+        expansion = late_cycle = contraction = stress = 0.0
         
         # Credit growth component
         credit = metrics.get('credit_growth_3m')
         if credit is not None:
-            if credit > self.thresholds['credit_growth_expansion']:
+            if credit > credit_expansion:
                 expansion += 30
-            elif credit < self.thresholds['credit_growth_contraction']:
+            elif credit < credit_contraction:
                 contraction += 30
             else:
                 late_cycle += 15
@@ -304,9 +547,9 @@ class RegimeClassifier:
         # Spread component
         spread_z = metrics.get('spread_zscore')
         if spread_z is not None:
-            if spread_z < self.thresholds['spread_zscore_tight']:
+            if spread_z < spread_tight:
                 expansion += 25
-            elif spread_z > self.thresholds['spread_zscore_wide']:
+            elif spread_z > spread_wide:
                 contraction += 20
                 stress += 15
             else:
@@ -315,11 +558,11 @@ class RegimeClassifier:
         # VIX component
         vix_pct = metrics.get('vix_percentile')
         if vix_pct is not None:
-            if vix_pct < self.thresholds['vix_percentile_low']:
+            if vix_pct < vix_low:
                 expansion += 25
-            elif vix_pct > self.thresholds['vix_stress']:
+            elif vix_pct > vix_stress:
                 stress += 40
-            elif vix_pct > self.thresholds['vix_percentile_high']:
+            elif vix_pct > vix_high:
                 contraction += 20
                 stress += 10
             else:
@@ -327,21 +570,18 @@ class RegimeClassifier:
         
         # Equity drawdown (stress amplifier)
         equity_1m = metrics.get('equity_1m_return')
-        if equity_1m is not None:
-            if equity_1m < self.thresholds['equity_drawdown']:
-                stress += 30
-                contraction += 10
+        if equity_1m is not None and equity_1m < equity_drawdown:
+            stress += 30
+            contraction += 10
         
         # Valuation vs Earnings gap (late-cycle detector)
         gap = metrics.get('val_earn_gap')
-        if gap is not None:
-            if gap > self.thresholds['valuation_vs_earnings_gap']:
-                late_cycle += 30
-                expansion -= 10
+        if gap is not None and gap > gap_stretched:
+            late_cycle += 30
+            expansion -= 10
         
         # Normalize to 0-100
-        max_score = max(expansion, late_cycle, contraction, stress, 1)
-        factor = 100 / max_score if max_score > 0 else 1
+        factor = 100 / max(expansion, late_cycle, contraction, stress, 1)
         
         return RegimeScore(
             expansion=min(100, max(0, expansion * factor * 0.7)),  # Scale down
@@ -395,23 +635,24 @@ class RegimeClassifier:
         
         return explanations[:3]  # Ensure max 3 lines
     
-    def _check_data_quality(self, data: Dict[str, pd.Series]) -> Optional[str]:
+    def _check_data_quality(self, frame: RegimeFrame) -> Optional[str]:
         """Check data quality and return warning if issues found."""
         warnings = []
         
         required = ['credit_growth', 'bank_credit', 'spread', 'hy_spread', 'vix']
-        available = [k for k in required if k in data and data[k] is not None and len(data[k]) > 0]
+        available = [k for k in required if k in frame]
         
         if len(available) < 3:
             warnings.append(f"필수 지표 부족: {3 - len(available)}개 누락")
         
-        for name, series in data.items():
-            if series is not None and len(series) > 0:
-                latest_date = series.index[-1] if hasattr(series, 'index') else None
-                if latest_date:
-                    days_old = (pd.Timestamp.now() - pd.Timestamp(latest_date)).days
-                    if days_old > 7:
-                        warnings.append(f"{name} 데이터가 {days_old}일 전 기준")
+        now = pd.Timestamp.now().to_datetime64()
+        one_day = np.timedelta64(1, 'D')
+        for name in frame.keys():
+            latest_date = frame.last_date(name)
+            if latest_date is not None:
+                days_old = int((now - latest_date) // one_day)
+                if days_old > 7:
+                    warnings.append(f"{name} 데이터가 {days_old}일 전 기준")
         
         return '; '.join(warnings) if warnings else None
 
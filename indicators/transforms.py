@@ -12,10 +12,184 @@ Data transformation functions for indicators.
 - acceleration: 2차 미분 (가속도)
 - inflection: 변곡점 탐지
 """
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
 from typing import Optional, Tuple, List
 import pandas as pd
 import numpy as np
-from scipy import stats
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+
+# Results of the windowed transforms, keyed on series content + arguments.
+# Views rebuild their series every rerun and ask for the same transforms
+# several times per render, so identity is useless as a key.
+_TRANSFORM_CACHE_SIZE = 128
+_transform_cache: "OrderedDict[tuple, pd.Series]" = OrderedDict()
+_transform_cache_lock = threading.Lock()
+
+# Copy-on-Write is always on from pandas 3.0 (the option is deprecated there)
+_PANDAS_ALWAYS_COW = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas Copy-on-Write protects series that share buffers."""
+    return _PANDAS_ALWAYS_COW or pd.get_option('mode.copy_on_write') is True
+
+
+def _series_digest(series: pd.Series) -> bytes:
+    """Digest of a series' values and index (dtype included)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(series.to_numpy(dtype=np.float64).tobytes())
+    index = series.index
+    digest.update(str(index.dtype).encode())
+    if isinstance(index, pd.DatetimeIndex):
+        digest.update(index.asi8.tobytes())
+    else:
+        digest.update(pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes())
+    return digest.digest()
+
+
+def _memoize_on_content(func):
+    """
+    LRU-cache a transform on (series content, arguments).
+
+    Callers get a copy, so writing into the result never touches the cached
+    one: shallow under Copy-on-Write, deep without it (pandas 2.x default).
+    The digest ignores the series name, so the copy takes the caller's name.
+    Only worth it where the transform costs much more than hashing.
+    """
+    def _named_copy(result: pd.Series, series: pd.Series) -> pd.Series:
+        out = result.copy(deep=not _copy_on_write_enabled())
+        out.name = series.name
+        return out
+
+    @wraps(func)
+    def wrapper(series: pd.Series, *args, **kwargs) -> pd.Series:
+        key = (func.__name__, _series_digest(series), args, tuple(sorted(kwargs.items())))
+        with _transform_cache_lock:
+            cached = _transform_cache.get(key)
+            if cached is not None:
+                _transform_cache.move_to_end(key)
+                return _named_copy(cached, series)
+        result = func(series, *args, **kwargs)
+        with _transform_cache_lock:
+            _transform_cache[key] = result
+            while len(_transform_cache) > _TRANSFORM_CACHE_SIZE:
+                _transform_cache.popitem(last=False)
+        return _named_copy(result, series)
+    return wrapper
+
+
+def _trailing_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Strided (n, window) view of the trailing window ending at each position.
+
+    The front is padded with NaN so row i matches what
+    ``series.rolling(window).apply`` would see at position i.
+    """
+    padded = np.concatenate([np.full(window - 1, np.nan), values])
+    return sliding_window_view(padded, window)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sums from a single cumulative sum."""
+    csum = np.cumsum(values)
+    sums = csum.copy()
+    sums[window:] = csum[window:] - csum[:-window]
+    return sums
+
+
+# Recompute a window exactly unless its sum of squares exceeds the running-sum
+# error bound by this factor (keeps fast-path z-scores to ~1e-10 relative error)
+_ZSCORE_EXACT_TOLERANCE = 1e6
+
+
+def _rolling_zscore(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Single-pass rolling z-score from running sums of x and x^2.
+
+    NaNs are skipped (counted out of the window) like pandas rolling
+    mean/std, and the sample std uses ddof=1.
+    """
+    valid = ~np.isnan(values)
+    # Center on the series mean so the running sum of squares keeps precision
+    offset = values[valid].mean() if valid.any() else 0.0
+    x = np.where(valid, values - offset, 0.0)
+    x2 = x * x
+
+    count = _rolling_sum(valid.astype(np.float64), window)
+    total = _rolling_sum(x, window)
+    total_sq = _rolling_sum(x2, window)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+        ss = total_sq - total * mean
+
+        # The running sums carry rounding error on the scale of everything
+        # summed so far, not of the current window. Where that error is not
+        # negligible next to the window's own spread (constant windows, or calm
+        # windows after a high-variance era), redo the window exactly.
+        error_bound = _ZSCORE_EXACT_TOLERANCE * np.finfo(np.float64).eps * np.cumsum(x2)
+        inexact = np.flatnonzero(~(ss > error_bound) & (count > 0))
+        ss[inexact] = np.nan
+        zscore = (x - mean) / np.sqrt(ss / (count - 1))
+        if inexact.size:
+            # Raw values: the global offset would round away a calm window's spread
+            raw = np.where(valid, values, 0.0)
+            exact_mean, exact_ss = _exact_window_moments(raw, valid, window, inexact)
+            # Zero-variance windows give NaN (pandas returns 0/0 there as well)
+            exact_ss[exact_ss <= 0] = np.nan
+            zscore[inexact] = (raw[inexact] - exact_mean) / np.sqrt(exact_ss / (count[inexact] - 1))
+
+    zscore[~valid | (count < max(min_periods, 1))] = np.nan
+    return zscore
+
+
+def _exact_window_moments(
+    values: np.ndarray,
+    valid: np.ndarray,
+    window: int,
+    rows: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Two-pass mean and centered sum of squares of the trailing windows at `rows`.
+
+    `values` holds 0.0 at missing positions; `valid` marks the real observations.
+    """
+    windows = _trailing_windows(values, window)[rows]
+    mask = _trailing_windows(valid.astype(np.float64), window)[rows] == 1.0
+    count = mask.sum(axis=1)
+    mean = np.where(mask, windows, 0.0).sum(axis=1) / count
+    deviations = np.where(mask, windows - mean[:, None], 0.0)
+    return mean, np.einsum('ij,ij->i', deviations, deviations)
+
+
+def _pct_change(series: pd.Series, periods: int) -> np.ndarray:
+    """
+    ``series.pct_change(periods)`` as a fresh float64 array.
+
+    Computed with in-place ufuncs so callers can keep scaling the result
+    without allocating intermediate Series.
+    """
+    if periods <= 0:
+        return series.pct_change(periods=periods).to_numpy(dtype=np.float64, copy=True)
+    values = series.to_numpy(dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if periods < len(values):
+        tail = out[periods:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values[periods:], values[:-periods], out=tail)
+        tail -= 1.0
+    return out
 
 
 def calc_yoy(
@@ -33,7 +207,9 @@ def calc_yoy(
     Returns:
         YoY change as percentage
     """
-    return series.pct_change(periods=periods) * 100
+    out = _pct_change(series, periods)
+    out *= 100
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def calc_3m_annualized(
@@ -51,10 +227,13 @@ def calc_3m_annualized(
     Returns:
         3M change annualized as percentage
     """
-    change_3m = series.pct_change(periods=periods_3m)
-    # Annualize: (1 + 3m_return)^4 - 1
-    annualized = ((1 + change_3m) ** 4 - 1) * 100
-    return annualized
+    out = _pct_change(series, periods_3m)
+    # Annualize: (1 + 3m_return)^4 - 1, fused in place
+    out += 1.0
+    out **= 4
+    out -= 1.0
+    out *= 100
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def calc_1m_change(
@@ -72,9 +251,12 @@ def calc_1m_change(
     Returns:
         1M change as percentage
     """
-    return series.pct_change(periods=periods_1m) * 100
+    out = _pct_change(series, periods_1m)
+    out *= 100
+    return pd.Series(out, index=series.index, name=series.name)
 
 
+@_memoize_on_content
 def calc_zscore(
     series: pd.Series,
     window_years: int = 3,
@@ -98,14 +280,9 @@ def calc_zscore(
     if min_periods is None:
         min_periods = window // 2
     
-    rolling_mean = series.rolling(window=window, min_periods=min_periods).mean()
-    rolling_std = series.rolling(window=window, min_periods=min_periods).std()
-    
-    # Avoid division by zero
-    rolling_std = rolling_std.replace(0, np.nan)
-    
-    zscore = (series - rolling_mean) / rolling_std
-    return zscore
+    # Zero-variance windows come back as NaN (no division by zero)
+    zscore = _rolling_zscore(series.to_numpy(dtype=np.float64), window, min_periods)
+    return pd.Series(zscore, index=series.index, name=series.name)
 
 
 def calc_zscore_change(
@@ -113,6 +290,7 @@ def calc_zscore_change(
     window_years: int = 3,
     change_periods: int = 21,  # 1 month default
     periods_per_year: int = 252,
+    zscore: Optional[pd.Series] = None,
 ) -> pd.Series:
     """
     Calculate change in z-score.
@@ -123,11 +301,14 @@ def calc_zscore_change(
         window_years: Window for z-score calculation
         change_periods: Periods to calculate change over
         periods_per_year: Number of periods per year
+        zscore: Precomputed calc_zscore(series, window_years, periods_per_year)
+            to difference instead of recomputing the rolling window
         
     Returns:
         Change in z-score
     """
-    zscore = calc_zscore(series, window_years, periods_per_year)
+    if zscore is None:
+        zscore = calc_zscore(series, window_years, periods_per_year)
     return zscore.diff(change_periods)
 
 
@@ -150,11 +331,15 @@ def calc_acceleration(
     Returns:
         Acceleration series
     """
-    # First derivative: rate of change
-    velocity = series.diff(first_diff_periods)
-    # Second derivative: acceleration
-    acceleration = velocity.diff(second_diff_periods)
-    return acceleration
+    values = series.to_numpy(dtype=np.float64)
+    lag = first_diff_periods + second_diff_periods
+    acceleration = np.full(len(values), np.nan)
+    if len(values) > lag:
+        # First derivative: rate of change
+        velocity = values[first_diff_periods:] - values[:-first_diff_periods]
+        # Second derivative: acceleration
+        acceleration[lag:] = velocity[second_diff_periods:] - velocity[:-second_diff_periods]
+    return pd.Series(acceleration, index=series.index, name=series.name)
 
 
 def detect_inflection(
@@ -179,30 +364,49 @@ def detect_inflection(
     Returns:
         Series with inflection point indicators
     """
-    result = pd.Series(0, index=series.index)
-    
-    # Rolling max and min
-    rolling_max = series.rolling(window=lookback, center=True).max()
-    rolling_min = series.rolling(window=lookback, center=True).min()
-    
-    # Mark peaks (where current equals rolling max)
-    is_peak = (series == rolling_max) & (series.shift(1) < series) & (series.shift(-1) < series)
-    
-    # Mark troughs (where current equals rolling min)
-    is_trough = (series == rolling_min) & (series.shift(1) > series) & (series.shift(-1) > series)
-    
+    values = series.to_numpy(dtype=np.float64)
+    n = len(values)
+
+    # Centered rolling max/min in O(n) (same alignment as
+    # rolling(window=lookback, center=True)); windows that are incomplete
+    # or contain NaN stay NaN
+    rolling_max = np.full(n, np.nan)
+    rolling_min = np.full(n, np.nan)
+    if n >= lookback:
+        missing = np.isnan(values)
+        start = lookback // 2
+        stop = n - (lookback - 1 - start)
+        full = np.zeros(n, dtype=bool)
+        full[start:stop] = _rolling_sum(missing.astype(np.float64), lookback)[lookback - 1:] == 0
+        rolling_max[full] = maximum_filter1d(np.where(missing, -np.inf, values), lookback)[full]
+        rolling_min[full] = minimum_filter1d(np.where(missing, np.inf, values), lookback)[full]
+
+    prev_values = np.concatenate([[np.nan], values[:-1]])
+    next_values = np.concatenate([values[1:], [np.nan]])
+
+    # Peaks: current equals rolling max and exceeds both neighbours
+    is_peak = (values == rolling_max) & (prev_values < values) & (next_values < values)
+
+    # Troughs: current equals rolling min and is below both neighbours
+    is_trough = (values == rolling_min) & (prev_values > values) & (next_values > values)
+
     if sensitivity > 0:
         # Filter by minimum magnitude
-        pct_from_prev = series.pct_change(lookback).abs() * 100
-        is_peak = is_peak & (pct_from_prev >= sensitivity)
-        is_trough = is_trough & (pct_from_prev >= sensitivity)
-    
+        pct_from_prev = np.full(n, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_from_prev[lookback:] = np.abs(values[lookback:] / values[:-lookback] - 1) * 100
+        is_significant = pct_from_prev >= sensitivity
+        is_peak &= is_significant
+        is_trough &= is_significant
+
+    result = np.zeros(n, dtype=np.int64)
     result[is_peak] = 1
     result[is_trough] = -1
-    
-    return result
+
+    return pd.Series(result, index=series.index)
 
 
+@_memoize_on_content
 def calc_percentile(
     series: pd.Series,
     window_years: int = 3,
@@ -226,13 +430,29 @@ def calc_percentile(
     if min_periods is None:
         min_periods = window // 2
     
-    def percentile_rank(x):
-        if len(x.dropna()) < min_periods:
-            return np.nan
-        return stats.percentileofscore(x.dropna(), x.iloc[-1])
-    
-    percentile = series.rolling(window=window, min_periods=min_periods).apply(percentile_rank)
-    return percentile.clip(lower=0, upper=100)
+    values = series.to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
+    percentile = np.full(len(values), np.nan)
+
+    # Non-NaN count per window in O(n); rows short of min_periods stay NaN,
+    # so the O(n * window) comparisons below start at the first eligible row
+    valid = _rolling_sum((~missing).astype(np.float64), window) if len(values) else values
+    eligible = np.flatnonzero((valid >= min_periods) & ~missing)
+    if eligible.size:
+        first = eligible[0]
+        windows = _trailing_windows(values, window)[first:]
+        current = values[first:, None]
+        # Sum the boolean masks as uint8 rows (much faster than count_nonzero(axis=1))
+        below = (windows < current).view(np.uint8).sum(axis=1, dtype=np.int32)
+        at_or_below = (windows <= current).view(np.uint8).sum(axis=1, dtype=np.int32)
+
+        # Same ranking as scipy.stats.percentileofscore(kind='rank')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentile[first:] = (below + at_or_below + (at_or_below > below)) * 50.0 / valid[first:]
+        percentile[(valid < min_periods) | missing] = np.nan
+        np.clip(percentile, 0, 100, out=percentile)
+
+    return pd.Series(percentile, index=series.index, name=series.name)
 
 
 def calc_rolling_stats(
@@ -257,17 +477,134 @@ def calc_rolling_stats(
     
     rolling = series.rolling(window=window, min_periods=min_periods)
     
-    result = pd.DataFrame({
-        'mean': rolling.mean(),
-        'std': rolling.std(),
-        'min': rolling.min(),
-        'max': rolling.max(),
-        'median': rolling.median(),
-        'skew': rolling.skew(),
-        'kurt': rolling.kurt(),
-    }, index=series.index)
-    
-    return result
+    if BOTTLENECK_AVAILABLE and 1 < window <= len(series):
+        # Specialised fixed-window C routines for the plain moments
+        values = series.to_numpy(dtype=np.float64)
+        min_count = max(min_periods, 1)
+        moments = {
+            'mean': bn.move_mean(values, window, min_count=min_count),
+            'std': bn.move_std(values, window, min_count=max(min_count, 2), ddof=1),
+            'min': bn.move_min(values, window, min_count=min_count),
+            'max': bn.move_max(values, window, min_count=min_count),
+            'median': bn.move_median(values, window, min_count=min_count),
+        }
+    else:
+        moments = {
+            'mean': rolling.mean(),
+            'std': rolling.std(),
+            'min': rolling.min(),
+            'max': rolling.max(),
+            'median': rolling.median(),
+        }
+    
+    moments['skew'] = rolling.skew()
+    moments['kurt'] = rolling.kurt()
+    
+    # Column-major buffer: each statistic is one contiguous column, and the
+    # DataFrame wraps it without consolidating into a row-major block
+    columns = ['mean', 'std', 'min', 'max', 'median', 'skew', 'kurt']
+    buf = np.empty((len(series), len(columns)), order='F')
+    for i, name in enumerate(columns):
+        buf[:, i] = moments[name]
+    
+    return pd.DataFrame(buf, index=series.index, columns=columns, copy=False)
+
+
+def latest_pct_change(values: np.ndarray, periods: int) -> float:
+    """
+    Latest percentage change over `periods`, i.e. pct_change(periods).iloc[-1].
+    최신 변화율 (마지막 값만 계산)
+
+    Args:
+        values: Input values (NumPy array, oldest first)
+        periods: Periods to calculate change over
+
+    Returns:
+        Latest change as percentage (NaN if history is too short)
+    """
+    if len(values) <= periods:
+        return np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float((values[-1] / values[-1 - periods] - 1) * 100)
+
+
+def latest_3m_annualized(values: np.ndarray, periods_3m: int = 63) -> float:
+    """
+    Latest 3-month change annualized, i.e. calc_3m_annualized(...).iloc[-1].
+    최신 3개월 연율화 변화율
+
+    Args:
+        values: Input values (NumPy array, oldest first)
+        periods_3m: Number of periods in 3 months
+
+    Returns:
+        Latest 3M change annualized as percentage
+    """
+    change_3m = latest_pct_change(values, periods_3m) / 100
+    return ((1 + change_3m) ** 4 - 1) * 100
+
+
+def latest_zscore(
+    values: np.ndarray,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> float:
+    """
+    Latest rolling z-score, i.e. calc_zscore(...).iloc[-1], from the trailing window only.
+    최신 Z-score (마지막 윈도우만 계산)
+
+    Args:
+        values: Input values (NumPy array, oldest first)
+        window: Rolling window size in periods
+        min_periods: Minimum valid periods required (default: half of window)
+
+    Returns:
+        Latest z-score (NaN if insufficient data or zero variance)
+    """
+    if min_periods is None:
+        min_periods = window // 2
+    if len(values) == 0 or np.isnan(values[-1]):
+        return np.nan
+
+    tail = values[-window:]
+    tail = tail[~np.isnan(tail)]
+    if len(tail) < max(min_periods, 2) or tail.min() == tail.max():
+        return np.nan
+    return float((values[-1] - tail.mean()) / tail.std(ddof=1))
+
+
+def latest_percentile(
+    values: np.ndarray,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> float:
+    """
+    Latest rolling percentile rank, i.e. calc_percentile(...).iloc[-1], from the trailing window only.
+    최신 백분위수 (마지막 윈도우만 계산)
+
+    Args:
+        values: Input values (NumPy array, oldest first)
+        window: Rolling window size in periods
+        min_periods: Minimum valid periods required (default: half of window)
+
+    Returns:
+        Latest percentile rank 0-100 (NaN if insufficient data)
+    """
+    if min_periods is None:
+        min_periods = window // 2
+    if len(values) == 0 or np.isnan(values[-1]):
+        return np.nan
+
+    tail = values[-window:]
+    current = values[-1]
+    valid = np.count_nonzero(~np.isnan(tail))
+    if valid == 0 or valid < min_periods:
+        return np.nan
+
+    # Same ranking as calc_percentile (scipy percentileofscore kind='rank')
+    below = np.count_nonzero(tail < current)
+    at_or_below = np.count_nonzero(tail <= current)
+    return float((below + at_or_below + (at_or_below > below)) * 50.0 / valid)
 
 
 def get_latest_values(
@@ -277,6 +614,9 @@ def get_latest_values(
     """
     Get the latest values with various transformations.
     최신 값들과 각종 변환값 반환
+
+    Only the trailing window each transformation needs is read, so the cost
+    does not grow with the length of the history.
     
     Args:
         series: Input time series
@@ -291,12 +631,14 @@ def get_latest_values(
     }
     
     if include_changes and len(series) > 252:
-        result['yoy'] = calc_yoy(series).iloc[-1]
-        result['3m_ann'] = calc_3m_annualized(series).iloc[-1]
-        result['1m_change'] = calc_1m_change(series).iloc[-1]
-        result['zscore_3y'] = calc_zscore(series, window_years=3).iloc[-1]
-        result['zscore_5y'] = calc_zscore(series, window_years=5).iloc[-1]
-        result['percentile_3y'] = calc_percentile(series, window_years=3).iloc[-1]
+        # Longest lookback is the 5Y z-score window
+        values = series.to_numpy(dtype=np.float64)[-5 * 252:]
+        result['yoy'] = latest_pct_change(values, 252)
+        result['3m_ann'] = latest_3m_annualized(values, 63)
+        result['1m_change'] = latest_pct_change(values, 21)
+        result['zscore_3y'] = latest_zscore(values, 3 * 252)
+        result['zscore_5y'] = latest_zscore(values, 5 * 252)
+        result['percentile_3y'] = latest_percentile(values, 3 * 252)
     
     return result
 
@@ -313,7 +655,7 @@ def standardize_frequency(
     데이터 주기 표준화
     
     Args:
-        df: Input DataFrame
+        df: Input DataFrame (dates in date_col, or already a DatetimeIndex)
         target_freq: Target frequency ('D', 'W', 'M')
         value_col: Name of value column
         date_col: Name of date column
@@ -322,21 +664,16 @@ def standardize_frequency(
     Returns:
         Resampled DataFrame
     """
-    df = df.copy()
-    df = df.set_index(date_col)
-    
-    if agg_method == 'last':
-        resampled = df[value_col].resample(target_freq).last()
-    elif agg_method == 'mean':
-        resampled = df[value_col].resample(target_freq).mean()
-    elif agg_method == 'first':
-        resampled = df[value_col].resample(target_freq).first()
+    if date_col in df.columns:
+        values = pd.Series(df[value_col].to_numpy(), index=pd.Index(df[date_col], name=date_col))
     else:
-        resampled = df[value_col].resample(target_freq).last()
+        values = df[value_col]
     
-    result = pd.DataFrame({
-        date_col: resampled.index,
-        value_col: resampled.values,
-    })
+    method = {'last': 'last', 'mean': 'mean', 'first': 'first'}.get(agg_method, 'last')
+    resampled = getattr(values.resample(target_freq), method)()
     
-    return result.dropna().reset_index(drop=True)
+    keep = resampled.notna().to_numpy()
+    return pd.DataFrame({
+        date_col: resampled.index[keep],
+        value_col: resampled.to_numpy()[keep],
+    })
@@ -4,13 +4,39 @@ Abstract base class for data loaders.
 
 모든 데이터 소스(FRED, yfinance, CSV)는 이 인터페이스를 구현합니다.
 """
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
+from pathlib import Path
+import time
 import pandas as pd
 import numpy as np
 
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+# (ticker, start ordinal, end ordinal); None marks a default ('latest') date
+CacheKey = Tuple[str, Optional[int], Optional[int]]
+
+# Copy-on-Write is always on from pandas 3.0 (the option is deprecated there)
+_PANDAS_ALWAYS_COW = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas Copy-on-Write protects frames that share buffers."""
+    return _PANDAS_ALWAYS_COW or pd.get_option('mode.copy_on_write') is True
+
 
 @dataclass
 class DataSchema:
@@ -22,10 +48,12 @@ class DataSchema:
         date: 날짜 (index)
         value: 값
         indicator_name: 지표명
+        dtype_value: 값 컬럼 dtype (float64가 필요하면 'float64')
     """
     date_column: str = 'date'
     value_column: str = 'value'
     indicator_column: str = 'indicator'
+    dtype_value: str = 'float32'
 
 
 class DataLoader(ABC):
@@ -34,11 +62,43 @@ class DataLoader(ABC):
     데이터 로더 추상 클래스
     """
     
-    def __init__(self, schema: Optional[DataSchema] = None):
+    # Concurrent load() calls in load_multiple (1 = serial)
+    max_workers: int = 8
+    
+    # Per-ticker cache TTL in seconds (default: _cache_ttl_hours)
+    CACHE_TTL_SECONDS: Dict[str, float] = {}
+    
+    # In-memory cache capacity; least recently used entries are evicted
+    max_cache_entries: int = 128
+    
+    # How long load_multiple skips a ticker after a permanent failure
+    NEGATIVE_CACHE_TTL_SECONDS: float = 300
+    
+    def __init__(
+        self,
+        schema: Optional[DataSchema] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            schema: Data schema configuration
+            rate_limiter: Shared limiter that load() acquires before each network call
+            cache_dir: Directory persisting cached frames across restarts
+                (default: in-memory cache only). Entries are unpickled on
+                read, so it must not be writable by other users.
+        """
         self.schema = schema or DataSchema()
-        self._cache: Dict[str, pd.DataFrame] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
+        self._rate_limiter = rate_limiter
+        # LRU order: most recently used entries at the end
+        self._cache: "OrderedDict[CacheKey, pd.DataFrame]" = OrderedDict()
+        # Expiry deadlines on the time.monotonic() clock
+        self._cache_timestamps: Dict[CacheKey, float] = {}
+        self._cache_lock = threading.Lock()
+        # Tickers that failed permanently -> monotonic skip deadline
+        self._negative_cache: Dict[str, float] = {}
         self._cache_ttl_hours: int = 6
+        self._cache_dir = Path(cache_dir) if cache_dir else None
     
     @abstractmethod
     def load(
@@ -65,65 +125,306 @@ class DataLoader(ABC):
         tickers: List[str],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        timeout: Optional[float] = None,
     ) -> pd.DataFrame:
         """
         Load data for multiple tickers and combine.
         
-        Includes small delay between calls to avoid rate limit bursts.
+        Tickers are fetched concurrently (up to ``max_workers`` threads) so
+        network waits overlap; the rate limiter acquired inside load()
+        enforces the call rate. Tickers that failed permanently (see
+        _is_permanent_failure) are skipped for NEGATIVE_CACHE_TTL_SECONDS.
+        
+        Args:
+            tickers: Tickers to load
+            start_date: Start date
+            end_date: End date
+            timeout: Seconds to wait for all tickers (None = no limit); tickers
+                not finished by then are left out. Fetches already running
+                finish in the background and fill the cache for the next call;
+                tickers still queued are cancelled
         
         Returns:
             DataFrame with columns: date, value, indicator (long format)
         """
-        import time
-        
-        dfs = []
-        for i, ticker in enumerate(tickers):
-            try:
-                df = self.load(ticker, start_date, end_date)
-                dfs.append(df)
-                
-                # Small delay between successful loads to avoid bursts
-                # (rate limiter handles main throttling, this is extra protection)
-                if i < len(tickers) - 1:
-                    time.sleep(0.1)
-                    
-            except Exception as e:
-                print(f"Warning: Failed to load {ticker}: {e}")
-                # Small delay after failures too
-                time.sleep(0.5)
+        now = time.monotonic()
+        pending = [ticker for ticker in tickers if self._negative_cache.get(ticker, 0.0) <= now]
+        results: Dict[str, pd.DataFrame] = {}
+        workers = max(1, min(self.max_workers, len(pending)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {
+            executor.submit(self._load_for_combine, ticker, start_date, end_date): ticker
+            for ticker in pending
+        }
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    logger.warning("Failed to load %s: %s", ticker, e)
+                    if self._is_permanent_failure(e):
+                        self._negative_cache[ticker] = time.monotonic() + self.NEGATIVE_CACHE_TTL_SECONDS
+        except FuturesTimeoutError:
+            unfinished = [ticker for future, ticker in futures.items() if not future.done()]
+            logger.warning("Timed out after %ss waiting for %s", timeout, ', '.join(unfinished))
+        finally:
+            # Every future is done unless the timeout fired
+            executor.shutdown(wait=False, cancel_futures=True)
         
+        # Keep the requested ticker order regardless of completion order
+        dfs = [results[ticker] for ticker in tickers if ticker in results]
         if not dfs:
             return pd.DataFrame()
         
-        return pd.concat(dfs, ignore_index=True)
+        return self._clean_combined(self.concat_frames(dfs))
     
-    def _get_cache_key(self, ticker: str, start_date: datetime, end_date: datetime) -> str:
-        """Generate cache key."""
-        return f"{ticker}_{start_date.isoformat()}_{end_date.isoformat()}"
+    def _load_for_combine(
+        self,
+        ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Per-ticker load used by load_multiple.
+        
+        Loaders that clean the combined frame in _clean_combined return
+        unfilled data here instead of cleaning each ticker separately.
+        """
+        return self.load(ticker, start_date, end_date)
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache is still valid."""
-        if cache_key not in self._cache_timestamps:
+    def _clean_combined(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Post-process the combined load_multiple frame (default: unchanged)."""
+        return df
+    
+    def _is_permanent_failure(self, error: Exception) -> bool:
+        """Whether a load error will repeat on retry (e.g. unknown ticker)."""
+        return False
+    
+    @staticmethod
+    def indicator_column(
+        indicator_name: str,
+        length: int,
+        dtype: Optional[pd.CategoricalDtype] = None,
+    ) -> pd.Categorical:
+        """
+        Categorical indicator column holding a single name.
+        단일 지표명 범주형 컬럼
+        
+        Stores one int8 code per row instead of a string per row.
+        
+        Args:
+            indicator_name: Name repeated on every row
+            length: Number of rows
+            dtype: Shared category set (e.g. a loader's INDICATOR_DTYPE) so
+                concat_frames can skip the category union; ignored when it
+                does not contain indicator_name
+        """
+        if dtype is not None and indicator_name in dtype.categories:
+            code = dtype.categories.get_loc(indicator_name)
+            return pd.Categorical.from_codes(np.full(length, code), dtype=dtype)
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[indicator_name])
+    
+    @staticmethod
+    def concat_frames(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate long-format frames keeping the indicator column categorical.
+        범주형 지표 컬럼을 유지하며 long 포맷 결합
+        
+        Indicator codes are remapped onto one shared, sorted category set
+        (otherwise concat falls back to strings); sorting the categories
+        keeps sort order on the indicator column alphabetical. Frames with
+        identical columns and NumPy dtypes are written straight into
+        preallocated output columns; anything else goes through pd.concat.
+        """
+        if dfs and DataLoader._concatenable_arrays(dfs):
+            return DataLoader._concat_arrays(dfs)
+        
+        names = set()
+        for df in dfs:
+            names.update(df['indicator'].dropna().unique())
+        dtype = pd.CategoricalDtype(sorted(names))
+        return pd.concat(
+            [df.assign(indicator=df['indicator'].astype(dtype)) for df in dfs],
+            ignore_index=True,
+        )
+    
+    @staticmethod
+    def _concatenable_arrays(dfs: List[pd.DataFrame]) -> bool:
+        """Same columns, categorical indicator, same NumPy dtype elsewhere."""
+        columns = dfs[0].columns
+        if 'indicator' not in columns:
             return False
+        expected = None
+        for df in dfs:
+            if not df.columns.equals(columns):
+                return False
+            dtypes = df.dtypes.to_dict()
+            if not isinstance(dtypes.pop('indicator'), pd.CategoricalDtype):
+                return False
+            if expected is None:
+                expected = dtypes
+                if not all(isinstance(dtype, np.dtype) for dtype in dtypes.values()):
+                    return False
+            elif dtypes != expected:
+                return False
+        return True
+    
+    @staticmethod
+    def _concat_arrays(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate column arrays in one pass each (see concat_frames)."""
+        categoricals = [df['indicator'].array for df in dfs]
+        shared = categoricals[0].dtype
+        if all(cat.dtype == shared for cat in categoricals[1:]) and shared.categories.is_monotonic_increasing:
+            categories = shared.categories
+        else:
+            categories = pd.Index(sorted(set().union(*(cat.categories for cat in categoricals))))
         
-        elapsed = datetime.now() - self._cache_timestamps[cache_key]
-        return elapsed < timedelta(hours=self._cache_ttl_hours)
+        # Per-frame code lookup; the trailing -1 keeps missing codes missing
+        codes = np.empty(sum(len(df) for df in dfs), dtype=np.intp)
+        offset = 0
+        for cat in categoricals:
+            lookup = np.append(categories.get_indexer(cat.categories), -1)
+            codes[offset:offset + len(cat)] = lookup[cat.codes]
+            offset += len(cat)
+        
+        # Keep only names that occur (shared loader dtypes list every ticker)
+        used = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        if not used.all():
+            remap = np.append(np.cumsum(used) - 1, -1)
+            codes = remap[codes]
+            categories = categories[used]
+        
+        return pd.DataFrame({
+            col: (
+                pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories))
+                if col == 'indicator'
+                else np.concatenate([df[col].to_numpy() for df in dfs])
+            )
+            for col in dfs[0].columns
+        }, copy=False)
     
-    def _get_from_cache(self, cache_key: str) -> Optional[pd.DataFrame]:
-        """Get data from cache if valid."""
+    def _get_cache_key(
+        self,
+        ticker: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> CacheKey:
+        """
+        Generate cache key at day granularity: (ticker, start, end ordinals).
+        
+        Unset (default) dates key as None ('latest'), so the rolling default
+        window keeps one entry per ticker that lives for the ticker's full
+        TTL instead of a new key every midnight.
+        """
+        return (
+            ticker,
+            None if start_date is None else start_date.toordinal(),
+            None if end_date is None else end_date.toordinal(),
+        )
+    
+    def _cache_ttl_seconds(self, ticker: str) -> float:
+        """Cache TTL for a ticker."""
+        return self.CACHE_TTL_SECONDS.get(ticker, self._cache_ttl_hours * 3600)
+    
+    def _is_cache_valid(self, cache_key: CacheKey) -> bool:
+        """Check if cache is still valid."""
+        return self._cache_timestamps.get(cache_key, 0.0) > time.monotonic()
+    
+    @staticmethod
+    def _detached_copy(data: pd.DataFrame) -> pd.DataFrame:
+        """Copy of a shared frame that caller edits cannot leak into.
+        
+        Under Copy-on-Write a shallow copy shares the buffers and any write
+        copies first; without it (pandas 2.x default) this is a deep copy.
+        """
+        return data.copy(deep=not _copy_on_write_enabled())
+    
+    def _get_from_cache(self, cache_key: CacheKey) -> Optional[pd.DataFrame]:
+        """Get data from cache if valid (memory first, then disk).
+        
+        Returns a detached copy, so a caller's mutations never corrupt the
+        cache entry.
+        """
+        data = None
         if self._is_cache_valid(cache_key):
-            return self._cache.get(cache_key)
-        return None
+            with self._cache_lock:
+                data = self._cache.get(cache_key)
+                if data is not None:
+                    self._cache.move_to_end(cache_key)
+        if data is None:
+            data = self._read_disk_cache(cache_key)
+        return None if data is None else self._detached_copy(data)
+    
+    def _remember(self, cache_key: CacheKey, data: pd.DataFrame, deadline: float) -> None:
+        """Insert a memory cache entry, evicting least recently used ones past capacity."""
+        with self._cache_lock:
+            self._cache[cache_key] = data
+            self._cache.move_to_end(cache_key)
+            self._cache_timestamps[cache_key] = deadline
+            while len(self._cache) > self.max_cache_entries:
+                evicted, _ = self._cache.popitem(last=False)
+                self._cache_timestamps.pop(evicted, None)
+    
+    def _set_cache(
+        self,
+        cache_key: CacheKey,
+        data: pd.DataFrame,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Store data in cache (and on disk when cache_dir is set)."""
+        if ttl_seconds is None:
+            ttl_seconds = self._cache_ttl_hours * 3600
+        self._remember(cache_key, self._detached_copy(data), time.monotonic() + ttl_seconds)
+        self._write_disk_cache(cache_key, data, ttl_seconds)
+    
+    def _disk_cache_path(self, cache_key: CacheKey) -> Optional[Path]:
+        """File backing a cache entry (None without cache_dir)."""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha1(repr(cache_key).encode('utf-8')).hexdigest()
+        return self._cache_dir / f"{type(self).__name__}_{digest}.pkl"
+    
+    def _read_disk_cache(self, cache_key: CacheKey) -> Optional[pd.DataFrame]:
+        """Load an unexpired entry from disk into the memory cache."""
+        path = self._disk_cache_path(cache_key)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = pd.read_pickle(path)
+        except Exception:
+            return None
+        
+        remaining = payload['expires_at'] - time.time()
+        if remaining <= 0:
+            return None
+        
+        data = payload['data']
+        self._remember(cache_key, data, time.monotonic() + remaining)
+        return data
     
-    def _set_cache(self, cache_key: str, data: pd.DataFrame) -> None:
-        """Store data in cache."""
-        self._cache[cache_key] = data.copy()
-        self._cache_timestamps[cache_key] = datetime.now()
+    def _write_disk_cache(self, cache_key: CacheKey, data: pd.DataFrame, ttl_seconds: float) -> None:
+        """Persist a cache entry; the cache is best-effort, so IO errors are ignored."""
+        path = self._disk_cache_path(cache_key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            pd.to_pickle({'expires_at': time.time() + ttl_seconds, 'data': data}, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Failed to write cache for %s: %s", cache_key, e)
     
     def clear_cache(self) -> None:
-        """Clear all cached data."""
-        self._cache.clear()
-        self._cache_timestamps.clear()
+        """Clear all cached data (memory and this loader's disk entries)."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+        self._negative_cache.clear()
+        if self._cache_dir is not None and self._cache_dir.exists():
+            for path in self._cache_dir.glob(f"{type(self).__name__}_*.pkl"):
+                path.unlink(missing_ok=True)
     
     @staticmethod
     def validate_dataframe(df: pd.DataFrame, schema: DataSchema) -> bool:
@@ -133,22 +434,25 @@ class DataLoader(ABC):
         Returns:
             True if valid, raises ValueError if not
         """
-        required_cols = [schema.date_column, schema.value_column, schema.indicator_column]
-        missing = [col for col in required_cols if col not in df.columns]
+        required_cols = (schema.date_column, schema.value_column, schema.indicator_column)
+        columns = set(df.columns)
+        missing = [col for col in required_cols if col not in columns]
         
         if missing:
             raise ValueError(f"Missing required columns: {missing}")
         
-        # Check date column is datetime-like
-        if not pd.api.types.is_datetime64_any_dtype(df[schema.date_column]):
+        dtypes = df.dtypes
+        
+        # Check date column is datetime-like (dtype check before any conversion)
+        if not pd.api.types.is_datetime64_any_dtype(dtypes[schema.date_column]):
             # Try to convert
             try:
-                df[schema.date_column] = pd.to_datetime(df[schema.date_column])
+                df[schema.date_column] = DataLoader._parse_dates(df[schema.date_column])
             except Exception:
                 raise ValueError(f"Column {schema.date_column} cannot be converted to datetime")
         
         # Check value column is numeric
-        if not pd.api.types.is_numeric_dtype(df[schema.value_column]):
+        if not pd.api.types.is_numeric_dtype(dtypes[schema.value_column]):
             raise ValueError(f"Column {schema.value_column} must be numeric")
         
         return True
@@ -170,53 +474,117 @@ class DataLoader(ABC):
         Returns:
             Cleaned DataFrame
         """
-        df = df.copy()
-        
-        # Handle missing values
-        if method == 'ffill':
-            df = df.ffill()
-        elif method == 'bfill':
+        # The first step returns a new frame, so the input is never modified
+        if method == 'bfill':
             df = df.bfill()
         elif method == 'interpolate':
             df = df.interpolate(method='time')
         elif method == 'drop':
             df = df.dropna()
         
-        # Forward fill any remaining NaN at the start
-        df = df.ffill().bfill()
+        # Forward fill (the 'ffill' method itself), then back fill any NaN left
+        # at the start in place on the frame ffill just allocated
+        df = df.ffill()
+        df.bfill(inplace=True)
         
         # Winsorize extreme values
         if winsorize_percentile > 0:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                lower = df[col].quantile(winsorize_percentile)
-                upper = df[col].quantile(1 - winsorize_percentile)
-                df[col] = df[col].clip(lower=lower, upper=upper)
+            numeric = df.select_dtypes(include=[np.number])
+            # One quantile pass and one clip per dtype group (a single
+            # 'value' column in long format), keeping each column's dtype
+            for dtype in numeric.dtypes.unique():
+                cols = numeric.columns[numeric.dtypes == dtype]
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns stay unclipped
+                    lower, upper = np.nanquantile(
+                        numeric[cols].to_numpy(),
+                        [winsorize_percentile, 1 - winsorize_percentile],
+                        axis=0,
+                    )
+                if np.issubdtype(dtype, np.floating):
+                    values = numeric[cols].to_numpy(copy=True)
+                    np.clip(values, lower, upper, out=values)
+                    df[cols] = values
+                else:
+                    df[cols] = numeric[cols].clip(lower=lower, upper=upper, axis=1)
         
         return df
     
+    @staticmethod
+    def handle_missing_values_grouped(
+        df: pd.DataFrame,
+        winsorize_percentile: float = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Forward/back fill and optionally winsorize values per indicator.
+        지표별 결측치 처리 (long 포맷 전체 1회)
+        
+        Equivalent to handle_missing_values(method='ffill') on each
+        indicator's rows, using grouped Cython fills over the long frame.
+        
+        Args:
+            df: Long-format DataFrame with value and indicator columns
+            winsorize_percentile: Percentile for winsorization (0 to disable)
+            
+        Returns:
+            Cleaned DataFrame
+        """
+        indicator = df['indicator']
+        value = df['value'].groupby(indicator, observed=True, sort=False).ffill()
+        value = value.groupby(indicator, observed=True, sort=False).bfill()
+        
+        if winsorize_percentile > 0:
+            grouped = value.groupby(indicator, observed=True, sort=False)
+            lower = grouped.transform('quantile', winsorize_percentile).to_numpy()
+            upper = grouped.transform('quantile', 1 - winsorize_percentile).to_numpy()
+            values = value.to_numpy(copy=True)
+            np.clip(values, lower, upper, out=values)
+            value = pd.Series(values, index=df.index, name='value')
+        
+        return df.assign(value=value)
+    
+    @staticmethod
+    def _parse_dates(dates: pd.Series) -> pd.Series:
+        """
+        Parse a date column, skipping already-datetime input.
+        
+        Text goes through the ISO8601 parser first and only falls back to
+        per-format inference (e.g. '01/26/2024') when that fails.
+        """
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return dates
+        try:
+            return pd.to_datetime(dates, format='ISO8601', cache=True)
+        except (ValueError, TypeError):
+            return pd.to_datetime(dates, cache=True)
+    
     @staticmethod
     def standardize_output(
         df: pd.DataFrame,
         indicator_name: str,
         date_col: str = 'date',
         value_col: str = 'value',
+        value_dtype: str = DataSchema.dtype_value,
     ) -> pd.DataFrame:
         """
         Standardize output to match expected schema.
         
+        Dates are stored at second resolution and values as float32 by
+        default (macro series need neither ns precision nor float64).
+        
         Args:
             df: Input DataFrame (may have various column names)
             indicator_name: Name to assign to indicator column
             date_col: Name of date column in input
             value_col: Name of value column in input
+            value_dtype: dtype of the value column (see DataSchema.dtype_value)
             
         Returns:
             Standardized DataFrame with columns: date, value, indicator
         """
         result = pd.DataFrame({
-            'date': pd.to_datetime(df[date_col]),
-            'value': df[value_col].astype(float),
-            'indicator': indicator_name,
+            'date': DataLoader._parse_dates(df[date_col]).dt.as_unit('s'),
+            'value': df[value_col].astype(value_dtype),
+            'indicator': DataLoader.indicator_column(indicator_name, len(df)),
         })
         return result.dropna(subset=['value'])
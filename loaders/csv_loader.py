@@ -5,13 +5,21 @@ CSV file loader for user-uploaded data.
 사용자가 자신의 데이터를 업로드할 수 있도록 표준 스키마로 매핑
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import pandas as pd
 import io
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .base import DataLoader, DataSchema
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 class CSVLoader(DataLoader):
     """
@@ -26,6 +34,9 @@ class CSVLoader(DataLoader):
     # Common value column names
     VALUE_COLUMNS = ['value', 'Value', 'VALUE', 'close', 'Close', 'CLOSE', 'price', 'Price', 'level', 'Level']
     
+    # Rows sampled to detect date/value columns before the projected read
+    DETECT_ROWS = 10
+    
     def __init__(self, schema: Optional[DataSchema] = None):
         """Initialize CSV loader."""
         super().__init__(schema)
@@ -68,23 +79,105 @@ class CSVLoader(DataLoader):
         Returns:
             DataFrame with columns: date, value, indicator
         """
-        df = pd.read_csv(file_path, encoding='utf-8')
+        df, date_col, value_col = self._read_projected(lambda: file_path)
         
         if indicator_name is None:
             # Derive from filename
             indicator_name = Path(file_path).stem
         
-        return self._process_dataframe(df, indicator_name, start_date, end_date)
+        return self._process_dataframe(
+            df, indicator_name, start_date, end_date,
+            date_col=date_col, value_col=value_col
+        )
+
+    def load_many(
+        self,
+        paths: List[str],
+        indicator_names: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Load several CSV files into one long-format DataFrame.
+        여러 CSV 파일을 한 번에 로드
+        
+        Files are parsed concurrently (up to ``max_workers`` threads; the
+        PyArrow engine releases the GIL) and combined with one concat.
+        Each file keeps its own date/value column detection, so headers
+        may differ between files.
+        
+        Args:
+            paths: CSV file paths
+            indicator_names: Indicator name per path (default: file stems)
+            start_date: Start date filter
+            end_date: End date filter
+            
+        Returns:
+            DataFrame with columns: date, value, indicator (long format)
+        """
+        if indicator_names is None:
+            indicator_names = [Path(path).stem for path in paths]
+        if len(indicator_names) != len(paths):
+            raise ValueError("indicator_names must have one entry per path")
+        if not paths:
+            return pd.DataFrame()
+        
+        workers = max(1, min(self.max_workers, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            dfs = list(executor.map(
+                lambda args: self.load_from_path(args[0], start_date, end_date, args[1]),
+                zip(paths, indicator_names),
+            ))
+        return self.concat_frames(dfs)
 
     def read_upload_to_dataframe(self, uploaded_file: Any) -> pd.DataFrame:
         """Read a Streamlit upload into a raw DataFrame using UTF-8."""
+        content = self._upload_bytes(uploaded_file)
+        return self._read_csv(lambda: io.BytesIO(content))
+    
+    @staticmethod
+    def _upload_bytes(uploaded_file: Any) -> bytes:
+        """Raw bytes of a Streamlit upload (or any file-like object)."""
         if hasattr(uploaded_file, 'getvalue'):
-            content = uploaded_file.getvalue()
-        else:
-            content = uploaded_file.read()
-
-        decoded = content.decode('utf-8')
-        return pd.read_csv(io.StringIO(decoded))
+            return uploaded_file.getvalue()
+        return uploaded_file.read()
+    
+    def _read_csv(self, open_source: Callable[[], Any], **kwargs) -> pd.DataFrame:
+        """
+        Read a UTF-8 CSV, using the PyArrow engine when available.
+        
+        Args:
+            open_source: Returns a fresh path or buffer for each read attempt
+            **kwargs: Extra pd.read_csv arguments (e.g. usecols)
+        """
+        if PYARROW_AVAILABLE:
+            try:
+                return pd.read_csv(open_source(), engine='pyarrow', encoding='utf-8', **kwargs)
+            except Exception:
+                # Ragged or unusual files: retry with the more lenient C parser
+                pass
+        return pd.read_csv(open_source(), encoding='utf-8', **kwargs)
+    
+    def _read_projected(
+        self,
+        open_source: Callable[[], Any],
+    ) -> Tuple[pd.DataFrame, Optional[str], Optional[str]]:
+        """
+        Detect date/value columns on a sample, then read only those columns.
+        헤더 샘플로 컬럼 감지 후 필요한 두 컬럼만 로드
+        
+        Returns:
+            (DataFrame, date_col, value_col); columns are None when detection
+            is deferred to _process_dataframe
+        """
+        sample = pd.read_csv(open_source(), encoding='utf-8', nrows=self.DETECT_ROWS)
+        date_col = self._detect_date_column(sample)
+        value_col = self._detect_value_column(sample)
+        if date_col == '__index__':
+            return self._read_csv(open_source), None, None
+        
+        usecols = [date_col] if value_col == date_col else [date_col, value_col]
+        return self._read_csv(open_source, usecols=usecols), date_col, value_col
     
     def load_from_upload(
         self,
@@ -105,9 +198,13 @@ class CSVLoader(DataLoader):
         Returns:
             DataFrame with columns: date, value, indicator
         """
-        df = self.read_upload_to_dataframe(uploaded_file)
+        content = self._upload_bytes(uploaded_file)
+        df, date_col, value_col = self._read_projected(lambda: io.BytesIO(content))
         
-        return self._process_dataframe(df, indicator_name, start_date, end_date)
+        return self._process_dataframe(
+            df, indicator_name, start_date, end_date,
+            date_col=date_col, value_col=value_col
+        )
     
     def load_from_dataframe(
         self,
@@ -132,8 +229,6 @@ class CSVLoader(DataLoader):
         Returns:
             DataFrame with columns: date, value, indicator
         """
-        df = df.copy()
-        
         # Auto-detect columns if not specified
         if date_col is None:
             date_col = self._detect_date_column(df)
@@ -151,13 +246,28 @@ class CSVLoader(DataLoader):
             if col in df.columns:
                 return col
         
-        # Try to find a datetime column
-        for col in df.columns:
-            try:
-                pd.to_datetime(df[col].head(10))
+        # Already-parsed datetime columns need no trial parse
+        for col, dtype in df.dtypes.items():
+            if pd.api.types.is_datetime64_any_dtype(dtype):
                 return col
-            except Exception:
+        
+        # Trial-parse the first rows of text columns (ISO8601 fast path first)
+        head = df.head(10)
+        text_cols = [
+            col for col, dtype in head.dtypes.items()
+            if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+        ]
+        for col in text_cols:
+            sample = head[col].dropna()
+            if sample.empty:
                 continue
+            parsed = pd.to_datetime(sample, errors='coerce', format='ISO8601', cache=True)
+            if parsed.notna().mean() <= 0.9:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', UserWarning)
+                    parsed = pd.to_datetime(sample, errors='coerce', cache=True)
+            if parsed.notna().mean() > 0.9:
+                return col
         
         # Use index if it looks like dates
         if df.index.name or hasattr(df.index, 'to_datetime'):
@@ -165,6 +275,14 @@ class CSVLoader(DataLoader):
         
         raise ValueError("Could not detect date column. Please specify date_col parameter.")
     
+    @staticmethod
+    def _numeric_columns(df: pd.DataFrame) -> List[str]:
+        """Numeric, non-boolean columns from a single pass over df.dtypes."""
+        return [
+            col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        ]
+    
     def _detect_value_column(self, df: pd.DataFrame) -> str:
         """Auto-detect value column."""
         for col in self.VALUE_COLUMNS:
@@ -172,7 +290,7 @@ class CSVLoader(DataLoader):
                 return col
         
         # Find first numeric column that's not the date
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = self._numeric_columns(df)
         if numeric_cols:
             return numeric_cols[0]
         
@@ -187,9 +305,7 @@ class CSVLoader(DataLoader):
         date_col: Optional[str] = None,
         value_col: Optional[str] = None,
     ) -> pd.DataFrame:
-        """Process and standardize a DataFrame."""
-        df = df.copy()
-        
+        """Process and standardize a DataFrame (the input is not modified)."""
         # Auto-detect columns
         if date_col is None:
             date_col = self._detect_date_column(df)
@@ -202,7 +318,9 @@ class CSVLoader(DataLoader):
             date_col = df.columns[0]
         
         # Standardize
-        result = self.standardize_output(df, indicator_name, date_col, value_col)
+        result = self.standardize_output(
+            df, indicator_name, date_col, value_col, value_dtype=self.schema.dtype_value
+        )
         
         # Filter by date range
         if start_date:
@@ -4,6 +4,9 @@ FRED 데이터 로더
 
 Fed Total Assets, Bank Credit, M2, Credit Spreads 등 매크로 지표 로딩
 """
+import logging
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 import pandas as pd
@@ -20,11 +23,27 @@ try:
 except ImportError:
     PDR_AVAILABLE = False
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
 from .base import DataLoader, DataSchema
-from .rate_limiter import RateLimiter, ExponentialBackoff, create_fred_limiter
+from .rate_limiter import RateLimiter, ExponentialBackoff, create_fred_limiter, retry_after_seconds
+
+logger = logging.getLogger(__name__)
 
 # Module-level rate limiter (shared across instances)
 _fred_rate_limiter: Optional[RateLimiter] = None
+_fred_rate_limiter_lock = threading.Lock()
+
+# Module-level keep-alive HTTP session (shared across instances)
+_fred_session = None
+_fred_session_lock = threading.Lock()
+
+FRED_OBSERVATIONS_URL = 'https://api.stlouisfed.org/fred/series/observations'
 
 
 def _is_non_retryable_fred_error(error: Exception) -> bool:
@@ -46,14 +65,56 @@ def _is_non_retryable_fred_error(error: Exception) -> bool:
     return any(marker in message for marker in non_retryable_markers)
 
 
+def _is_transient_fred_error(error: Exception) -> bool:
+    """
+    Return True for errors worth retrying right away (connection drops,
+    timeouts, HTTP 429 and 5xx responses).
+    """
+    if REQUESTS_AVAILABLE:
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code == 429 or error.response.status_code >= 500
+    message = str(error).lower()
+    transient_markers = [
+        'timed out',
+        'too many requests',
+        'temporarily unavailable',
+        'connection reset',
+    ]
+    return any(marker in message for marker in transient_markers)
+
+
 def get_fred_rate_limiter() -> RateLimiter:
     """Get or create the FRED rate limiter singleton."""
     global _fred_rate_limiter
     if _fred_rate_limiter is None:
-        _fred_rate_limiter = create_fred_limiter()
+        # Double-checked so concurrent first calls share one budget
+        with _fred_rate_limiter_lock:
+            if _fred_rate_limiter is None:
+                _fred_rate_limiter = create_fred_limiter()
     return _fred_rate_limiter
 
 
+def get_fred_session():
+    """
+    Get or create the shared FRED HTTP session (None without requests).
+    
+    Pooled keep-alive connections let consecutive and concurrent
+    load_multiple calls skip repeated TCP/TLS handshakes.
+    """
+    global _fred_session
+    if not REQUESTS_AVAILABLE:
+        return None
+    with _fred_session_lock:
+        if _fred_session is None:
+            pool_size = DataLoader.max_workers * 2
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+            _fred_session = session
+    return _fred_session
+
+
 class FREDLoader(DataLoader):
     """
     FRED data loader using fredapi or pandas-datareader.
@@ -97,10 +158,35 @@ class FREDLoader(DataLoader):
         'H41RESPPALDNNWW': 'Fed Lending Net',
     }
     
+    # Per-fetch retries on transient errors (seconds, jittered ±50%)
+    FETCH_ATTEMPTS = 3
+    RETRY_INITIAL_DELAY = 0.2
+    RETRY_MAX_DELAY = 2.0
+    
+    # Shared indicator categories (sorted, as concat_frames orders them)
+    INDICATOR_DTYPE = pd.CategoricalDtype(sorted(set(TICKER_NAMES.values())))
+    
+    # Cache TTL by publication cadence (unlisted tickers use the 6h default)
+    CACHE_TTL_SECONDS: Dict[str, float] = {
+        # Weekly (H.4.1 / H.8)
+        'WALCL': 24 * 3600,
+        'WRESBAL': 24 * 3600,
+        'WTREGEN': 24 * 3600,
+        'WLCFLPCL': 24 * 3600,
+        'H41RESPPALDNNWW': 24 * 3600,
+        'TOTBKCR': 24 * 3600,
+        'NFCI': 24 * 3600,
+        # Monthly
+        'M2SL': 3 * 24 * 3600,
+        'TOTALSL': 3 * 24 * 3600,
+    }
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         schema: Optional[DataSchema] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize FRED loader.
@@ -108,11 +194,12 @@ class FREDLoader(DataLoader):
         Args:
             api_key: FRED API key (optional, uses pandas-datareader if not provided)
             schema: Data schema configuration
+            rate_limiter: Rate limiter override (default: shared FRED limiter)
+            cache_dir: Directory persisting loaded series across restarts
         """
-        super().__init__(schema)
+        super().__init__(schema, rate_limiter or get_fred_rate_limiter(), cache_dir)
         self.api_key = api_key
         self._fred = None
-        self._rate_limiter = get_fred_rate_limiter()
         self._backoff = ExponentialBackoff(
             initial_delay=1.0,
             max_delay=60.0,
@@ -139,58 +226,62 @@ class FREDLoader(DataLoader):
         Returns:
             DataFrame with columns: date, value, indicator
         """
-        if end_date is None:
-            end_date = datetime.now()
-        if start_date is None:
-            start_date = end_date - timedelta(days=365 * 5)
-        
-        # Check cache
+        df = self._load_raw(ticker, start_date, end_date)
+        # Only values can have gaps (dates come from the index, the indicator
+        # is broadcast), so fill that column alone: handle_missing_values(method='ffill')
+        return df.assign(value=df['value'].ffill().bfill())
+    
+    def _load_for_combine(
+        self,
+        ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Raw frames for load_multiple; gaps are filled once on the combined frame."""
+        return self._load_raw(ticker, start_date, end_date)
+    
+    def _clean_combined(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fill gaps within each indicator of the combined frame."""
+        return self.handle_missing_values_grouped(df)
+    
+    def _load_raw(
+        self,
+        ticker: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Fetch (or read from cache) a series without filling missing values."""
+        # Check cache (keyed on the requested window, before defaults resolve)
         cache_key = self._get_cache_key(ticker, start_date, end_date)
         cached = self._get_from_cache(cache_key)
         if cached is not None:
             return cached
         
-        # Acquire rate limit before making API call
-        if not self._rate_limiter.acquire():
-            raise RuntimeError(f"FRED rate limit timeout for {ticker}")
+        if end_date is None:
+            end_date = datetime.now()
+        if start_date is None:
+            start_date = end_date - timedelta(days=365 * 5)
         
         # Try fredapi first, then pandas-datareader
-        series_data = None
-        last_error = None
-        
+        fetchers = []
         if self._fred is not None:
-            try:
-                series_data = self._fred.get_series(
-                    ticker,
-                    observation_start=start_date,
-                    observation_end=end_date,
-                )
-                self._backoff.record_success()
-            except Exception as e:
-                last_error = e
-                if _is_non_retryable_fred_error(e):
-                    raise RuntimeError(
-                        f"Invalid or unavailable FRED series '{ticker}': {e}"
-                    ) from e
-                wait_time = self._backoff.record_failure()
-                if wait_time > 0:
-                    import time
-                    time.sleep(wait_time)
-                print(f"fredapi failed for {ticker}: {e}")
+            fetchers.append(('fredapi', self._fetch_with_retry))
+        if PDR_AVAILABLE:
+            fetchers.append(('pandas-datareader', self._fetch_pdr))
+        if not fetchers:
+            raise RuntimeError(
+                f"Cannot load {ticker}: neither fredapi nor pandas-datareader available"
+            )
         
-        if series_data is None and PDR_AVAILABLE:
+        series_data = None
+        last_error = None
+        wait_time = 0.0
+        for source, fetch in fetchers:
+            # One rate limit slot per attempted request
+            if not self._rate_limiter.acquire():
+                raise RuntimeError(f"FRED rate limit timeout for {ticker}")
             try:
-                # Additional rate limit acquire for fallback
-                if not self._rate_limiter.acquire():
-                    raise RuntimeError(f"FRED rate limit timeout for {ticker}")
-                
-                series_data = pdr.DataReader(
-                    ticker,
-                    'fred',
-                    start=start_date,
-                    end=end_date,
-                )[ticker]
-                self._backoff.record_success()
+                series_data = fetch(ticker, start_date, end_date)
             except Exception as e:
                 last_error = e
                 if _is_non_retryable_fred_error(e):
@@ -198,34 +289,124 @@ class FREDLoader(DataLoader):
                         f"Invalid or unavailable FRED series '{ticker}': {e}"
                     ) from e
                 wait_time = self._backoff.record_failure()
-                if wait_time < 0:  # Max retries exceeded
-                    raise RuntimeError(f"Failed to load {ticker} from FRED after retries: {e}")
-                raise RuntimeError(f"Failed to load {ticker} from FRED: {e}")
+                logger.warning("%s failed for %s: %s", source, ticker, e)
+                continue
+            self._backoff.record_success()
+            break
         
         if series_data is None:
-            raise RuntimeError(
-                f"Cannot load {ticker}: neither fredapi nor pandas-datareader available"
-            )
+            if wait_time < 0:  # Max retries exceeded
+                raise RuntimeError(
+                    f"Failed to load {ticker} from FRED after retries: {last_error}"
+                ) from last_error
+            raise RuntimeError(f"Failed to load {ticker} from FRED: {last_error}") from last_error
         
         # Convert to DataFrame with standard schema
         indicator_name = self.TICKER_NAMES.get(ticker, ticker)
         df = pd.DataFrame({
             'date': series_data.index,
-            'value': series_data.values,
-            'indicator': indicator_name,
-        })
-        
-        # Handle missing values
-        df = self.handle_missing_values(df, method='ffill')
+            'value': series_data.to_numpy(),
+            'indicator': self.indicator_column(indicator_name, len(series_data), self.INDICATOR_DTYPE),
+        }, copy=False)
         
         # Cache and return
-        self._set_cache(cache_key, df)
+        self._set_cache(cache_key, df, self._cache_ttl_seconds(ticker))
         return df
     
+    def _is_permanent_failure(self, error: Exception) -> bool:
+        """Invalid or discontinued series IDs fail the same way on every call."""
+        return _is_non_retryable_fred_error(error)
+    
+    def _fetch_with_retry(self, ticker: str, start_date: datetime, end_date: datetime) -> pd.Series:
+        """
+        _fetch_series with jittered exponential backoff on transient errors.
+        
+        The caller has already acquired the rate limiter for the first
+        attempt; each retry acquires it again.
+        """
+        backoff = ExponentialBackoff(
+            initial_delay=self.RETRY_INITIAL_DELAY,
+            max_delay=self.RETRY_MAX_DELAY,
+            max_retries=self.FETCH_ATTEMPTS - 1,
+            jitter=0.5,
+        )
+        while True:
+            try:
+                return self._fetch_series(ticker, start_date, end_date)
+            except Exception as e:
+                if not _is_transient_fred_error(e):
+                    raise
+                wait_time = backoff.record_failure()
+                if wait_time < 0:
+                    raise
+                retry_after = retry_after_seconds(e)
+                if retry_after is not None:
+                    wait_time = min(retry_after, self.RETRY_MAX_DELAY)
+                time.sleep(wait_time)
+                if not self._rate_limiter.acquire():
+                    raise RuntimeError(f"FRED rate limit timeout for {ticker}") from e
+    
+    def _fetch_pdr(self, ticker: str, start_date: datetime, end_date: datetime) -> pd.Series:
+        """Fetch a series through pandas-datareader on the shared HTTP session."""
+        return pdr.DataReader(
+            ticker,
+            'fred',
+            start=start_date,
+            end=end_date,
+            session=get_fred_session(),
+        )[ticker]
+    
+    def _fetch_series(self, ticker: str, start_date: datetime, end_date: datetime) -> pd.Series:
+        """
+        Fetch observations with the API key, reusing the shared HTTP session.
+        
+        Falls back to fredapi (one new connection per request) when requests
+        is unavailable. Missing observations ('.') become NaN either way.
+        """
+        session = get_fred_session()
+        if session is None:
+            return self._fred.get_series(
+                ticker,
+                observation_start=start_date,
+                observation_end=end_date,
+            )
+        
+        response = session.get(
+            FRED_OBSERVATIONS_URL,
+            params={
+                'series_id': ticker,
+                'api_key': self.api_key,
+                'file_type': 'json',
+                'observation_start': f"{start_date:%Y-%m-%d}",
+                'observation_end': f"{end_date:%Y-%m-%d}",
+            },
+            timeout=30,
+        )
+        if not response.ok:
+            try:
+                message = response.json().get('error_message', response.reason)
+            except ValueError:
+                message = response.reason
+            error = ValueError(f"{response.status_code} {message}")
+            if REQUESTS_AVAILABLE:
+                error = requests.HTTPError(f"{response.status_code} {message}", response=response)
+            raise error
+        
+        dates, values = [], []
+        for obs in response.json().get('observations', []):
+            dates.append(obs['date'])
+            values.append(obs['value'])
+        return pd.Series(
+            pd.to_numeric(values, errors='coerce'),
+            index=pd.to_datetime(dates, format='%Y-%m-%d'),
+            dtype='float64',
+        )
+    
     def load_all_minimum_set(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        timeout: Optional[float] = None,
     ) -> pd.DataFrame:
         """
         Load all minimum set FRED indicators including Fed balance sheet.
@@ -247,12 +428,13 @@ class FREDLoader(DataLoader):
             'T10YIE',          # Breakeven
         ]
 
-        return self.load_multiple(fred_tickers, start_date, end_date)
+        return self.load_multiple(fred_tickers, start_date, end_date, timeout)
 
     def load_fed_balance_sheet(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        timeout: Optional[float] = None,
     ) -> pd.DataFrame:
         """
         Load all Fed balance sheet indicators (FED_BALANCE_SHEET_INDICATORS).
@@ -262,6 +444,7 @@ class FREDLoader(DataLoader):
         Args:
             start_date: Start date (default: 5 years ago)
             end_date: End date (default: today)
+            timeout: Seconds to wait for all series (see load_multiple)
 
         Returns:
             Combined DataFrame in long format with all 6 Fed balance sheet indicators
@@ -275,7 +458,7 @@ class FREDLoader(DataLoader):
             'H41RESPPALDNNWW',  # Fed Lending (Net, all facilities)
         ]
 
-        return self.load_multiple(fed_balance_sheet_tickers, start_date, end_date)
+        return self.load_multiple(fed_balance_sheet_tickers, start_date, end_date, timeout)
     
     def is_available(self) -> bool:
         """Check if FRED data loading is available."""
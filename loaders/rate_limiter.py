@@ -8,17 +8,49 @@ import time
 import random
 import threading
 import logging
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Callable, Any
 from functools import wraps
-from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Seconds the server asked us to wait via a Retry-After header.
+    429 응답의 Retry-After 헤더에서 대기 시간 추출
+    
+    Args:
+        error: Exception that may carry an HTTP response (e.g. requests.HTTPError)
+        
+    Returns:
+        Non-negative wait in seconds, or None if no usable header is present
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    if value is None:
+        return None
+    
+    # Either delay-seconds or an HTTP-date
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class RateLimiter:
     """
-    Token bucket rate limiter for API calls.
+    Sliding-window rate limiter for API calls.
     Thread-safe rate limiting with configurable limits.
     
     분당/일당 호출 제한 및 호출 간 최소 대기 시간 적용
@@ -46,11 +78,14 @@ class RateLimiter:
         self.name = name
         
         # Thread safety
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         
-        # Tracking timestamps (using deque for efficient time-window cleanup)
-        self._minute_calls: deque = deque()
-        self._day_calls: deque = deque()
+        # Fixed-size rings of the last N call times on the time.monotonic()
+        # clock; the slot at the cursor holds the oldest of those N calls
+        self._minute_calls = [float('-inf')] * calls_per_minute
+        self._day_calls = [float('-inf')] * calls_per_day
+        self._minute_pos = 0
+        self._day_pos = 0
         self._last_call_time: Optional[float] = None
         
         # Statistics
@@ -69,18 +104,22 @@ class RateLimiter:
         Returns:
             True if acquired, False if timeout
         """
-        start_time = time.time()
+        start_time: Optional[float] = None
         
         while True:
+            # One clock read per attempt, shared by the check and the record
             with self._lock:
-                wait_time = self._calculate_wait_time()
+                now = time.monotonic()
+                wait_time = self._calculate_wait_time(now)
                 
                 if wait_time <= 0:
-                    self._record_call()
+                    self._record_call(now)
                     return True
             
             # Check timeout
-            elapsed = time.time() - start_time
+            if start_time is None:
+                start_time = now
+            elapsed = now - start_time
             if elapsed + wait_time > timeout:
                 logger.warning(
                     f"[{self.name}] Rate limiter timeout after {elapsed:.1f}s"
@@ -88,7 +127,7 @@ class RateLimiter:
                 return False
             
             # Wait with some jitter to prevent thundering herd
-            actual_wait = wait_time + random.uniform(0, 0.1)
+            actual_wait = wait_time + random.random() * 0.1
             logger.debug(
                 f"[{self.name}] Rate limiting: waiting {actual_wait:.2f}s"
             )
@@ -96,63 +135,50 @@ class RateLimiter:
             self._total_wait_seconds += actual_wait
             time.sleep(actual_wait)
     
-    def _calculate_wait_time(self) -> float:
+    def _calculate_wait_time(self, now: float) -> float:
         """Calculate how long to wait before next call is allowed."""
-        now = time.time()
-        waits = []
+        wait = 0.0
         
         # Minimum interval check
         if self._last_call_time is not None:
-            elapsed = now - self._last_call_time
-            if elapsed < self.min_interval_seconds:
-                waits.append(self.min_interval_seconds - elapsed)
-        
-        # Clean up old timestamps and check limits
-        minute_ago = now - 60
-        day_ago = now - 86400
+            wait = max(wait, self.min_interval_seconds - (now - self._last_call_time))
         
-        # Clean minute window
-        while self._minute_calls and self._minute_calls[0] < minute_ago:
-            self._minute_calls.popleft()
+        # The Nth most recent call must have left the window before another
+        wait = max(wait, self._minute_calls[self._minute_pos] + 60 - now)
+        wait = max(wait, self._day_calls[self._day_pos] + 86400 - now)
         
-        # Clean day window
-        while self._day_calls and self._day_calls[0] < day_ago:
-            self._day_calls.popleft()
-        
-        # Check per-minute limit
-        if len(self._minute_calls) >= self.calls_per_minute:
-            oldest = self._minute_calls[0]
-            waits.append(oldest + 60 - now)
-        
-        # Check per-day limit
-        if len(self._day_calls) >= self.calls_per_day:
-            oldest = self._day_calls[0]
-            waits.append(oldest + 86400 - now)
-        
-        return max(waits) if waits else 0.0
+        return wait
     
-    def _record_call(self):
-        """Record a call timestamp."""
-        now = time.time()
-        self._minute_calls.append(now)
-        self._day_calls.append(now)
+    def _record_call(self, now: float):
+        """Overwrite the oldest slot of each ring with this call."""
+        self._minute_calls[self._minute_pos] = now
+        self._minute_pos = (self._minute_pos + 1) % self.calls_per_minute
+        self._day_calls[self._day_pos] = now
+        self._day_pos = (self._day_pos + 1) % self.calls_per_day
         self._last_call_time = now
         self._total_calls += 1
     
+    @staticmethod
+    def _count_since(ring: list, pos: int, cutoff: float) -> int:
+        """Count ring entries after cutoff (the ring is sorted from pos)."""
+        older_half = len(ring) - bisect_right(ring, cutoff, lo=pos)
+        newer_half = pos - bisect_right(ring, cutoff, hi=pos)
+        return older_half + newer_half
+    
     def get_stats(self) -> dict:
         """Get rate limiter statistics."""
         with self._lock:
-            now = time.time()
-            minute_ago = now - 60
-            
-            # Count recent calls
-            recent_calls = sum(1 for t in self._minute_calls if t > minute_ago)
+            now = time.monotonic()
             
             return {
                 "name": self.name,
                 "total_calls": self._total_calls,
-                "calls_last_minute": recent_calls,
-                "calls_today": len(self._day_calls),
+                "calls_last_minute": self._count_since(
+                    self._minute_calls, self._minute_pos, now - 60
+                ),
+                "calls_today": self._count_since(
+                    self._day_calls, self._day_pos, now - 86400
+                ),
                 "total_waits": self._total_waits,
                 "total_wait_seconds": round(self._total_wait_seconds, 2),
                 "limits": {
@@ -165,8 +191,10 @@ class RateLimiter:
     def reset(self):
         """Reset all tracking data."""
         with self._lock:
-            self._minute_calls.clear()
-            self._day_calls.clear()
+            self._minute_calls = [float('-inf')] * self.calls_per_minute
+            self._day_calls = [float('-inf')] * self.calls_per_day
+            self._minute_pos = 0
+            self._day_pos = 0
             self._last_call_time = None
             self._total_calls = 0
             self._total_waits = 0
@@ -221,7 +249,7 @@ class ExponentialBackoff:
         """
         with self._lock:
             self._consecutive_failures += 1
-            self._last_failure_time = time.time()
+            self._last_failure_time = time.monotonic()
             
             if self._consecutive_failures > self.max_retries:
                 logger.error(
@@ -238,7 +266,7 @@ class ExponentialBackoff:
             
             # Add jitter
             jitter_amount = delay * self.jitter
-            delay += random.uniform(-jitter_amount, jitter_amount)
+            delay += (2 * random.random() - 1) * jitter_amount
             
             logger.warning(
                 f"API failure #{self._consecutive_failures}. "
@@ -329,17 +357,28 @@ class ProtectedAPICall:
                 if not retry_on_exception:
                     raise
                 
-                # Check for rate limit error (HTTP 429)
-                error_str = str(e).lower()
-                is_rate_limit = (
-                    "429" in error_str or
-                    "too many" in error_str or
-                    "rate limit" in error_str
-                )
+                # Check for rate limit error (HTTP 429); message markers
+                # only for clients that raise without a response object
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status is not None:
+                    is_rate_limit = status == 429
+                else:
+                    error_str = str(e).lower()
+                    is_rate_limit = (
+                        "429" in error_str or
+                        "too many" in error_str or
+                        "rate limit" in error_str
+                    )
                 
                 if is_rate_limit:
-                    # Extra long wait for rate limit errors
-                    wait_time = self.backoff.record_failure() * 2
+                    wait_time = self.backoff.record_failure()
+                    retry_after = retry_after_seconds(e)
+                    if wait_time >= 0 and retry_after is not None:
+                        # Wait exactly as long as the server asked
+                        wait_time = min(retry_after, self.backoff.max_delay)
+                    else:
+                        # Extra long wait for rate limit errors
+                        wait_time *= 2
                 else:
                     wait_time = self.backoff.record_failure()
                 
@@ -4,13 +4,43 @@ Sample data generator for offline demo.
 
 네트워크 없이도 앱이 동작하도록 합성 데이터 생성
 """
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 import pandas as pd
 import numpy as np
+from scipy.signal import lfilter
 
 from .base import DataLoader, DataSchema
 
+# Shared category set for every sample indicator column
+SAMPLE_INDICATOR_DTYPE = pd.CategoricalDtype(sorted([
+    'Fed Total Assets',
+    'Bank Credit',
+    'M2',
+    'HY Spread',
+    'IG Spread',
+    'VIX',
+    'S&P 500',
+    'Real Yield 10Y',
+    'Breakeven 10Y',
+    'Forward EPS',
+    'PE Ratio',
+    'Reserve Balances',
+    'Reverse Repo',
+    'TGA Balance',
+    'Fed Lending',
+]))
+
+
+def _sample_frame(dates, values: np.ndarray, name: str) -> pd.DataFrame:
+    """Standard-schema frame: categorical indicator, values as DataSchema.dtype_value."""
+    return pd.DataFrame({
+        'date': dates,
+        'value': values.astype(DataSchema.dtype_value),
+        'indicator': DataLoader.indicator_column(name, len(values), SAMPLE_INDICATOR_DTYPE),
+    }, copy=False)
+
 
 def generate_sample_data(
     start_date: Optional[datetime] = None,
@@ -34,16 +64,18 @@ def generate_sample_data(
     Returns:
         Dict mapping indicator names to DataFrames
     """
-    np.random.seed(seed)
-    
     if end_date is None:
         end_date = datetime.now()
     if start_date is None:
         start_date = end_date - timedelta(days=365 * 5)
     
     # Generate date range (weekly for most, daily for VIX/S&P)
-    dates_weekly = pd.date_range(start=start_date, end=end_date, freq='W')
-    dates_daily = pd.date_range(start=start_date, end=end_date, freq='B')
+    # Same dates as freq='W' (Sundays) / freq='B', selected from one calendar
+    # range: anchored offsets are generated one Python step at a time
+    calendar = pd.date_range(start=start_date, end=end_date, freq='D')
+    weekday = calendar.dayofweek
+    dates_weekly = calendar[weekday == 6]
+    dates_daily = calendar[weekday < 5]
     
     n_weekly = len(dates_weekly)
     n_daily = len(dates_daily)
@@ -51,6 +83,17 @@ def generate_sample_data(
     # Time indices normalized to [0, 1]
     t_weekly = np.linspace(0, 1, n_weekly)
     t_daily = np.linspace(0, 1, n_daily)
+    # Late-cycle ramp (0 until t=0.6, then linear), shared by M2 and RRP
+    late_ramp = np.maximum(t_weekly - 0.6, 0)
+    
+    # One row of noise per series, in the order used below. Each row comes from
+    # its own child of SeedSequence(seed), so it depends only on the seed and its
+    # row, not on the other series or the window length (the global np.random
+    # state is never touched). Random walks fold their step scale in before a
+    # single cumsum pass.
+    streams = np.random.SeedSequence(seed).spawn(14)
+    weekly_noise = np.stack([np.random.default_rng(s).standard_normal(n_weekly) for s in streams[:12]])
+    daily_noise = np.stack([np.random.default_rng(s).standard_normal(n_daily) for s in streams[12:]])
     
     # ---------------------------------------------------------------------
     # Generate synthetic indicators
@@ -59,135 +102,89 @@ def generate_sample_data(
     data = {}
     
     # Fed Total Assets (trillions) - expansion then plateau
-    fed_trend = 4.0 + 4.0 * (1 - np.exp(-3 * t_weekly)) + np.random.normal(0, 0.1, n_weekly).cumsum() * 0.01
-    fed_trend = np.maximum(fed_trend, 4.0)  # Floor at 4T
-    data['Fed Total Assets'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': fed_trend * 1e12,  # In dollars
-        'indicator': 'Fed Total Assets',
-    })
+    fed_trend = 4.0 + 4.0 * (1 - np.exp(-3 * t_weekly)) + np.cumsum(0.001 * weekly_noise[0])
+    np.maximum(fed_trend, 4.0, out=fed_trend)  # Floor at 4T
+    data['Fed Total Assets'] = _sample_frame(dates_weekly, fed_trend * 1e12, 'Fed Total Assets')  # In dollars
     
     # Bank Credit (trillions) - follows Fed with lag
     bank_trend = 10.0 + 2.0 * t_weekly + 0.5 * np.sin(2 * np.pi * t_weekly * 2)
-    bank_trend += np.random.normal(0, 0.05, n_weekly).cumsum() * 0.01
-    data['Bank Credit'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': bank_trend * 1e12,
-        'indicator': 'Bank Credit',
-    })
+    bank_trend += np.cumsum(0.0005 * weekly_noise[1])
+    data['Bank Credit'] = _sample_frame(dates_weekly, bank_trend * 1e12, 'Bank Credit')
     
     # M2 (trillions) - massive expansion 2020, then flat/decline
-    m2_trend = 15.0 + 6.0 * (1 - np.exp(-5 * t_weekly)) - 0.5 * np.maximum(t_weekly - 0.6, 0)
-    m2_trend += np.random.normal(0, 0.02, n_weekly).cumsum() * 0.01
-    data['M2'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': m2_trend * 1e12,
-        'indicator': 'M2',
-    })
+    m2_trend = 15.0 + 6.0 * (1 - np.exp(-5 * t_weekly)) - 0.5 * late_ramp
+    m2_trend += np.cumsum(0.0002 * weekly_noise[2])
+    data['M2'] = _sample_frame(dates_weekly, m2_trend * 1e12, 'M2')
     
     # HY Spread (bps) - low in expansion, spikes in stress
     hy_base = 400 - 100 * t_weekly + 200 * np.maximum(t_weekly - 0.4, 0) ** 2
     # Add stress spikes
     hy_spikes = np.zeros(n_weekly)
     spike_idx = [int(n_weekly * 0.15), int(n_weekly * 0.5), int(n_weekly * 0.85)]
+    hy_decay = np.exp(-np.arange(8) * 0.3) * 200  # One kernel, sliced per spike
     for idx in spike_idx:
         if idx < n_weekly:
             spike_len = min(8, n_weekly - idx)
-            hy_spikes[idx:idx+spike_len] = np.exp(-np.arange(spike_len) * 0.3) * 200
-    hy_spread = hy_base + hy_spikes + np.random.normal(0, 20, n_weekly)
-    hy_spread = np.clip(hy_spread, 200, 1000)
-    data['HY Spread'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': hy_spread / 100,  # As percentage
-        'indicator': 'HY Spread',
-    })
+            hy_spikes[idx:idx+spike_len] = hy_decay[:spike_len]
+    hy_spread = hy_base + hy_spikes + 20 * weekly_noise[3]
+    np.clip(hy_spread, 200, 1000, out=hy_spread)
+    data['HY Spread'] = _sample_frame(dates_weekly, hy_spread / 100, 'HY Spread')  # As percentage
     
     # IG Spread (bps) - similar pattern but lower magnitude
-    ig_spread = hy_spread * 0.3 + np.random.normal(0, 5, n_weekly)
-    ig_spread = np.clip(ig_spread, 50, 300)
-    data['IG Spread'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': ig_spread / 100,
-        'indicator': 'IG Spread',
-    })
+    ig_spread = hy_spread * 0.3 + 5 * weekly_noise[4]
+    np.clip(ig_spread, 50, 300, out=ig_spread)
+    data['IG Spread'] = _sample_frame(dates_weekly, ig_spread / 100, 'IG Spread')
     
     # VIX - daily, mean-reverting with spikes
-    vix = np.zeros(n_daily)
+    # AR(1) recurrence vix[i] = 0.9 * vix[i-1] + 1.8 + eps[i], run as an IIR filter
+    vix = np.empty(n_daily)
     vix[0] = 18
-    for i in range(1, n_daily):
-        vix[i] = vix[i-1] + 0.1 * (18 - vix[i-1]) + np.random.normal(0, 1.5)
+    vix[1:] = lfilter([1.0], [1.0, -0.9], 1.8 + 1.5 * daily_noise[0, 1:], zi=[0.9 * 18])[0]
     # Add stress spikes
     spike_days = [int(n_daily * 0.15), int(n_daily * 0.5), int(n_daily * 0.85)]
+    vix_decay = np.exp(-np.arange(20) * 0.1) * 25
     for idx in spike_days:
         if idx < n_daily:
             spike_len = min(20, n_daily - idx)
-            vix[idx:idx+spike_len] += np.exp(-np.arange(spike_len) * 0.1) * 25
-    vix = np.clip(vix, 10, 80)
-    data['VIX'] = pd.DataFrame({
-        'date': dates_daily,
-        'value': vix,
-        'indicator': 'VIX',
-    })
+            vix[idx:idx+spike_len] += vix_decay[:spike_len]
+    np.clip(vix, 10, 80, out=vix)
+    data['VIX'] = _sample_frame(dates_daily, vix, 'VIX')
     
     # S&P 500 - upward trend with corrections
-    sp500_returns = np.random.normal(0.0003, 0.01, n_daily)
+    sp500_returns = 0.0003 + 0.01 * daily_noise[1]
     # Add corrections
     correction_starts = [int(n_daily * 0.15), int(n_daily * 0.5)]
+    correction_decay = 0.008 * np.exp(-np.arange(40) * 0.05)
     for idx in correction_starts:
         if idx < n_daily:
             corr_len = min(40, n_daily - idx)
-            sp500_returns[idx:idx+corr_len] -= 0.008 * np.exp(-np.arange(corr_len) * 0.05)
+            sp500_returns[idx:idx+corr_len] -= correction_decay[:corr_len]
     sp500 = 3000 * np.exp(np.cumsum(sp500_returns) + 0.08 * t_daily)  # 8% trend
-    data['S&P 500'] = pd.DataFrame({
-        'date': dates_daily,
-        'value': sp500,
-        'indicator': 'S&P 500',
-    })
+    data['S&P 500'] = _sample_frame(dates_daily, sp500, 'S&P 500')
     
     # Real Yield 10Y (%) - negative in 2020-21, rising 2022+
-    real_yield = -1.0 + 2.5 * (t_weekly - 0.3) ** 2 + np.random.normal(0, 0.1, n_weekly)
-    real_yield = np.clip(real_yield, -1.5, 2.5)
-    data['Real Yield 10Y'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': real_yield,
-        'indicator': 'Real Yield 10Y',
-    })
+    real_yield = -1.0 + 2.5 * (t_weekly - 0.3) ** 2 + 0.1 * weekly_noise[5]
+    np.clip(real_yield, -1.5, 2.5, out=real_yield)
+    data['Real Yield 10Y'] = _sample_frame(dates_weekly, real_yield, 'Real Yield 10Y')
     
     # Breakeven 10Y (%) - inflation expectations
-    breakeven = 2.0 + 0.5 * np.sin(4 * np.pi * t_weekly) + np.random.normal(0, 0.1, n_weekly)
-    breakeven = np.clip(breakeven, 1.0, 3.5)
-    data['Breakeven 10Y'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': breakeven,
-        'indicator': 'Breakeven 10Y',
-    })
+    breakeven = 2.0 + 0.5 * np.sin(4 * np.pi * t_weekly) + 0.1 * weekly_noise[6]
+    np.clip(breakeven, 1.0, 3.5, out=breakeven)
+    data['Breakeven 10Y'] = _sample_frame(dates_weekly, breakeven, 'Breakeven 10Y')
     
     # Forward EPS (S&P 500) - lagging indicator
     eps_trend = 180 + 30 * t_weekly + 10 * np.sin(2 * np.pi * t_weekly)
-    eps_trend += np.random.normal(0, 2, n_weekly).cumsum() * 0.05
-    data['Forward EPS'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': eps_trend,
-        'indicator': 'Forward EPS',
-    })
+    eps_trend += np.cumsum(0.1 * weekly_noise[7])
+    data['Forward EPS'] = _sample_frame(dates_weekly, eps_trend, 'Forward EPS')
     
     # P/E Ratio - derived but could be standalone
     # Match weekly dates with closest S&P price
-    sp500_weekly = sp500[::5][:n_weekly]  # Approximate weekly
-    if len(sp500_weekly) > len(eps_trend):
-        sp500_weekly = sp500_weekly[:len(eps_trend)]
-    elif len(sp500_weekly) < len(eps_trend):
-        eps_trend = eps_trend[:len(sp500_weekly)]
-        dates_pe = dates_weekly[:len(sp500_weekly)]
-    else:
-        dates_pe = dates_weekly
+    sp500_weekly = sp500[::5]  # Approximate weekly (strided view)
+    n_pe = min(len(sp500_weekly), n_weekly)
+    dates_pe = dates_weekly[:n_pe]
 
-    pe_ratio = sp500_weekly / eps_trend
-    data['PE Ratio'] = pd.DataFrame({
-        'date': dates_pe,
-        'value': pe_ratio,
-        'indicator': 'PE Ratio',
-    })
+    pe_ratio = sp500_weekly[:n_pe] / eps_trend[:n_pe]
+    data['PE Ratio'] = _sample_frame(dates_pe, pe_ratio, 'PE Ratio')
 
     # =====================================================================
     # Fed Balance Sheet Indicators (new)
@@ -196,27 +193,19 @@ def generate_sample_data(
     # Reserve Balances (WRESBAL) - billions
     # Pattern: ~3500B in 2020, decline to ~3200B by 2025
     resbal_trend = 3500 - 300 * t_weekly + 50 * np.sin(2 * np.pi * t_weekly)
-    resbal_trend += np.random.normal(0, 10, n_weekly).cumsum() * 0.5
-    resbal_trend = np.clip(resbal_trend, 3000, 3800)
-    data['Reserve Balances'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': resbal_trend * 1e9,  # In dollars
-        'indicator': 'Reserve Balances',
-    })
+    resbal_trend += np.cumsum(5 * weekly_noise[8])
+    np.clip(resbal_trend, 3000, 3800, out=resbal_trend)
+    data['Reserve Balances'] = _sample_frame(dates_weekly, resbal_trend * 1e9, 'Reserve Balances')  # In dollars
 
     # Reverse Repo (RRPONTSYD) - billions
     # Pattern: Near 0 in 2020-2021, spike to 2300B in 2022-2023, decline to ~500B by 2025
     # Use logistic curve with spike
     rrp_base = 2300 / (1 + np.exp(-10 * (t_weekly - 0.4)))  # Logistic rise from 2020 to 2023
-    rrp_decline = np.maximum(0, 2300 - 1800 * np.maximum(t_weekly - 0.6, 0))  # Decline from 2023
-    rrp_combined = rrp_base * (1 - np.maximum(t_weekly - 0.6, 0)) + rrp_decline * np.maximum(t_weekly - 0.6, 0)
-    rrp_combined += np.random.normal(0, 20, n_weekly)
-    rrp_combined = np.clip(rrp_combined, 0, 2500)
-    data['Reverse Repo'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': rrp_combined * 1e9,  # In dollars
-        'indicator': 'Reverse Repo',
-    })
+    rrp_decline = np.maximum(0, 2300 - 1800 * late_ramp)  # Decline from 2023
+    rrp_combined = rrp_base * (1 - late_ramp) + rrp_decline * late_ramp
+    rrp_combined += 20 * weekly_noise[9]
+    np.clip(rrp_combined, 0, 2500, out=rrp_combined)
+    data['Reverse Repo'] = _sample_frame(dates_weekly, rrp_combined * 1e9, 'Reverse Repo')  # In dollars
 
     # TGA Balance (WTREGEN) - Treasury General Account - billions
     # Range 200B-800B with irregular patterns (government spending cycles)
@@ -224,37 +213,40 @@ def generate_sample_data(
     tga_base = 500 + 150 * np.sin(8 * np.pi * t_weekly)  # ~2 year cycle at 8*pi frequency
     tga_irregular = 100 * np.sin(12 * np.pi * t_weekly)  # Higher frequency noise
     tga_combined = tga_base + tga_irregular
-    tga_combined += np.random.normal(0, 15, n_weekly)
-    tga_combined = np.clip(tga_combined, 200, 800)
-    data['TGA Balance'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': tga_combined * 1e9,  # In dollars
-        'indicator': 'TGA Balance',
-    })
+    tga_combined += 15 * weekly_noise[10]
+    np.clip(tga_combined, 200, 800, out=tga_combined)
+    data['TGA Balance'] = _sample_frame(dates_weekly, tga_combined * 1e9, 'TGA Balance')  # In dollars
 
     # Fed Lending (WLCFLPCL) - billions
     # Pattern: Near 0 normally, spike to 150B during SVB crisis (March 2023), return to ~10B
     # March 2023 is roughly at t=0.35 (1.75 years into 5-year period)
     crisis_idx = int(n_weekly * 0.35)
-    fed_lending = np.ones(n_weekly) * 5  # Baseline ~5B
+    fed_lending = np.full(n_weekly, 5.0)  # Baseline ~5B
 
     # Add SVB crisis spike centered at March 2023
     crisis_width = 12  # ~12 weeks for crisis window
-    for i in range(max(0, crisis_idx - crisis_width), min(n_weekly, crisis_idx + 2*crisis_width)):
-        distance = abs(i - crisis_idx) / crisis_width
-        fed_lending[i] += 150 * np.exp(-2 * distance ** 2)  # Gaussian spike, peak 150B
+    window = np.arange(max(0, crisis_idx - crisis_width), min(n_weekly, crisis_idx + 2*crisis_width))
+    distance = (window - crisis_idx) / crisis_width
+    fed_lending[window] += 150 * np.exp(-2 * distance ** 2)  # Gaussian spike, peak 150B
 
-    fed_lending += np.random.normal(0, 2, n_weekly)
-    fed_lending = np.clip(fed_lending, 0, 160)
-    data['Fed Lending'] = pd.DataFrame({
-        'date': dates_weekly,
-        'value': fed_lending * 1e9,  # In dollars
-        'indicator': 'Fed Lending',
-    })
+    fed_lending += 2 * weekly_noise[11]
+    np.clip(fed_lending, 0, 160, out=fed_lending)
+    data['Fed Lending'] = _sample_frame(dates_weekly, fed_lending * 1e9, 'Fed Lending')  # In dollars
 
     return data
 
 
+@lru_cache(maxsize=4)
+def _cached_sample_data(seed: int, day: date) -> Dict[str, pd.DataFrame]:
+    """
+    Default-window sample data, generated once per (seed, day) per process.
+    
+    day only keys the cache so the window rolls forward daily; frames are
+    shared between loaders and must not be mutated in place.
+    """
+    return generate_sample_data(seed=seed)
+
+
 class SampleDataLoader(DataLoader):
     """
     Sample data loader for offline demo.
@@ -262,6 +254,8 @@ class SampleDataLoader(DataLoader):
     Uses synthetic data when real data sources are unavailable.
     """
     
+    INDICATOR_DTYPE = SAMPLE_INDICATOR_DTYPE
+    
     def __init__(
         self,
         schema: Optional[DataSchema] = None,
@@ -274,7 +268,7 @@ class SampleDataLoader(DataLoader):
     def _ensure_data_loaded(self) -> None:
         """Ensure sample data is generated."""
         if self._sample_data is None:
-            self._sample_data = generate_sample_data(seed=self.seed)
+            self._sample_data = dict(_cached_sample_data(self.seed, date.today()))
     
     def load(
         self,
@@ -318,15 +312,10 @@ class SampleDataLoader(DataLoader):
         if key not in self._sample_data:
             raise ValueError(f"Sample data not available for: {ticker}")
         
-        df = self._sample_data[key].copy()
-        
-        # Filter by date range
-        if start_date:
-            df = df[df['date'] >= pd.Timestamp(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.Timestamp(end_date)]
+        df = self._date_window(self._sample_data[key], *self._window_bounds(start_date, end_date))
         
-        return df.reset_index(drop=True)
+        # Slices of the 0-based RangeIndex only need renumbering if they start later
+        return df.reset_index(drop=True) if df.index.start != 0 else df
     
     def load_all(
         self,
@@ -341,16 +330,35 @@ class SampleDataLoader(DataLoader):
         """
         self._ensure_data_loaded()
         
-        dfs = []
-        for key, df in self._sample_data.items():
-            filtered = df.copy()
-            if start_date:
-                filtered = filtered[filtered['date'] >= pd.Timestamp(start_date)]
-            if end_date:
-                filtered = filtered[filtered['date'] <= pd.Timestamp(end_date)]
-            dfs.append(filtered)
+        bounds = self._window_bounds(start_date, end_date)
+        dfs = [self._date_window(df, *bounds) for df in self._sample_data.values()]
         
-        return pd.concat(dfs, ignore_index=True)
+        return self.concat_frames(dfs)
+    
+    @staticmethod
+    def _window_bounds(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """Convert the requested window to Timestamps once per call."""
+        return (
+            pd.Timestamp(start_date) if start_date else None,
+            pd.Timestamp(end_date) if end_date else None,
+        )
+    
+    @staticmethod
+    def _date_window(
+        df: pd.DataFrame,
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+    ) -> pd.DataFrame:
+        """Rows within [start, end]; sample dates are sorted, so binary search."""
+        dates = df['date']
+        lo = dates.searchsorted(start) if start is not None else 0
+        hi = dates.searchsorted(end, side='right') if end is not None else len(df)
+        window = df if lo == 0 and hi == len(df) else df.iloc[lo:hi]
+        # Never hand out the shared cached frame (or, without CoW, a view of it)
+        return DataLoader._detached_copy(window)
     
     def get_available_indicators(self) -> list:
         """Get list of available sample indicators."""
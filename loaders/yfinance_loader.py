@@ -4,8 +4,11 @@ yfinance 데이터 로더
 
 VIX, MOVE, S&P 500 등 시장 데이터 로딩
 """
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
+import numpy as np
 import pandas as pd
 
 try:
@@ -19,13 +22,17 @@ from .rate_limiter import RateLimiter, ExponentialBackoff, create_yfinance_limit
 
 # Module-level rate limiter (shared across instances)
 _yfinance_rate_limiter: Optional[RateLimiter] = None
+_yfinance_rate_limiter_lock = threading.Lock()
 
 
 def get_yfinance_rate_limiter() -> RateLimiter:
     """Get or create the yfinance rate limiter singleton."""
     global _yfinance_rate_limiter
     if _yfinance_rate_limiter is None:
-        _yfinance_rate_limiter = create_yfinance_limiter()
+        # Double-checked so concurrent first calls share one budget
+        with _yfinance_rate_limiter_lock:
+            if _yfinance_rate_limiter is None:
+                _yfinance_rate_limiter = create_yfinance_limiter()
     return _yfinance_rate_limiter
 
 
@@ -58,10 +65,21 @@ class YFinanceLoader(DataLoader):
         '^TNX': '10Y Yield',
     }
     
-    def __init__(self, schema: Optional[DataSchema] = None):
+    # Shared indicator categories (sorted, as concat_frames orders them)
+    INDICATOR_DTYPE = pd.CategoricalDtype(sorted(set(TICKER_NAMES.values())))
+    
+    # yf.download keeps per-call results in module-level state, so
+    # concurrent downloads can mix tickers; load them one at a time
+    max_workers: int = 1
+    
+    def __init__(
+        self,
+        schema: Optional[DataSchema] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize yfinance loader with rate limiting."""
-        super().__init__(schema)
-        self._rate_limiter = get_yfinance_rate_limiter()
+        super().__init__(schema, rate_limiter or get_yfinance_rate_limiter(), cache_dir)
         self._backoff = ExponentialBackoff(
             initial_delay=2.0,    # yfinance needs longer initial delay
             max_delay=120.0,      # Longer max delay for IP ban recovery
@@ -93,17 +111,17 @@ class YFinanceLoader(DataLoader):
         if not YFINANCE_AVAILABLE:
             raise RuntimeError("yfinance not available")
         
-        if end_date is None:
-            end_date = datetime.now()
-        if start_date is None:
-            start_date = end_date - timedelta(days=365 * 5)
-        
-        # Check cache
+        # Check cache (keyed on the requested window, before defaults resolve)
         cache_key = self._get_cache_key(ticker, start_date, end_date)
         cached = self._get_from_cache(cache_key)
         if cached is not None:
             return cached
         
+        if end_date is None:
+            end_date = datetime.now()
+        if start_date is None:
+            start_date = end_date - timedelta(days=365 * 5)
+        
         # Acquire rate limit before making API call
         if not self._rate_limiter.acquire():
             raise RuntimeError(f"yfinance rate limit timeout for {ticker}")
@@ -140,21 +158,20 @@ class YFinanceLoader(DataLoader):
             df = pd.DataFrame({
                 'date': values.index,
                 'value': values.values,
-                'indicator': indicator_name,
-            })
+                'indicator': self.indicator_column(indicator_name, len(values), self.INDICATOR_DTYPE),
+            }, copy=False)
             
             # Handle missing values
             df = self.handle_missing_values(df, method='ffill')
             
             # Cache and return
-            self._set_cache(cache_key, df)
+            self._set_cache(cache_key, df, self._cache_ttl_seconds(ticker))
             return df
             
         except Exception as e:
             # Record failure and apply backoff
             wait_time = self._backoff.record_failure()
             if wait_time > 0:
-                import time
                 time.sleep(wait_time)
             raise RuntimeError(f"Failed to load {ticker} from yfinance: {e}")
     
@@ -162,6 +179,7 @@ class YFinanceLoader(DataLoader):
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        timeout: Optional[float] = None,
     ) -> pd.DataFrame:
         """
         Load all minimum set yfinance indicators.
@@ -181,7 +199,7 @@ class YFinanceLoader(DataLoader):
             '^TNX',   # 10-Year Treasury Yield
         ]
         
-        return self.load_multiple(yf_tickers, start_date, end_date)
+        return self.load_multiple(yf_tickers, start_date, end_date, timeout)
     
     def load_with_returns(
         self,
@@ -203,12 +221,24 @@ class YFinanceLoader(DataLoader):
         # Sort by date
         df = df.sort_values('date').reset_index(drop=True)
         
-        # Calculate returns
-        df['return_1d'] = df['value'].pct_change(1) * 100
-        df['return_1w'] = df['value'].pct_change(5) * 100
-        df['return_1m'] = df['value'].pct_change(21) * 100
-        
-        return df
+        # Calculate returns (percent), added in one assign
+        values = df['value'].to_numpy(dtype=np.float64)
+        return df.assign(
+            return_1d=self._pct_change(values, 1),
+            return_1w=self._pct_change(values, 5),
+            return_1m=self._pct_change(values, 21),
+        )
+    
+    @staticmethod
+    def _pct_change(values: np.ndarray, periods: int) -> np.ndarray:
+        """Percent change over `periods` rows (NaN-led), matching Series.pct_change * 100."""
+        out = np.full(len(values), np.nan)
+        if periods < len(values):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(values[periods:], values[:-periods], out=out[periods:])
+            out[periods:] -= 1.0
+            out[periods:] *= 100
+        return out
     
     def is_available(self) -> bool:
         """Check if yfinance is available."""
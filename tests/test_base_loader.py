@@ -0,0 +1,79 @@
+"""Tests for shared DataLoader frame helpers."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loaders.base import DataLoader
+from loaders.fred_loader import FREDLoader
+
+
+def test_shared_indicator_dtype_concat_matches_category_union():
+    def frame(name, shared):
+        dtype = FREDLoader.INDICATOR_DTYPE if shared else None
+        return pd.DataFrame({'value': [1.0, 2.0], 'indicator': DataLoader.indicator_column(name, 2, dtype)})
+
+    names = ['SOFR', 'Fed Total Assets', 'M2']
+    shared = DataLoader.concat_frames([frame(name, True) for name in names])
+    unioned = DataLoader.concat_frames([frame(name, False) for name in names])
+
+    pd.testing.assert_frame_equal(shared, unioned)
+    assert DataLoader.indicator_column('UNLISTED', 2, FREDLoader.INDICATOR_DTYPE).categories.tolist() == ['UNLISTED']
+
+
+def test_indicator_column_is_categorical_and_survives_concat():
+    dates = pd.date_range('2024-01-01', periods=3, freq='D')
+    frames = [
+        DataLoader.standardize_output(pd.DataFrame({'date': dates, 'value': [1.0, 2.0, 3.0]}), name)
+        for name in ['VIX', 'HY Spread']
+    ]
+
+    combined = DataLoader.concat_frames(frames)
+
+    assert isinstance(frames[0]['indicator'].dtype, pd.CategoricalDtype)
+    assert list(combined['indicator'].cat.categories) == ['HY Spread', 'VIX']
+    assert combined['indicator'].tolist() == ['VIX'] * 3 + ['HY Spread'] * 3
+
+
+def test_concat_frames_array_path_matches_pandas_concat():
+    dates = pd.date_range('2024-01-01', periods=3, freq='D')
+    first = pd.DataFrame({'date': dates, 'value': [1.0, 2.0, 3.0], 'indicator': pd.Categorical(['b', None, 'b'])})
+    second = pd.DataFrame({'date': dates[:2], 'value': [4.0, 5.0], 'indicator': DataLoader.indicator_column('a', 2)})
+
+    result = DataLoader.concat_frames([first, second])
+    expected = pd.concat(
+        [df.assign(indicator=df['indicator'].astype(pd.CategoricalDtype(['a', 'b']))) for df in (first, second)],
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+
+    mixed = DataLoader.concat_frames([first, second.assign(value=second['value'].astype('float32'))])
+    assert mixed['indicator'].cat.categories.tolist() == ['a', 'b']
+    assert mixed['value'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_grouped_missing_values_match_per_indicator_cleaning():
+    frames = [
+        pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=5, freq='D'),
+            'value': values,
+            'indicator': DataLoader.indicator_column(name, 5),
+        })
+        for name, values in [
+            ('A', [np.nan, 1.0, np.nan, 50.0, 3.0]),
+            ('B', [np.nan, np.nan, 7.0, np.nan, -40.0]),
+        ]
+    ]
+
+    for percentile in (0.0, 0.25):
+        expected = DataLoader.concat_frames([
+            DataLoader.handle_missing_values(df, winsorize_percentile=percentile) for df in frames
+        ])
+        result = DataLoader.handle_missing_values_grouped(
+            DataLoader.concat_frames(frames), winsorize_percentile=percentile
+        )
+        pd.testing.assert_frame_equal(result, expected)
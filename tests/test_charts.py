@@ -6,7 +6,15 @@ import pandas as pd
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from components.charts import filter_dataframe_by_timeframe, filter_series_by_timeframe
+from components.charts import (
+    MAX_TRACE_POINTS,
+    TRACE_DTYPE,
+    add_horizontal_bands,
+    create_multi_line_chart,
+    create_timeseries_chart,
+    filter_dataframe_by_timeframe,
+    filter_series_by_timeframe,
+)
 
 
 def test_filter_series_by_explicit_timeframe_keeps_recent_window():
@@ -29,3 +37,59 @@ def test_filter_dataframe_by_explicit_timeframe_keeps_recent_window():
     assert filtered['date'].max() == df['date'].max()
     assert filtered['date'].min() >= df['date'].max() - pd.DateOffset(months=6)
     assert len(filtered) < len(df)
+
+
+def test_multi_line_chart_thins_long_series_but_keeps_latest_point():
+    dates = pd.bdate_range('2005-01-03', periods=5000)
+    series = pd.Series(range(len(dates)), index=dates, dtype=float)
+
+    fig = create_multi_line_chart({'Long': series}, timeframe='Full')
+
+    trace = fig.data[0]
+    assert len(trace.x) <= MAX_TRACE_POINTS
+    assert pd.Timestamp(trace.x[-1]) == dates[-1]
+    assert trace.y[-1] == series.iloc[-1]
+    assert trace.y.dtype == TRACE_DTYPE
+
+
+def test_cached_multi_line_chart_reuses_figure_for_identical_data():
+    from components.charts_cached import cached_multi_line_chart
+
+    dates = pd.date_range('2022-01-02', periods=120, freq='W')
+    series = pd.Series(range(len(dates)), index=dates, dtype=float)
+
+    first = cached_multi_line_chart({'A': series}, title='cached', timeframe='Full')
+    again = cached_multi_line_chart({'A': series.copy()}, title='cached', timeframe='Full')
+    changed = cached_multi_line_chart({'A': series + 1}, title='cached', timeframe='Full')
+
+    assert again is first
+    assert changed is not first
+
+
+def test_timeseries_chart_accepts_series_like_date_value_frame():
+    dates = pd.date_range('2023-01-01', periods=200, freq='D')
+    series = pd.Series(range(len(dates)), index=dates, dtype=float)
+    frame = pd.DataFrame({'date': dates, 'value': series.values})
+
+    from_series = create_timeseries_chart(series, title='S', timeframe='Full', show_trend=True)
+    from_frame = create_timeseries_chart(frame, title='S', timeframe='Full', show_trend=True)
+
+    assert from_series.to_json() == from_frame.to_json()
+
+
+def test_horizontal_bands_match_add_hrect():
+    series = pd.Series(range(100), index=pd.date_range('2024-01-01', periods=100, freq='D'))
+    bands = [
+        {'y0': 0, 'y1': 50, 'fillcolor': 'rgba(34, 197, 94, 0.1)', 'line_color': 'green', 'line_width': 1, 'label': 'Low'},
+        {'y0': 50, 'y1': 100, 'fillcolor': 'rgba(239, 68, 68, 0.1)', 'label': 'High'},
+    ]
+
+    expected = create_timeseries_chart(series, timeframe='Full')
+    expected.add_hrect(y0=0, y1=50, fillcolor=bands[0]['fillcolor'], layer='below', line_width=1,
+                       line_color='green', annotation_text='Low', annotation_position='right')
+    expected.add_hrect(y0=50, y1=100, fillcolor=bands[1]['fillcolor'], layer='below',
+                       annotation_text='High', annotation_position='right')
+    fig = create_timeseries_chart(series, timeframe='Full')
+    add_horizontal_bands(fig, bands)
+
+    assert fig.to_plotly_json()['layout'] == expected.to_plotly_json()['layout']
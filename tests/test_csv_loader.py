@@ -74,3 +74,47 @@ def test_handle_missing_values_still_supports_opt_in_winsorization():
     cleaned = DataLoader.handle_missing_values(df, winsorize_percentile=0.2)
 
     assert cleaned['value'].max() < 1000.0
+
+
+def test_detect_date_column_skips_numeric_and_non_date_text():
+    loader = CSVLoader()
+    df = pd.DataFrame({
+        'amount': [1.0, 2.0, 3.0],
+        'label': ['a', 'b', 'c'],
+        'asof': ['2024-01-05', '2024-01-12', '2024-01-19'],
+        'us_date': ['01/26/2024', '02/02/2024', '02/09/2024'],
+    })
+
+    assert loader._detect_date_column(df) == 'asof'
+    assert loader._detect_date_column(df.drop(columns='asof')) == 'us_date'
+    assert loader._detect_date_column(df.assign(ts=pd.to_datetime(df['asof']))) == 'ts'
+
+
+def test_load_from_upload_reads_only_detected_columns():
+    loader = CSVLoader()
+    uploaded_file = FakeUploadedFile(
+        "메모,Date,open,Close\n가,2024-01-01,9.0,1.5\n나,2024-01-02,9.5,2.5\n".encode('utf-8')
+    )
+
+    raw = loader.read_upload_to_dataframe(uploaded_file)
+    result = loader.load_from_upload(uploaded_file, "Custom Metric")
+
+    assert raw.columns.tolist() == ['메모', 'Date', 'open', 'Close']
+    assert result['value'].tolist() == [1.5, 2.5]
+    assert result['date'].tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02')]
+
+
+def test_load_many_combines_files_with_different_headers(tmp_path):
+    first = tmp_path / "walcl.csv"
+    first.write_text("date,value\n2024-01-03,7.7\n2024-01-10,7.6\n", encoding='utf-8')
+    second = tmp_path / "spx.csv"
+    second.write_text("Date,Open,Close\n2024-01-02,1,4700.5\n", encoding='utf-8')
+
+    loader = CSVLoader()
+    result = loader.load_many([str(first), str(second)])
+    named = loader.load_many([str(second)], indicator_names=['S&P 500'])
+
+    assert result['indicator'].tolist() == ['walcl', 'walcl', 'spx']
+    assert result['value'].tolist() == pd.Series([7.7, 7.6, 4700.5], dtype='float32').tolist()
+    assert isinstance(result['indicator'].dtype, pd.CategoricalDtype)
+    assert named['indicator'].tolist() == ['S&P 500']
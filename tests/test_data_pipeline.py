@@ -6,6 +6,7 @@ import pandas as pd
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config import AppConfig
 from data_pipeline import get_regime_inputs, merge_indicator_frames, prepare_data_dict
 
 
@@ -66,3 +67,11 @@ def test_prepare_data_dict_adds_canonical_regime_aliases():
     assert data_dict['equity'] is data_dict['sp500']
     assert regime_inputs['credit_growth'] is data_dict['credit_growth']
     assert regime_inputs['spread'] is data_dict['spread']
+
+
+def test_loader_disk_cache_is_opt_in(monkeypatch):
+    monkeypatch.delenv('LIQUIDITY_CACHE_DIR', raising=False)
+    assert AppConfig().data_cache_dir is None
+
+    monkeypatch.setenv('LIQUIDITY_CACHE_DIR', '/var/cache/liquidity')
+    assert AppConfig().data_cache_dir == '/var/cache/liquidity'
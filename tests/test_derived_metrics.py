@@ -0,0 +1,63 @@
+"""Unit tests for derived Fed balance sheet metrics."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indicators.derived_metrics import (
+    MetricsContext,
+    calculate_fed_lending_stress,
+    classify_reserve_regime,
+    detect_money_market_stress,
+)
+
+
+def _weekly(values):
+    return pd.Series(values, index=pd.date_range('2021-01-03', periods=len(values), freq='W'))
+
+
+def test_rrp_acceleration_matches_double_diff():
+    rrp = _weekly(np.random.default_rng(0).uniform(0, 2000, 200))
+
+    result = detect_money_market_stress(rrp)
+
+    expected = rrp.diff(21).diff(21)
+    pd.testing.assert_series_equal(result['rrp_acceleration'], expected, check_names=False)
+
+
+def test_empty_inputs_return_empty_results():
+    result = detect_money_market_stress(None)
+
+    assert set(result) == {'rrp_level', 'stress_regime', 'stress_score', 'rrp_change_1m', 'rrp_acceleration'}
+    assert all(series.empty for series in result.values())
+
+
+def test_metrics_context_scales_data_dict_once():
+    data_dict = {
+        'reserve_balances': _weekly(np.full(60, 3.0e12)),
+        'reverse_repo': _weekly(np.full(60, 5.0e11)),
+    }
+
+    ctx = MetricsContext.from_data_dict(data_dict)
+
+    assert ctx.fed_lending is None
+    assert ctx.reserves.iloc[-1] == 3000.0
+    pd.testing.assert_series_equal(
+        classify_reserve_regime(ctx=ctx),
+        classify_reserve_regime(data_dict['reserve_balances'] / 1e9, data_dict['reverse_repo'] / 1e9),
+    )
+    assert calculate_fed_lending_stress(ctx=ctx)['lending_level'].empty
+
+
+def test_lending_percentile_counts_valid_values_at_or_below_latest():
+    lending = _weekly(np.random.default_rng(1).uniform(0, 100, 900).round())
+    lending.iloc[::9] = np.nan
+
+    result = calculate_fed_lending_stress(lending)['lending_percentile_3y']
+
+    window = lending.iloc[-756:].dropna()
+    assert result.iloc[-1] == (window <= lending.iloc[-1]).sum() / len(window) * 100
+    assert result.iloc[:377].isna().all()
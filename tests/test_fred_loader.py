@@ -1,4 +1,63 @@
-from loaders.fred_loader import _is_non_retryable_fred_error
+import math
+import threading
+import time
+from http import HTTPStatus
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import loaders.fred_loader as fred_module
+from loaders.fred_loader import FREDLoader, _is_non_retryable_fred_error
+
+
+MISSING_SERIES = {'error_message': 'Bad Request.  The series does not exist.'}
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.ok = status_code == 200
+        self.reason = HTTPStatus(status_code).phrase
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Serves queued (status, payload) replies per series_id; the last reply repeats."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        queue = self.replies[params['series_id']]
+        status, payload = queue.pop(0) if len(queue) > 1 else queue[0]
+        return FakeResponse(status, payload)
+
+
+def _loader_with_session(monkeypatch, replies):
+    """FREDLoader with an API key whose pooled session is a FakeSession."""
+    session = FakeSession(replies)
+    monkeypatch.setattr(fred_module, 'get_fred_session', lambda: session)
+    loader = FREDLoader()
+    loader.api_key = 'key'
+    return loader, session
+
+
+def _loader_with_load_raw(hook):
+    """FREDLoader whose _load_raw runs hook(ticker), then returns a one-row frame."""
+    loader = FREDLoader()
+
+    def fake_load(ticker, start_date=None, end_date=None):
+        hook(ticker)
+        return pd.DataFrame({'date': [pd.Timestamp('2024-01-05')], 'value': [1.0], 'indicator': [ticker]})
+
+    loader._load_raw = fake_load
+    return loader
 
 
 def test_is_non_retryable_fred_error_for_missing_series():
@@ -9,3 +68,217 @@ def test_is_non_retryable_fred_error_for_missing_series():
 def test_is_non_retryable_fred_error_for_transient_failure():
     error = Exception("Connection timed out")
     assert _is_non_retryable_fred_error(error) is False
+
+
+def test_load_multiple_fetches_concurrently_in_ticker_order():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def track_concurrency(ticker):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05 if ticker != 'WALCL' else 0.15)
+        with lock:
+            active[0] -= 1
+        if ticker == 'BAD':
+            raise RuntimeError('series does not exist')
+
+    loader = _loader_with_load_raw(track_concurrency)
+
+    result = loader.load_multiple(['WALCL', 'BAD', 'WRESBAL', 'M2SL'])
+
+    assert result['indicator'].tolist() == ['WALCL', 'WRESBAL', 'M2SL']
+    assert peak[0] > 1
+
+
+def test_disk_cache_survives_new_loader_and_expires(tmp_path):
+    df = pd.DataFrame({'date': [pd.Timestamp('2024-01-05')], 'value': [1.0], 'indicator': ['Fed Total Assets']})
+    loader = FREDLoader(cache_dir=str(tmp_path))
+    key = loader._get_cache_key('WALCL', pd.Timestamp('2020-01-01'), pd.Timestamp('2024-01-05 13:45'))
+    loader._set_cache(key, df, loader._cache_ttl_seconds('WALCL'))
+
+    assert loader._cache_ttl_seconds('WALCL') > loader._cache_ttl_seconds('SOFR')
+
+    restarted = FREDLoader(cache_dir=str(tmp_path))
+    same_day_key = restarted._get_cache_key('WALCL', pd.Timestamp('2020-01-01'), pd.Timestamp('2024-01-05 08:00'))
+    pd.testing.assert_frame_equal(restarted._get_from_cache(same_day_key), df)
+
+    restarted.clear_cache()
+    restarted._set_cache(key, df, ttl_seconds=-1)
+    assert FREDLoader(cache_dir=str(tmp_path))._get_from_cache(key) is None
+
+
+@pytest.mark.parametrize('copy_on_write', [True, False])
+def test_cache_hands_out_copies_that_cannot_corrupt_it(monkeypatch, copy_on_write):
+    monkeypatch.setattr('loaders.base._copy_on_write_enabled', lambda: copy_on_write)
+    loader = FREDLoader()
+    df = pd.DataFrame({'value': [1.0, 2.0]})
+    loader._set_cache(('A', None, None), df)
+
+    df.loc[0, 'value'] = -1.0
+    served = loader._get_from_cache(('A', None, None))
+    served.loc[1, 'value'] = -2.0
+
+    cached = loader._cache[('A', None, None)]
+    assert cached['value'].tolist() == [1.0, 2.0]
+    # Without Copy-on-Write nothing handed out may share the cached buffers
+    assert np.shares_memory(served['value'].to_numpy(), cached['value'].to_numpy()) is False
+    assert np.shares_memory(df['value'].to_numpy(), cached['value'].to_numpy()) is False
+
+
+def test_fetch_series_parses_json_over_shared_session(monkeypatch):
+    loader, session = _loader_with_session(monkeypatch, {
+        'WALCL': [(200, {'observations': [
+            {'date': '2024-01-03', 'value': '7700000'},
+            {'date': '2024-01-10', 'value': '.'},
+        ]})],
+        'NOPE': [(400, MISSING_SERIES)],
+    })
+
+    series = loader._fetch_series('WALCL', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-31'))
+
+    assert series.index.tolist() == [pd.Timestamp('2024-01-03'), pd.Timestamp('2024-01-10')]
+    assert series.iloc[0] == 7700000.0 and math.isnan(series.iloc[1])
+    assert session.calls[0]['observation_end'] == '2024-01-31'
+
+    with pytest.raises(Exception) as excinfo:
+        loader._fetch_series('NOPE', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-31'))
+    assert fred_module._is_non_retryable_fred_error(excinfo.value)
+
+
+def test_load_multiple_skips_only_permanently_failed_tickers():
+    calls = []
+
+    def fail_some(ticker):
+        calls.append(ticker)
+        if ticker == 'BAD':
+            raise RuntimeError("Invalid or unavailable FRED series 'BAD': series does not exist")
+        if ticker == 'FLAKY':
+            raise RuntimeError('FRED rate limit timeout for FLAKY')
+
+    loader = _loader_with_load_raw(fail_some)
+
+    loader.load_multiple(['BAD', 'FLAKY', 'M2SL'])
+    calls.clear()
+    result = loader.load_multiple(['BAD', 'FLAKY', 'M2SL'])
+
+    assert sorted(calls) == ['FLAKY', 'M2SL']
+    assert result['indicator'].tolist() == ['M2SL']
+
+    loader.clear_cache()
+    calls.clear()
+    loader.load_multiple(['BAD'])
+    assert calls == ['BAD']
+
+
+def test_fetch_with_retry_retries_transient_http_errors_only(monkeypatch):
+    one_point = {'observations': [{'date': '2024-01-03', 'value': '1'}]}
+    loader, session = _loader_with_session(monkeypatch, {
+        'WALCL': [(503, MISSING_SERIES), (200, one_point)],
+        'NOPE': [(400, MISSING_SERIES), (200, one_point)],
+    })
+    sleeps = []
+    monkeypatch.setattr(fred_module.time, 'sleep', sleeps.append)
+
+    series = loader._fetch_with_retry('WALCL', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-31'))
+
+    assert series.tolist() == [1.0]
+    assert [params['series_id'] for params in session.calls] == ['WALCL', 'WALCL']
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= FREDLoader.RETRY_MAX_DELAY
+
+    with pytest.raises(Exception):
+        loader._fetch_with_retry('NOPE', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-31'))
+    assert [params['series_id'] for params in session.calls].count('NOPE') == 1
+
+
+def test_load_multiple_timeout_returns_finished_tickers():
+    release = threading.Event()
+
+    def stall_slow(ticker):
+        if ticker == 'SLOW':
+            release.wait(5)
+
+    loader = _loader_with_load_raw(stall_slow)
+
+    started = time.monotonic()
+    result = loader.load_multiple(['M2SL', 'SLOW', 'WALCL'], timeout=0.2)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert result['indicator'].tolist() == ['M2SL', 'WALCL']
+    assert elapsed < 2
+
+
+def test_default_window_cache_key_is_stable_across_days(tmp_path, monkeypatch):
+    fetches = []
+
+    def fake_fetch(self, ticker, start_date, end_date):
+        fetches.append((start_date.date(), end_date.date()))
+        return pd.Series([1.0], index=pd.to_datetime(['2024-01-03']))
+
+    monkeypatch.setattr(FREDLoader, '_fetch_with_retry', fake_fetch)
+    loader = FREDLoader(cache_dir=str(tmp_path))
+    loader._fred = object()
+
+    loader.load('M2SL')
+    assert loader._get_cache_key('M2SL', None, None) == ('M2SL', None, None)
+
+    # The key holds no dates, so a restart on any day reuses the entry until the TTL ends
+    restarted = FREDLoader(cache_dir=str(tmp_path))
+    restarted._fred = object()
+    restarted.load('M2SL')
+    restarted.load('M2SL', start_date=pd.Timestamp('2020-01-01'), end_date=pd.Timestamp('2024-01-31'))
+
+    assert len(fetches) == 2
+    assert fetches[1] == (pd.Timestamp('2020-01-01').date(), pd.Timestamp('2024-01-31').date())
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    loader = FREDLoader()
+    loader.max_cache_entries = 2
+    frame = pd.DataFrame({'value': [1.0]})
+
+    loader._set_cache(('A', None, None), frame)
+    loader._set_cache(('B', None, None), frame)
+    assert loader._get_from_cache(('A', None, None)) is not None
+    loader._set_cache(('C', None, None), frame)
+
+    assert list(loader._cache) == [('A', None, None), ('C', None, None)]
+    assert ('B', None, None) not in loader._cache_timestamps
+    assert loader._get_from_cache(('B', None, None)) is None
+
+
+def test_load_raw_acquires_once_per_attempted_fetcher(monkeypatch):
+    loader = FREDLoader()
+    loader._fred = object()
+    monkeypatch.setattr(fred_module, 'PDR_AVAILABLE', True)
+    acquired = []
+    monkeypatch.setattr(loader._rate_limiter, 'acquire', lambda: acquired.append(1) or True)
+
+    def failing_fredapi(ticker, start_date, end_date):
+        raise RuntimeError('Internal Server Error')
+
+    loader._fetch_with_retry = failing_fredapi
+    loader._fetch_pdr = lambda ticker, start_date, end_date: pd.Series(
+        [1.0, 2.0], index=pd.to_datetime(['2024-01-01', '2024-02-01'])
+    )
+
+    df = loader._load_raw('M2SL')
+
+    assert df['value'].tolist() == [1.0, 2.0]
+    assert len(acquired) == 2
+
+
+def test_cache_hits_are_isolated_from_caller_mutation():
+    loader = FREDLoader()
+    key = ('M2SL', None, None)
+    loader._set_cache(key, pd.DataFrame({'value': [1.0, 2.0]}))
+
+    hit = loader._get_from_cache(key)
+    hit.loc[0, 'value'] = 99.0
+    hit['extra'] = 1
+
+    again = loader._get_from_cache(key)
+    assert again['value'].tolist() == [1.0, 2.0]
+    assert list(again.columns) == ['value']
@@ -60,6 +60,51 @@ class TestRateLimiter:
         # Should have waited (at least some time)
         assert elapsed > 0.0
     
+    @staticmethod
+    def _acquire_times(monkeypatch, limiter, n_calls):
+        """Acquire n_calls on a simulated clock and return each grant time."""
+        clock = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+        limiter.reset()
+        
+        times = []
+        for _ in range(n_calls):
+            assert limiter.acquire(timeout=10 ** 9) is True
+            times.append(clock[0])
+        return times
+    
+    @pytest.mark.parametrize("per_minute, min_interval", [(60, 0.5), (5, 0.0)])
+    def test_per_minute_limit_holds_in_every_rolling_window(
+        self, monkeypatch, per_minute, min_interval
+    ):
+        """No 60s window may contain more than calls_per_minute grants."""
+        limiter = RateLimiter(
+            calls_per_minute=per_minute,
+            min_interval_seconds=min_interval,
+            name="TEST"
+        )
+        times = self._acquire_times(monkeypatch, limiter, per_minute * 4)
+        
+        # Any per_minute + 1 consecutive grants must span a full minute
+        spans = [b - a for a, b in zip(times, times[per_minute:])]
+        assert min(spans) >= 60
+        assert limiter.get_stats()["calls_last_minute"] <= per_minute
+    
+    def test_per_day_limit_holds_in_every_rolling_window(self, monkeypatch):
+        """No 24h window may contain more than calls_per_day grants."""
+        limiter = RateLimiter(
+            calls_per_minute=1000,
+            calls_per_day=20,
+            min_interval_seconds=0.0,
+            name="TEST"
+        )
+        times = self._acquire_times(monkeypatch, limiter, 60)
+        
+        spans = [b - a for a, b in zip(times, times[20:])]
+        assert min(spans) >= 86400
+        assert limiter.get_stats()["calls_today"] == 20
+    
     def test_stats(self):
         """Test statistics tracking."""
         limiter = RateLimiter(calls_per_minute=60, name="TEST")
@@ -180,6 +225,47 @@ class TestProtectedAPICall:
         
         result = protected.execute(mock_api, 5, y=15)
         assert result == 20
+    
+    def test_rate_limit_waits_for_retry_after_header(self, monkeypatch):
+        """Test that a 429 with Retry-After sleeps exactly the requested time."""
+        limiter = RateLimiter(calls_per_minute=60, min_interval_seconds=0.0, name="TEST")
+        protected = ProtectedAPICall(limiter, ExponentialBackoff(initial_delay=1.0, max_delay=30.0))
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        
+        class FakeResponse:
+            status_code = 429
+            headers = {'Retry-After': '7'}
+        
+        class HTTPError(Exception):
+            response = FakeResponse()
+        
+        calls = []
+        
+        def mock_api():
+            calls.append(1)
+            if len(calls) == 1:
+                raise HTTPError("Client Error")
+            return "ok"
+        
+        assert protected.execute(mock_api) == "ok"
+        assert sleeps == [7.0]
+    
+    def test_retry_after_seconds_parses_http_date(self):
+        """Test Retry-After given as an HTTP-date and a missing header."""
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+        from loaders.rate_limiter import retry_after_seconds
+        
+        class FakeResponse:
+            headers = {
+                'Retry-After': format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+            }
+        
+        error = Exception("429")
+        error.response = FakeResponse()
+        assert 55 <= retry_after_seconds(error) <= 60
+        assert retry_after_seconds(Exception("429")) is None
 
 
 if __name__ == "__main__":
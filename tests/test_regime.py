@@ -1,4 +1,5 @@
 """Unit tests for regime classification."""
+import itertools
 import pytest
 import pandas as pd
 import numpy as np
@@ -8,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime
-from indicators.regime import RegimeClassifier, RegimeScore, calculate_regime_scores
+from indicators.regime import RegimeClassifier, RegimeFrame, RegimeScore, calculate_regime_scores
 
 @pytest.fixture
 def expansion_data():
@@ -48,6 +49,13 @@ def test_regime_scores():
     assert 0 <= scores.stress <= 100
 
 
+def test_primary_regime_ties_resolve_in_regime_order():
+    scores = RegimeScore(expansion=40.0, late_cycle=70.0, contraction=70.0, stress=70.0)
+
+    assert scores.get_primary_regime() == Regime.LATE_CYCLE
+    assert scores.primary_regime is scores.get_primary_regime()
+
+
 def test_confidence_is_high_when_top_score_is_dominant():
     scores = RegimeScore(expansion=70.0, late_cycle=10.0, contraction=0.0, stress=0.0)
 
@@ -72,5 +80,52 @@ def test_classify_history_uses_confidence_ratio(expansion_data):
     assert not history.empty
     assert history['confidence'].between(0.7, 1.0).all()
 
+
+def test_regime_frame_aligns_mixed_frequencies(stress_data):
+    data = dict(stress_data, credit_growth=stress_data['credit_growth'].iloc[::7])
+    frame = RegimeFrame.from_series(data)
+    cutoff = pd.Timestamp('2021-06-30')
+
+    assert len(frame) == len(stress_data['vix'])
+    for key, series in data.items():
+        pd.testing.assert_series_equal(frame.as_series(key), series.astype(float), check_names=False, check_freq=False)
+        np.testing.assert_array_equal(frame.array(key, cutoff), series[series.index <= cutoff].to_numpy(dtype=float))
+
+    classifier = RegimeClassifier()
+    assert classifier.classify(frame).scores == classifier.classify(data).scores
+
+
+def test_classify_all_matches_per_date_classify(stress_data):
+    classifier = RegimeClassifier()
+
+    history = classifier.classify_all(stress_data)
+
+    assert len(history) == len(stress_data['vix'])
+    for date in history.index[::97]:
+        result = classifier.classify(stress_data, as_of_date=date)
+        row = history.loc[date]
+        assert row['regime'] == result.primary_regime.value
+        assert row['confidence'] == pytest.approx(result.confidence)
+        assert [row['expansion'], row['late_cycle'], row['contraction'], row['stress']] == list(result.scores.to_dict().values())
+
+def test_scalar_scores_match_score_matrix_at_every_threshold():
+    classifier = RegimeClassifier()
+    t = classifier.thresholds
+    candidates = {
+        'credit_growth_3m': [t['credit_growth_expansion'], t['credit_growth_contraction'], 1.0, -1.0],
+        'spread_zscore': [t['spread_zscore_tight'], t['spread_zscore_wide'], 0.0, 2.0],
+        'vix_percentile': [t['vix_percentile_low'], t['vix_percentile_high'], t['vix_stress'], 95.0],
+        'equity_1m_return': [t['equity_drawdown'], -6.0],
+        'val_earn_gap': [t['valuation_vs_earnings_gap'], 1.0],
+    }
+
+    # Every combination of boundary, off-boundary, NaN and missing (None) values
+    for combo in itertools.product(*[values + [np.nan, None] for values in candidates.values()]):
+        metrics = {name: value for name, value in zip(candidates, combo) if value is not None}
+        arrays = {name: (np.array([value]), np.ones(1, dtype=bool)) for name, value in metrics.items()}
+
+        expected = classifier._calculate_score_matrix(arrays, 1)[0]
+        assert list(classifier._calculate_scores(metrics).to_dict().values()) == expected.tolist()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,7 +10,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from indicators.transforms import (
     calc_yoy, calc_3m_annualized, calc_1m_change,
     calc_zscore, calc_zscore_change, calc_acceleration,
-    detect_inflection, calc_percentile,
+    detect_inflection, calc_percentile, standardize_frequency,
+    latest_pct_change, latest_zscore, latest_percentile,
 )
 
 @pytest.fixture
@@ -38,15 +39,116 @@ def test_calc_zscore(sample_series):
     assert valid.mean() < 0.5  # Should be approximately 0
     assert 0.5 < valid.std() < 1.5  # Should be approximately 1
 
+def test_calc_zscore_keeps_series_name(sample_series):
+    named = sample_series.rename('fed_lending')
+    assert calc_zscore(named, window_years=1, periods_per_year=52).name == 'fed_lending'
+    # A cache hit on the same values answers with the caller's name
+    assert calc_zscore(named.rename('m2'), window_years=1, periods_per_year=52).name == 'm2'
+
+def test_calc_zscore_after_variance_collapse_matches_rolling():
+    # Volatile era, then a calm one at a far lower level (fed_lending's shape)
+    rng = np.random.default_rng(1)
+    values = np.concatenate([rng.normal(5e11, 3e11, 200), rng.normal(1e6, 1e3, 600)])
+    series = pd.Series(values, index=pd.date_range('2000-01-02', periods=800, freq='W'))
+
+    result = calc_zscore(series, window_years=3, periods_per_year=52)
+
+    rolling = series.rolling(156, min_periods=78)
+    assert result.notna().sum() == ((series - rolling.mean()) / rolling.std()).notna().sum()
+    # Windows wholly inside the calm era, against rolling stats of that era alone
+    calm = series.iloc[200:]
+    calm_rolling = calm.rolling(156)
+    expected = ((calm - calm_rolling.mean()) / calm_rolling.std()).iloc[155:]
+    np.testing.assert_allclose(result.loc[expected.index], expected, rtol=1e-9, atol=1e-9)
+
 def test_calc_percentile(sample_series):
     result = calc_percentile(sample_series, window_years=1, periods_per_year=52)
     valid = result.dropna()
     assert valid.min() >= 0
     assert valid.max() <= 100
 
+def test_calc_percentile_keeps_series_name(sample_series):
+    named = sample_series.rename('vix')
+    assert calc_percentile(named, window_years=1, periods_per_year=52).name == 'vix'
+
+def test_calc_percentile_matches_scipy_rank(sample_series):
+    from scipy import stats
+
+    series = sample_series.round(0)  # force ties
+    expected = series.rolling(window=52, min_periods=26).apply(
+        lambda x: stats.percentileofscore(x.dropna(), x.iloc[-1])
+    )
+    result = calc_percentile(series, window_years=1, periods_per_year=52)
+    pd.testing.assert_series_equal(result, expected)
+
+def test_calc_percentile_matches_scipy_rank_with_gaps(sample_series):
+    from scipy import stats
+
+    series = sample_series.round(0)
+    series.iloc[[3, 20, 21, 22, 150]] = np.nan
+    expected = series.rolling(window=52, min_periods=26).apply(
+        lambda x: stats.percentileofscore(x.dropna(), x.iloc[-1])
+    )
+    expected[series.isna()] = np.nan
+    result = calc_percentile(series, window_years=1, periods_per_year=52)
+    pd.testing.assert_series_equal(result, expected)
+
+def test_latest_helpers_match_full_series_transforms(sample_series):
+    values = sample_series.to_numpy()
+    assert latest_pct_change(values, 52) == pytest.approx(calc_yoy(sample_series, periods=52).iloc[-1])
+    assert latest_zscore(values, 52) == pytest.approx(
+        calc_zscore(sample_series, window_years=1, periods_per_year=52).iloc[-1]
+    )
+    assert latest_percentile(values, 52) == pytest.approx(
+        calc_percentile(sample_series, window_years=1, periods_per_year=52).iloc[-1]
+    )
+
+def test_calc_acceleration_matches_double_diff(sample_series):
+    expected = sample_series.diff(13).diff(13)
+    pd.testing.assert_series_equal(calc_acceleration(sample_series, 13, 13), expected)
+
 def test_detect_inflection(sample_series):
     result = detect_inflection(sample_series, lookback=10)
     assert set(result.unique()).issubset({-1, 0, 1})
 
+def test_standardize_frequency_accepts_date_column_or_index(sample_series):
+    df = pd.DataFrame({'date': sample_series.index, 'value': sample_series.to_numpy()})
+    df.loc[5:12, 'value'] = np.nan
+
+    monthly = standardize_frequency(df, target_freq='ME')
+
+    expected = df.set_index('date')['value'].resample('ME').last().dropna()
+    assert monthly['date'].tolist() == expected.index.tolist()
+    np.testing.assert_array_equal(monthly['value'].to_numpy(), expected.to_numpy())
+    pd.testing.assert_frame_equal(standardize_frequency(df.set_index('date'), target_freq='ME'), monthly)
+
+def test_windowed_transforms_reuse_results_by_content(sample_series):
+    first = calc_percentile(sample_series, window_years=1, periods_per_year=52)
+    first.iloc[-1] = -1.0
+
+    # Same content in a new object hits the cache; the caller's edit did not leak
+    rebuilt = pd.Series(sample_series.to_numpy().copy(), index=sample_series.index.copy())
+    again = calc_percentile(rebuilt, window_years=1, periods_per_year=52)
+    assert again.iloc[-1] != -1.0
+    assert again.equals(calc_percentile(sample_series.copy(), window_years=1, periods_per_year=52))
+
+    changed = sample_series.copy()
+    changed.iloc[-1] += 1000
+    assert calc_percentile(changed, window_years=1, periods_per_year=52).iloc[-1] == 100.0
+
+    # Equal values on a different index are a different cache entry
+    shifted = pd.Series(sample_series.to_numpy().copy(), index=sample_series.index + pd.Timedelta(days=1))
+    moved = calc_percentile(shifted, window_years=1, periods_per_year=52)
+    assert moved.index.equals(shifted.index)
+    np.testing.assert_array_equal(moved.to_numpy(), again.to_numpy())
+
+def test_memoized_results_are_deep_copies_without_copy_on_write(sample_series, monkeypatch):
+    monkeypatch.setattr('indicators.transforms._copy_on_write_enabled', lambda: False)
+    first = calc_zscore(sample_series + 1, window_years=1, periods_per_year=52)
+    second = calc_zscore(sample_series + 1, window_years=1, periods_per_year=52)
+
+    assert second.equals(first)
+    assert not np.shares_memory(first.to_numpy(), second.to_numpy())
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -25,8 +25,11 @@ from indicators.transforms import (
     calc_zscore,
     calc_acceleration,
     detect_inflection,
+    latest_3m_annualized,
+    latest_pct_change,
 )
 from components.styles import render_page_header
+from components.views import build_views
 def render_balance_sheet(data_dict, regime_result=None):
     render_page_header(
         icon="🏦",
@@ -40,7 +43,7 @@ def render_balance_sheet(data_dict, regime_result=None):
         st.warning('⚠️ 데이터가 없습니다.')
         return
     
-    
+    views = build_views(data_dict)
     
     # ============================================================================
     # OVERVIEW METRICS
@@ -51,47 +54,44 @@ def render_balance_sheet(data_dict, regime_result=None):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if 'fed_assets' in data_dict:
-            fed = data_dict['fed_assets']
-            latest = fed.iloc[-1] / 1e12 if len(fed) > 0 else 0
-            yoy = calc_yoy(fed, periods=52).iloc[-1] if len(fed) > 52 else None
+        v = views.get('fed_assets')
+        if v:
+            yoy = latest_pct_change(v.values, 52) if v.length > 52 else None
             
             st.metric(
                 "Fed 자산",
-                f"${latest:.2f}T",
+                f"${v.display_last:.2f}{v.unit}",
                 f"{yoy:+.1f}% YoY" if yoy else None,
             )
     
     with col2:
-        if 'bank_credit' in data_dict:
-            credit = data_dict['bank_credit']
-            latest = credit.iloc[-1] / 1e12 if len(credit) > 0 else 0
-            ann_3m = calc_3m_annualized(credit, periods_3m=13).iloc[-1] if len(credit) > 13 else None
+        v = views.get('bank_credit')
+        if v:
+            ann_3m = latest_3m_annualized(v.values, periods_3m=13) if v.length > 13 else None
             
             st.metric(
                 "은행 신용",
-                f"${latest:.2f}T",
+                f"${v.display_last:.2f}{v.unit}",
                 f"{ann_3m:+.1f}% (3M ann)" if ann_3m else None,
             )
     
     with col3:
-        if 'm2' in data_dict:
-            m2 = data_dict['m2']
-            latest = m2.iloc[-1] / 1e12 if len(m2) > 0 else 0
-            yoy = calc_yoy(m2, periods=52).iloc[-1] if len(m2) > 52 else None
+        v = views.get('m2')
+        if v:
+            yoy = latest_pct_change(v.values, 52) if v.length > 52 else None
             
             st.metric(
                 "M2",
-                f"${latest:.2f}T",
+                f"${v.display_last:.2f}{v.unit}",
                 f"{yoy:+.1f}% YoY" if yoy else None,
             )
     
     with col4:
         # Calculate total balance sheet growth
-        if 'bank_credit' in data_dict:
-            credit = data_dict['bank_credit']
-            acc = calc_acceleration(credit, 13, 13)  # Weekly
-            latest_acc = acc.iloc[-1] if len(acc) > 0 else None
+        v = views.get('bank_credit')
+        if v:
+            acc = calc_acceleration(v.series, 13, 13)  # Weekly
+            latest_acc = acc.iat[-1]
             
             status = "가속" if latest_acc and latest_acc > 0 else "감속"
             st.metric(
@@ -136,56 +136,31 @@ def render_balance_sheet(data_dict, regime_result=None):
     st.markdown("---")
     st.markdown("### 📊 성장률")
     
-    tab1, tab2, tab3 = st.tabs(["YoY 성장률", "3M 연율화", "1M 변화"])
-    
-    with tab1:
-        growth_data = {}
-        for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]:
-            if key in data_dict:
-                growth_data[name] = calc_yoy(data_dict[key], periods=52)
-        
-        if growth_data:
-            fig = create_multi_line_chart(
-                growth_data,
-                title='YoY 성장률 (%)',
-                normalize=False,
-                height=400,
-            )
-            # Add zero line
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, width="stretch")
-    
-    with tab2:
-        growth_data = {}
-        for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]:
-            if key in data_dict:
-                growth_data[name] = calc_3m_annualized(data_dict[key], periods_3m=13)
-        
-        if growth_data:
-            fig = create_multi_line_chart(
-                growth_data,
-                title='3개월 연율화 성장률 (%)',
-                normalize=False,
-                height=400,
-            )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, width="stretch")
-    
-    with tab3:
-        growth_data = {}
-        for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]:
-            if key in data_dict:
-                growth_data[name] = calc_1m_change(data_dict[key], periods_1m=4)
-        
-        if growth_data:
-            fig = create_multi_line_chart(
-                growth_data,
-                title='1개월 변화율 (%)',
-                normalize=False,
-                height=400,
-            )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, width="stretch")
+    growth_series = {
+        name: views[key].series
+        for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]
+        if key in views
+    }
+    growth_tabs = [
+        ("YoY 성장률", 'YoY 성장률 (%)', lambda series: calc_yoy(series, periods=52)),
+        ("3M 연율화", '3개월 연율화 성장률 (%)', lambda series: calc_3m_annualized(series, periods_3m=13)),
+        ("1M 변화", '1개월 변화율 (%)', lambda series: calc_1m_change(series, periods_1m=4)),
+    ]
+    
+    # Each tab computes its own transform once per series
+    for tab, (_, title, transform) in zip(st.tabs([label for label, _, _ in growth_tabs]), growth_tabs):
+        with tab:
+            if growth_series:
+                growth_data = {name: transform(series) for name, series in growth_series.items()}
+                fig = create_multi_line_chart(
+                    growth_data,
+                    title=title,
+                    normalize=False,
+                    height=400,
+                )
+                # Add zero line
+                fig.add_hline(y=0, line_dash="dash", line_color="gray")
+                st.plotly_chart(fig, width="stretch")
     
     
     # ============================================================================
@@ -198,11 +173,12 @@ def render_balance_sheet(data_dict, regime_result=None):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Z-score time series
-        zscore_data = {}
-        for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]:
-            if key in data_dict:
-                zscore_data[name] = calc_zscore(data_dict[key], window_years=3, periods_per_year=52)
+        # Z-score time series (series shorter than min_periods would be all NaN)
+        zscore_data = {
+            name: calc_zscore(views[key].series, window_years=3, periods_per_year=52)
+            for name, key in [('Fed Assets', 'fed_assets'), ('Bank Credit', 'bank_credit'), ('M2', 'm2')]
+            if key in views and views[key].length >= (3 * 52) // 2
+        }
         
         if zscore_data:
             fig = create_multi_line_chart(
@@ -219,26 +195,19 @@ def render_balance_sheet(data_dict, regime_result=None):
     with col2:
         # Z-score heatmap
         if zscore_data:
-            # Prepare data for heatmap
-            zscore_df_list = []
-            for name, series in zscore_data.items():
-                if series is not None and len(series) > 0:
-                    temp_df = pd.DataFrame({
-                        'date': series.index,
-                        'indicator': name,
-                        'zscore': series.values,
-                    })
-                    zscore_df_list.append(temp_df)
-            
-            if zscore_df_list:
-                zscore_df = pd.concat(zscore_df_list, ignore_index=True)
-                # Resample to weekly if too many points
-                fig = create_zscore_heatmap(
-                    zscore_df,
-                    title='Z-Score 히트맵',
-                    height=350,
-                )
-                st.plotly_chart(fig, width="stretch")
+            # Prepare long-format data for heatmap in one allocation per column
+            names, series_list = zip(*zscore_data.items())
+            zscore_df = pd.DataFrame({
+                'date': np.concatenate([series.index.values for series in series_list]),
+                'indicator': np.repeat(names, [len(series) for series in series_list]),
+                'zscore': np.concatenate([series.to_numpy() for series in series_list]),
+            })
+            fig = create_zscore_heatmap(
+                zscore_df,
+                title='Z-Score 히트맵',
+                height=350,
+            )
+            st.plotly_chart(fig, width="stretch")
     
     
     # ============================================================================
@@ -258,24 +227,16 @@ def render_balance_sheet(data_dict, regime_result=None):
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            acc_df = pd.DataFrame({
-                'date': acc.index,
-                'value': acc.values / 1e9,  # Billions
-                'indicator': '신용 가속도'
-            })
-            
             fig = create_timeseries_chart(
-                acc_df,
+                acc / 1e9,  # Billions
                 title='은행 신용 가속도 (10억 달러/주²)',
-                date_col='date',
-                value_col='value',
                 height=350,
             )
             fig.add_hline(y=0, line_dash="dash", line_color="white", opacity=0.5)
             st.plotly_chart(fig, width="stretch")
         
         with col2:
-            latest_acc = acc.iloc[-1] if len(acc) > 0 else 0
+            latest_acc = acc.iat[-1] if len(acc) > 0 else 0
             avg_acc = acc.iloc[-13:].mean() if len(acc) > 13 else 0  # 3 month average
             
             st.markdown("#### 현재 상태")
@@ -304,33 +265,32 @@ def render_balance_sheet(data_dict, regime_result=None):
     if 'bank_credit' in data_dict:
         credit = data_dict['bank_credit']
         growth = calc_yoy(credit, periods=52)
-        inflection = detect_inflection(growth, lookback=13, sensitivity=1.0)
+        inflection = detect_inflection(growth, lookback=13, sensitivity=1.0).to_numpy()
+        growth_values = growth.to_numpy()
         
-        # Filter to significant inflection points
-        peaks = inflection[inflection == 1]
-        troughs = inflection[inflection == -1]
+        # Row positions of significant inflection points (inflection shares growth's index)
+        peaks = np.flatnonzero(inflection == 1)
+        troughs = np.flatnonzero(inflection == -1)
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**최근 고점 (Peak)**")
             if len(peaks) > 0:
-                recent_peaks = peaks.tail(3)
-                for date, _ in recent_peaks.items():
-                    val = growth.loc[date] if date in growth.index else None
+                recent_peaks = peaks[-3:]
+                for date, val in zip(growth.index[recent_peaks].strftime('%Y-%m-%d'), growth_values[recent_peaks]):
                     if val:
-                        st.markdown(f"• {date.strftime('%Y-%m-%d')}: {val:.1f}%")
+                        st.markdown(f"• {date}: {val:.1f}%")
             else:
                 st.markdown("최근 1년 내 유의미한 고점 없음")
         
         with col2:
             st.markdown("**최근 저점 (Trough)**")
             if len(troughs) > 0:
-                recent_troughs = troughs.tail(3)
-                for date, _ in recent_troughs.items():
-                    val = growth.loc[date] if date in growth.index else None
+                recent_troughs = troughs[-3:]
+                for date, val in zip(growth.index[recent_troughs].strftime('%Y-%m-%d'), growth_values[recent_troughs]):
                     if val:
-                        st.markdown(f"• {date.strftime('%Y-%m-%d')}: {val:.1f}%")
+                        st.markdown(f"• {date}: {val:.1f}%")
             else:
                 st.markdown("최근 1년 내 유의미한 저점 없음")
     
@@ -15,12 +15,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime
-from components.charts import create_timeseries_chart, create_multi_line_chart
+from components.charts_cached import cached_multi_line_chart, cached_timeseries_chart
 from components.cards import render_metric_card, render_alert_card
 from indicators.transforms import (
     calc_zscore, 
     calc_1m_change, 
     calc_percentile,
+    latest_pct_change,
+    latest_percentile,
 )
 from indicators.alerts import check_collateral_stress, AlertLevel
 from components.styles import render_page_header
@@ -71,8 +73,8 @@ def render_collateral(data_dict, regime_result=None):
     with col1:
         if 'vix' in data_dict:
             vix = data_dict['vix']
-            latest = vix.iloc[-1] if len(vix) > 0 else 0
-            pct = calc_percentile(vix, window_years=3).iloc[-1] if len(vix) > 756 else None
+            latest = vix.iat[-1] if len(vix) > 0 else 0
+            pct = latest_percentile(vix.to_numpy(dtype=np.float64), window=3 * 252) if len(vix) > 756 else None
             
             st.metric(
                 "VIX",
@@ -84,8 +86,8 @@ def render_collateral(data_dict, regime_result=None):
     with col2:
         if 'hy_spread' in data_dict:
             spread = data_dict['hy_spread']
-            latest = spread.iloc[-1] * 100 if len(spread) > 0 else 0  # bps
-            pct = calc_percentile(spread, window_years=3, periods_per_year=52).iloc[-1] if len(spread) > 156 else None
+            latest = spread.iat[-1] * 100 if len(spread) > 0 else 0  # bps
+            pct = latest_percentile(spread.to_numpy(dtype=np.float64), window=3 * 52) if len(spread) > 156 else None
             
             st.metric(
                 "HY 스프레드",
@@ -97,8 +99,8 @@ def render_collateral(data_dict, regime_result=None):
     with col3:
         if 'ig_spread' in data_dict:
             spread = data_dict['ig_spread']
-            latest = spread.iloc[-1] * 100 if len(spread) > 0 else 0
-            pct = calc_percentile(spread, window_years=3, periods_per_year=52).iloc[-1] if len(spread) > 156 else None
+            latest = spread.iat[-1] * 100 if len(spread) > 0 else 0
+            pct = latest_percentile(spread.to_numpy(dtype=np.float64), window=3 * 52) if len(spread) > 156 else None
             
             st.metric(
                 "IG 스프레드",
@@ -110,7 +112,7 @@ def render_collateral(data_dict, regime_result=None):
     with col4:
         if 'sp500' in data_dict:
             sp = data_dict['sp500']
-            ret_1m = calc_1m_change(sp).iloc[-1] if len(sp) > 21 else None
+            ret_1m = latest_pct_change(sp.to_numpy(dtype=np.float64), 21) if len(sp) > 21 else None
             
             st.metric(
                 "S&P 500 (1M)",
@@ -132,39 +134,29 @@ def render_collateral(data_dict, regime_result=None):
         tab1, tab2 = st.tabs(["VIX 추이", "VIX 백분위"])
         
         with tab1:
-            vix_df = pd.DataFrame({
-                'date': vix.index,
-                'value': vix.values,
-                'indicator': 'VIX'
-            })
-            fig = create_timeseries_chart(
-                vix_df,
+            fig = cached_timeseries_chart(
+                vix,
                 title='VIX (CBOE 변동성 지수)',
                 height=400,
+                threshold_lines=[
+                    {'value': 20, 'label': '안정', 'color': 'green', 'dash': 'dash', 'opacity': 0.5},
+                    {'value': 30, 'label': '경계', 'color': 'orange', 'dash': 'dash', 'opacity': 0.5},
+                    {'value': 40, 'label': '스트레스', 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+                ],
             )
-            # Add threshold lines
-            fig.add_hline(y=20, line_dash="dash", line_color="green", opacity=0.5,
-                         annotation_text="안정", annotation_position="right")
-            fig.add_hline(y=30, line_dash="dash", line_color="orange", opacity=0.5,
-                         annotation_text="경계", annotation_position="right")
-            fig.add_hline(y=40, line_dash="dash", line_color="red", opacity=0.5,
-                         annotation_text="스트레스", annotation_position="right")
             st.plotly_chart(fig, width="stretch")
         
         with tab2:
             vix_pct = calc_percentile(vix, window_years=3)
-            pct_df = pd.DataFrame({
-                'date': vix_pct.index,
-                'value': vix_pct.values,
-                'indicator': 'VIX Percentile'
-            })
-            fig = create_timeseries_chart(
-                pct_df,
+            fig = cached_timeseries_chart(
+                vix_pct,
                 title='VIX 백분위 (3년 롤링)',
                 height=400,
+                threshold_lines=[
+                    {'value': 75, 'color': 'orange', 'dash': 'dash', 'opacity': 0.5},
+                    {'value': 90, 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+                ],
             )
-            fig.add_hline(y=75, line_dash="dash", line_color="orange", opacity=0.5)
-            fig.add_hline(y=90, line_dash="dash", line_color="red", opacity=0.5)
             st.plotly_chart(fig, width="stretch")
     
     
@@ -185,7 +177,7 @@ def render_collateral(data_dict, regime_result=None):
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = create_multi_line_chart(
+            fig = cached_multi_line_chart(
                 spread_data,
                 title='신용 스프레드 (%)',
                 height=400,
@@ -201,14 +193,16 @@ def render_collateral(data_dict, regime_result=None):
                 zscore_data['IG Z-Score'] = calc_zscore(data_dict['ig_spread'], window_years=3, periods_per_year=52)
             
             if zscore_data:
-                fig = create_multi_line_chart(
+                fig = cached_multi_line_chart(
                     zscore_data,
                     title='스프레드 Z-Score (3년)',
                     height=400,
+                    threshold_lines=[
+                        {'value': 0, 'color': 'gray', 'dash': 'solid', 'opacity': 0.3},
+                        {'value': 2, 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+                        {'value': -2, 'color': 'green', 'dash': 'dash', 'opacity': 0.5},
+                    ],
                 )
-                fig.add_hline(y=0, line_dash="solid", line_color="gray", opacity=0.3)
-                fig.add_hline(y=2, line_dash="dash", line_color="red", opacity=0.5)
-                fig.add_hline(y=-2, line_dash="dash", line_color="green", opacity=0.5)
                 st.plotly_chart(fig, width="stretch")
     
     
@@ -225,13 +219,8 @@ def render_collateral(data_dict, regime_result=None):
         col1, col2 = st.columns(2)
         
         with col1:
-            sp_df = pd.DataFrame({
-                'date': sp.index,
-                'value': sp.values,
-                'indicator': 'S&P 500'
-            })
-            fig = create_timeseries_chart(
-                sp_df,
+            fig = cached_timeseries_chart(
+                sp,
                 title='S&P 500 (주요 담보 자산)',
                 height=350,
             )
@@ -240,21 +229,16 @@ def render_collateral(data_dict, regime_result=None):
         with col2:
             # Monthly returns
             ret_1m = calc_1m_change(sp)
-            ret_df = pd.DataFrame({
-                'date': ret_1m.index,
-                'value': ret_1m.values,
-                'indicator': '1M Return'
-            })
-            fig = create_timeseries_chart(
-                ret_df,
+            fig = cached_timeseries_chart(
+                ret_1m,
                 title='S&P 500 1개월 수익률 (%)',
                 height=350,
+                threshold_lines=[
+                    {'value': 0, 'color': 'gray', 'dash': 'solid', 'opacity': 0.3},
+                    {'value': -5, 'label': '경계', 'color': 'orange', 'dash': 'dash', 'opacity': 0.5},
+                    {'value': -10, 'label': '스트레스', 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+                ],
             )
-            fig.add_hline(y=0, line_dash="solid", line_color="gray", opacity=0.3)
-            fig.add_hline(y=-5, line_dash="dash", line_color="orange", opacity=0.5,
-                         annotation_text="경계", annotation_position="right")
-            fig.add_hline(y=-10, line_dash="dash", line_color="red", opacity=0.5,
-                         annotation_text="스트레스", annotation_position="right")
             st.plotly_chart(fig, width="stretch")
     
     
@@ -268,34 +252,40 @@ def render_collateral(data_dict, regime_result=None):
     # Create composite stress index
     stress_components = []
     
-    if 'vix' in data_dict:
-        vix = data_dict['vix']
-        if len(vix) > 100:
-            vix_pct = calc_percentile(vix, window_years=1, periods_per_year=252)
-            vix_pct = vix_pct.dropna()
-            if len(vix_pct) > 0:
-                stress_components.append(('VIX', vix_pct / 100))
+    # Skip the percentile passes when fewer than two components can qualify
+    component_inputs = [('vix', 100), ('hy_spread', 20), ('sp500', 21)]
+    available = sum(key in data_dict and len(data_dict[key]) > min_len for key, min_len in component_inputs)
     
-    if 'hy_spread' in data_dict:
-        spread = data_dict['hy_spread']
-        if len(spread) > 20:
-            spread_pct = calc_percentile(spread, window_years=1, periods_per_year=52)
-            spread_pct = spread_pct.dropna()
-            # Resample to daily for alignment
-            spread_pct = spread_pct.resample('D').ffill()
-            if len(spread_pct) > 0:
-                stress_components.append(('Spread', spread_pct / 100))
+    if available >= 2:
+        if 'vix' in data_dict:
+            vix = data_dict['vix']
+            if len(vix) > 100:
+                vix_pct = calc_percentile(vix, window_years=1, periods_per_year=252)
+                vix_pct = vix_pct.dropna()
+                if len(vix_pct) > 0:
+                    stress_components.append(('VIX', vix_pct / 100))
     
-    if 'sp500' in data_dict:
-        sp = data_dict['sp500']
-        if len(sp) > 21:
-            ret_1m = calc_1m_change(sp)
-            ret_1m = ret_1m.dropna()
-            # Convert to stress: negative returns = positive stress
-            equity_stress = (-ret_1m / 10).clip(-1, 1)  # Scale -10% to 1.0
-            equity_stress = (equity_stress + 1) / 2  # Normalize to 0-1
-            if len(equity_stress) > 0:
-                stress_components.append(('Equity', equity_stress))
+        if 'hy_spread' in data_dict:
+            spread = data_dict['hy_spread']
+            if len(spread) > 20:
+                spread_pct = calc_percentile(spread, window_years=1, periods_per_year=52)
+                spread_pct = spread_pct.dropna()
+                if len(spread_pct) > 0:
+                    stress_components.append(('Spread', spread_pct / 100))
+    
+        if 'sp500' in data_dict:
+            sp = data_dict['sp500']
+            if len(sp) > 21:
+                ret_1m = calc_1m_change(sp)
+                ret_1m = ret_1m.dropna()
+                # Convert to stress: negative returns = positive stress, in one buffer
+                stress = ret_1m.to_numpy(dtype=np.float64) / -10  # Scale -10% to 1.0
+                np.clip(stress, -1, 1, out=stress)
+                stress += 1
+                stress /= 2  # Normalize to 0-1
+                equity_stress = pd.Series(stress, index=ret_1m.index)
+                if len(equity_stress) > 0:
+                    stress_components.append(('Equity', equity_stress))
     
     if len(stress_components) >= 2:
         # Find common date range
@@ -305,38 +295,32 @@ def render_collateral(data_dict, regime_result=None):
         if all_start < all_end:
             # Use first component's index as base
             base_idx = stress_components[0][1].loc[all_start:all_end].index
-            
-            aligned_components = []
-            for name, series in stress_components:
-                clipped = series.loc[all_start:all_end]
-                # Reindex to base
-                reindexed = clipped.reindex(base_idx, method='ffill')
-                aligned_components.append(reindexed)
-            
+
+            # Forward-fill each component onto the base dates (weekly spreads
+            # included, so no daily resample) and average the raw arrays
+            aligned_components = [
+                series.loc[all_start:all_end].reindex(base_idx, method='ffill').to_numpy()
+                for _, series in stress_components
+            ]
+
             # Compute average
-            composite = sum(aligned_components) / len(aligned_components)
+            composite = pd.Series(sum(aligned_components) / len(aligned_components), index=base_idx)
             composite = composite.dropna()
             
             if len(composite) > 0:
-                composite_df = pd.DataFrame({
-                    'date': composite.index,
-                    'value': composite.values * 100,
-                    'indicator': 'Composite Stress'
-                })
-                
-                fig = create_timeseries_chart(
-                    composite_df,
+                fig = cached_timeseries_chart(
+                    composite * 100,
                     title='담보 스트레스 종합 지수 (0-100)',
                     height=400,
+                    threshold_lines=[
+                        {'value': 50, 'label': '경계', 'color': 'orange', 'dash': 'dash', 'opacity': 0.5},
+                        {'value': 75, 'label': '고위험', 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+                    ],
                 )
-                fig.add_hline(y=50, line_dash="dash", line_color="orange", opacity=0.5,
-                             annotation_text="경계", annotation_position="right")
-                fig.add_hline(y=75, line_dash="dash", line_color="red", opacity=0.5,
-                             annotation_text="고위험", annotation_position="right")
                 st.plotly_chart(fig, width="stretch")
                 
                 # Latest reading
-                latest_stress = composite.iloc[-1] * 100 if len(composite) > 0 else 0
+                latest_stress = composite.iat[-1] * 100 if len(composite) > 0 else 0
                 
                 if latest_stress > 75:
                     st.error(f"🔴 **담보 스트레스 고위험**: {latest_stress:.0f}/100")
@@ -4,6 +4,7 @@ Top-level dashboard sections for the redesigned app shell.
 from dataclasses import asdict
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -14,12 +15,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import MINIMUM_INDICATORS, REGIME_DESCRIPTIONS, Regime
 from components.cards import render_alert_card, render_vulnerability_card
 from components.charts import (
-    create_multi_line_chart,
     create_regime_gauge,
     create_regime_history_chart,
-    create_timeseries_chart,
     create_valuation_scatter,
 )
+from components.charts_cached import cached_multi_line_chart, cached_timeseries_chart
 from components.dashboard_ui import (
     render_action_list,
     render_headline_card,
@@ -35,6 +35,7 @@ from components.reports import (
     generate_watch_next,
     generate_what_changed,
 )
+from components.views import build_views
 from indicators.alerts import (
     AlertConfig,
     AlertEngine,
@@ -42,6 +43,7 @@ from indicators.alerts import (
     check_collateral_stress,
 )
 from indicators.derived_metrics import (
+    MetricsContext,
     calculate_fed_lending_stress,
     calculate_qt_pace,
     classify_reserve_regime,
@@ -51,9 +53,12 @@ from indicators.transforms import (
     calc_1m_change,
     calc_3m_annualized,
     calc_percentile,
-    calc_yoy,
     calc_zscore,
     calc_zscore_change,
+    latest_3m_annualized,
+    latest_pct_change,
+    latest_percentile,
+    latest_zscore,
 )
 
 PRIMARY_SECTION_OPTIONS = ['Command Center', 'Diagnostics', 'Action Center']
@@ -96,12 +101,18 @@ PLAYBOOKS = {
 def _latest(series: Optional[pd.Series]) -> Optional[float]:
     if series is None or len(series) == 0:
         return None
-    value = series.iloc[-1]
+    value = series.iat[-1]
     if pd.isna(value):
         return None
     return float(value)
 
 
+def _finite(value: float) -> Optional[float]:
+    if np.isnan(value):
+        return None
+    return float(value)
+
+
 def _safe_percent_rank(value: Optional[float]) -> str:
     return f"{value:.0f}%ile" if value is not None else "—"
 
@@ -144,51 +155,53 @@ def build_dashboard_metrics(data_dict: Dict[str, pd.Series]) -> Dict[str, Option
         'pe_eps_gap': None,
     }
 
-    if 'bank_credit' in data_dict:
-        credit = data_dict['bank_credit']
-        metrics['credit_growth_3m'] = _latest(calc_3m_annualized(credit, periods_3m=13))
+    views = build_views(data_dict)
+
+    v = views.get('bank_credit')
+    if v:
+        metrics['credit_growth_3m'] = _finite(latest_3m_annualized(v.values, periods_3m=13))
 
-    if 'hy_spread' in data_dict:
-        spread = data_dict['hy_spread']
-        metrics['spread_zscore'] = _latest(calc_zscore(spread, window_years=3, periods_per_year=52))
+    v = views.get('hy_spread')
+    if v:
+        metrics['spread_zscore'] = _finite(latest_zscore(v.values, window=3 * 52))
 
-    if 'vix' in data_dict:
-        vix = data_dict['vix']
-        metrics['vix_percentile'] = _latest(calc_percentile(vix, window_years=3, periods_per_year=252))
+    v = views.get('vix')
+    if v:
+        metrics['vix_percentile'] = _finite(latest_percentile(v.values, window=3 * 252))
 
-    if 'sp500' in data_dict:
-        equity = data_dict['sp500']
-        metrics['equity_1m'] = _latest(calc_1m_change(equity))
+    v = views.get('sp500')
+    if v:
+        metrics['equity_1m'] = _finite(latest_pct_change(v.values, 21))
 
-    if 'pe_ratio' in data_dict:
-        pe = data_dict['pe_ratio']
-        metrics['pe_zscore'] = _latest(calc_zscore(pe, window_years=3, periods_per_year=52))
+    pe_view = views.get('pe_ratio')
+    if pe_view:
+        metrics['pe_zscore'] = _finite(latest_zscore(pe_view.values, window=3 * 52))
 
-    if 'forward_eps' in data_dict:
-        eps = data_dict['forward_eps']
-        latest_eps = _latest(calc_1m_change(eps))
+    eps_view = views.get('forward_eps')
+    if eps_view:
+        latest_eps = _finite(latest_pct_change(eps_view.values, 21))
         metrics['eps_growth'] = latest_eps * 12 if latest_eps is not None else None
-        if 'pe_ratio' in data_dict:
-            pe_z = calc_zscore(data_dict['pe_ratio'], window_years=3, periods_per_year=52)
-            eps_z = calc_zscore(eps, window_years=3, periods_per_year=52)
+        if pe_view:
+            pe_z = calc_zscore(pe_view.series, window_years=3, periods_per_year=52)
+            eps_z = calc_zscore(eps_view.series, window_years=3, periods_per_year=52)
             common_idx = pe_z.index.intersection(eps_z.index)
             if len(common_idx) > 0:
                 metrics['pe_eps_gap'] = _latest(pe_z.loc[common_idx] - eps_z.loc[common_idx])
 
-    if 'real_yield' in data_dict:
-        metrics['real_yield'] = _latest(data_dict['real_yield'])
-    if 'breakeven' in data_dict:
-        metrics['breakeven'] = _latest(data_dict['breakeven'])
-    if 'fed_assets' in data_dict:
-        metrics['qt_pace'] = _latest(calculate_qt_pace(data_dict['fed_assets'], periods_1m=4))
-    if 'reserve_balances' in data_dict:
-        reserve_regime = classify_reserve_regime(
-            data_dict['reserve_balances'] / 1e9,
-            reverse_repo=(data_dict.get('reverse_repo') / 1e9) if 'reverse_repo' in data_dict else None,
-        )
-        metrics['reserve_regime'] = reserve_regime.iloc[-1] if len(reserve_regime) > 0 else None
-    if 'reverse_repo' in data_dict:
-        mm_stress = detect_money_market_stress(data_dict['reverse_repo'] / 1e9)
+    v = views.get('real_yield')
+    if v:
+        metrics['real_yield'] = _finite(v.last)
+    v = views.get('breakeven')
+    if v:
+        metrics['breakeven'] = _finite(v.last)
+    fed_ctx = MetricsContext.from_data_dict(data_dict)
+    if fed_ctx.fed_assets is not None:
+        metrics['qt_pace'] = _latest(calculate_qt_pace(periods_1m=4, ctx=fed_ctx))
+    if fed_ctx.reserves is not None:
+        reserve_regime = classify_reserve_regime(ctx=fed_ctx)
+        metrics['reserve_regime'] = reserve_regime.iat[-1] if len(reserve_regime) > 0 else None
+    if fed_ctx.reverse_repo is not None:
+        mm_stress = detect_money_market_stress(ctx=fed_ctx)
         metrics['money_market_stress'] = _latest(mm_stress['stress_score'])
 
     return metrics
@@ -204,10 +217,7 @@ def _build_load_meta(
     fed_bs_enabled: bool,
     custom_indicator_count: int,
 ) -> Dict[str, object]:
-    latest_dates = []
-    for series in data_dict.values():
-        if series is not None and len(series) > 0:
-            latest_dates.append(pd.to_datetime(series.index.max()))
+    latest_dates = [view.last_date for view in build_views(data_dict).values()]
 
     missing = []
     for key in ['bank_credit', 'hy_spread', 'vix', 'sp500']:
@@ -346,21 +356,25 @@ def render_liquidity_engine(data_dict: Dict[str, pd.Series], regime_result) -> N
         return
 
     metrics = build_dashboard_metrics(data_dict)
+    views = build_views(data_dict)
     bank_credit = data_dict.get('bank_credit')
     fed_assets = data_dict.get('fed_assets')
     m2 = data_dict.get('m2')
+    credit_view = views.get('bank_credit')
+    fed_view = views.get('fed_assets')
+    m2_view = views.get('m2')
 
     st.markdown("### Snapshot")
     credit_acceleration = None
-    if bank_credit is not None and len(bank_credit) > 26:
-        credit_growth = calc_3m_annualized(bank_credit, periods_3m=13)
-        if len(credit_growth) > 13:
-            credit_acceleration = _latest(credit_growth.diff(13))
+    if credit_view and credit_view.length > 26:
+        credit_growth = calc_3m_annualized(credit_view.series, periods_3m=13)
+        credit_acceleration = _latest(credit_growth.diff(13))
+    fed_latest = _finite(fed_view.display_last) if fed_view else None
 
     render_kpi_strip([
-        {'label': 'Fed 자산', 'value': f"${_latest(fed_assets) / 1e12:.2f}T" if _latest(fed_assets) is not None else '—'},
+        {'label': 'Fed 자산', 'value': f"${fed_latest:.2f}{fed_view.unit}" if fed_latest is not None else '—'},
         {'label': '은행 신용', 'value': f"{metrics['credit_growth_3m']:.1f}% ann" if metrics['credit_growth_3m'] is not None else '—'},
-        {'label': 'M2 YoY', 'value': f"{_latest(calc_yoy(m2, periods=52)):.1f}%" if m2 is not None and len(m2) > 52 else '—'},
+        {'label': 'M2 YoY', 'value': f"{latest_pct_change(m2_view.values, 52):.1f}%" if m2_view and m2_view.length > 52 else '—'},
         {'label': '신용 가속도', 'value': f"{credit_acceleration:+.1f}pt" if credit_acceleration is not None else '—', 'delta_color': 'inverse'},
     ])
 
@@ -374,7 +388,7 @@ def render_liquidity_engine(data_dict: Dict[str, pd.Series], regime_result) -> N
             level_data['Bank Credit (T)'] = bank_credit / 1e12
         if m2 is not None:
             level_data['M2 (T)'] = m2 / 1e12
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             level_data,
             title='대차대조표 규모',
             height_preset='compact',
@@ -390,7 +404,7 @@ def render_liquidity_engine(data_dict: Dict[str, pd.Series], regime_result) -> N
             growth_data['Bank Credit 3M ann'] = calc_3m_annualized(bank_credit, periods_3m=13)
         if m2 is not None and len(m2) > 13:
             growth_data['M2 3M ann'] = calc_3m_annualized(m2, periods_3m=13)
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             growth_data,
             title='성장률 흐름',
             height_preset='compact',
@@ -408,7 +422,7 @@ def render_liquidity_engine(data_dict: Dict[str, pd.Series], regime_result) -> N
             zscore_data['Bank Credit Z'] = calc_zscore(bank_credit, window_years=3, periods_per_year=52)
         if m2 is not None and len(m2) > 156:
             zscore_data['M2 Z'] = calc_zscore(m2, window_years=3, periods_per_year=52)
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             zscore_data,
             title='유동성 압력 Z-Score',
             height_preset='compact',
@@ -429,13 +443,21 @@ def render_liquidity_engine(data_dict: Dict[str, pd.Series], regime_result) -> N
 
 
 def _build_collateral_stress_series(data_dict: Dict[str, pd.Series]) -> Dict[str, object]:
+    views = build_views(data_dict)
     components = {}
-    if 'vix' in data_dict and len(data_dict['vix']) > 756:
-        components['VIX'] = calc_percentile(data_dict['vix'], window_years=3, periods_per_year=252)
-    if 'hy_spread' in data_dict and len(data_dict['hy_spread']) > 156:
-        components['HY Spread'] = calc_percentile(data_dict['hy_spread'], window_years=3, periods_per_year=52)
-    if 'sp500' in data_dict and len(data_dict['sp500']) > 21:
-        components['Equity Drawdown'] = calc_1m_change(data_dict['sp500']).clip(upper=0).abs() * 10
+    v = views.get('vix')
+    if v and v.length > 756:
+        components['VIX'] = calc_percentile(v.series, window_years=3, periods_per_year=252)
+    v = views.get('hy_spread')
+    if v and v.length > 156:
+        components['HY Spread'] = calc_percentile(v.series, window_years=3, periods_per_year=52)
+    v = views.get('sp500')
+    if v and v.length > 21:
+        ret_1m = calc_1m_change(v.series)
+        drawdown = np.minimum(ret_1m.to_numpy(dtype=np.float64), 0.0)
+        np.abs(drawdown, out=drawdown)
+        drawdown *= 10
+        components['Equity Drawdown'] = pd.Series(drawdown, index=ret_1m.index)
 
     if not components:
         return {'score': None, 'components': {}}
@@ -456,8 +478,9 @@ def render_collateral_stress(data_dict: Dict[str, pd.Series], alert_config: Aler
     alert = check_collateral_stress(data_dict, config=alert_config)
 
     spread_percentile = None
-    if 'hy_spread' in data_dict and len(data_dict['hy_spread']) > 156:
-        spread_percentile = _latest(calc_percentile(data_dict['hy_spread'], window_years=3, periods_per_year=52))
+    spread_view = build_views(data_dict).get('hy_spread')
+    if spread_view and spread_view.length > 156:
+        spread_percentile = _finite(latest_percentile(spread_view.values, window=3 * 52))
 
     st.markdown("### Snapshot")
     render_kpi_strip([
@@ -492,7 +515,7 @@ def render_collateral_stress(data_dict: Dict[str, pd.Series], alert_config: Aler
             chart_data['VIX'] = data_dict['vix']
         if 'hy_spread' in data_dict:
             chart_data['HY Spread (bps)'] = data_dict['hy_spread'] * 100
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             chart_data,
             title='변동성 및 스프레드',
             height_preset='compact',
@@ -502,12 +525,8 @@ def render_collateral_stress(data_dict: Dict[str, pd.Series], alert_config: Aler
 
     with col2:
         if 'sp500' in data_dict:
-            sp_df = pd.DataFrame({
-                'date': data_dict['sp500'].index,
-                'value': data_dict['sp500'].values,
-            })
-            fig = create_timeseries_chart(
-                sp_df,
+            fig = cached_timeseries_chart(
+                data_dict['sp500'],
                 title='담보 자산 프록시',
                 height_preset='compact',
                 latest_annotation=True,
@@ -515,12 +534,8 @@ def render_collateral_stress(data_dict: Dict[str, pd.Series], alert_config: Aler
             st.plotly_chart(fig, width="stretch")
 
     if stress_bundle['score'] is not None and len(stress_bundle['score']) > 0:
-        score_df = pd.DataFrame({
-            'date': stress_bundle['score'].index,
-            'value': stress_bundle['score'].values,
-        })
-        fig = create_timeseries_chart(
-            score_df,
+        fig = cached_timeseries_chart(
+            stress_bundle['score'],
             title='종합 담보 스트레스 점수',
             height_preset='compact',
             threshold_lines=[
@@ -533,21 +548,19 @@ def render_collateral_stress(data_dict: Dict[str, pd.Series], alert_config: Aler
 
 
 def _calculate_leverage_score(data_dict: Dict[str, pd.Series]) -> float:
+    views = build_views(data_dict)
     scores = []
-    if 'bank_credit' in data_dict:
-        credit_growth = _latest(calc_3m_annualized(data_dict['bank_credit'], 13))
+    v = views.get('bank_credit')
+    if v:
+        credit_growth = _finite(latest_3m_annualized(v.values, 13))
         if credit_growth is not None:
             scores.append(min(100.0, max(0.0, 30 + credit_growth * 4.5)))
-    if 'hy_spread' in data_dict and len(data_dict['hy_spread']) > 10:
-        spread = data_dict['hy_spread']
-        spread_range = spread.max() - spread.min()
-        if spread_range != 0:
-            scores.append(100 - ((spread.iloc[-1] - spread.min()) / spread_range * 100))
-    if 'vix' in data_dict and len(data_dict['vix']) > 10:
-        vix = data_dict['vix']
-        vix_range = vix.max() - vix.min()
-        if vix_range != 0:
-            scores.append(100 - ((vix.iloc[-1] - vix.min()) / vix_range * 100))
+    for key in ('hy_spread', 'vix'):
+        v = views.get(key)
+        if v and v.length > 10:
+            low, high = np.nanmin(v.values), np.nanmax(v.values)
+            if high != low:
+                scores.append(100 - ((v.last - low) / (high - low) * 100))
     return float(sum(scores) / len(scores)) if scores else 50.0
 
 
@@ -577,6 +590,10 @@ def render_belief_and_leverage(data_dict: Dict[str, pd.Series], alert_config: Al
             belief_alert.additional_checks,
         )
 
+    # Valuation/earnings z-scores feed both the level chart and the change scatter
+    pe_z = calc_zscore(data_dict['pe_ratio'], window_years=3, periods_per_year=52) if 'pe_ratio' in data_dict else None
+    eps_z = calc_zscore(data_dict['forward_eps'], window_years=3, periods_per_year=52) if 'forward_eps' in data_dict else None
+
     col1, col2 = st.columns(2)
     with col1:
         rate_data = {}
@@ -584,7 +601,7 @@ def render_belief_and_leverage(data_dict: Dict[str, pd.Series], alert_config: Al
             rate_data['실질금리 10Y'] = data_dict['real_yield']
         if 'breakeven' in data_dict:
             rate_data['기대 인플레이션 10Y'] = data_dict['breakeven']
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             rate_data,
             title='금리와 기대',
             height_preset='compact',
@@ -594,11 +611,11 @@ def render_belief_and_leverage(data_dict: Dict[str, pd.Series], alert_config: Al
 
     with col2:
         valuation_data = {}
-        if 'pe_ratio' in data_dict and len(data_dict['pe_ratio']) > 156:
-            valuation_data['PE Z'] = calc_zscore(data_dict['pe_ratio'], window_years=3, periods_per_year=52)
-        if 'forward_eps' in data_dict and len(data_dict['forward_eps']) > 156:
-            valuation_data['EPS Z'] = calc_zscore(data_dict['forward_eps'], window_years=3, periods_per_year=52)
-        fig = create_multi_line_chart(
+        if pe_z is not None and len(pe_z) > 156:
+            valuation_data['PE Z'] = pe_z
+        if eps_z is not None and len(eps_z) > 156:
+            valuation_data['EPS Z'] = eps_z
+        fig = cached_multi_line_chart(
             valuation_data,
             title='밸류에이션 vs 이익',
             height_preset='compact',
@@ -609,8 +626,8 @@ def render_belief_and_leverage(data_dict: Dict[str, pd.Series], alert_config: Al
     col1, col2 = st.columns(2)
     with col1:
         if 'pe_ratio' in data_dict and 'forward_eps' in data_dict:
-            val_change = calc_zscore_change(data_dict['pe_ratio'], window_years=3, change_periods=4, periods_per_year=52)
-            earn_change = calc_zscore_change(data_dict['forward_eps'], window_years=3, change_periods=4, periods_per_year=52)
+            val_change = calc_zscore_change(data_dict['pe_ratio'], window_years=3, change_periods=4, periods_per_year=52, zscore=pe_z)
+            earn_change = calc_zscore_change(data_dict['forward_eps'], window_years=3, change_periods=4, periods_per_year=52, zscore=eps_z)
             fig = create_valuation_scatter(
                 val_change,
                 earn_change,
@@ -644,24 +661,22 @@ def render_belief_and_leverage(data_dict: Dict[str, pd.Series], alert_config: Al
 
 
 def _qt_pause_signal_summary(data_dict: Dict[str, pd.Series]) -> Dict[str, object]:
+    views = build_views(data_dict)
     warnings: List[str] = []
     level = "정상"
-    if 'reserve_balances' in data_dict:
-        latest_reserves = _latest(data_dict['reserve_balances'] / 1e9)
-        if latest_reserves is not None and latest_reserves < 1500:
-            warnings.append("준비금이 1.5T 아래로 접근")
-    if 'reverse_repo' in data_dict:
-        latest_rrp = _latest(data_dict['reverse_repo'] / 1e9)
-        if latest_rrp is not None and latest_rrp > 1000:
-            warnings.append("RRP 수요가 1T 상회")
-    if 'fed_lending' in data_dict:
-        latest_lending = _latest(data_dict['fed_lending'] / 1e9)
-        if latest_lending is not None and latest_lending > 100:
-            warnings.append("Fed 대출이 비정상적으로 활성화")
-    if 'vix' in data_dict:
-        latest_vix = _latest(data_dict['vix'])
-        if latest_vix is not None and latest_vix > 25:
-            warnings.append("변동성이 펀딩 불안으로 확산")
+    # NaN latest values compare False, matching the old None checks
+    v = views.get('reserve_balances')
+    if v and v.last / 1e9 < 1500:
+        warnings.append("준비금이 1.5T 아래로 접근")
+    v = views.get('reverse_repo')
+    if v and v.last / 1e9 > 1000:
+        warnings.append("RRP 수요가 1T 상회")
+    v = views.get('fed_lending')
+    if v and v.last / 1e9 > 100:
+        warnings.append("Fed 대출이 비정상적으로 활성화")
+    v = views.get('vix')
+    if v and v.last > 25:
+        warnings.append("변동성이 펀딩 불안으로 확산")
 
     if len(warnings) >= 3:
         level = "높음"
@@ -677,19 +692,17 @@ def render_qt_monitor(data_dict: Dict[str, pd.Series]) -> None:
         st.warning("⚠️ 데이터가 없습니다.")
         return
 
-    qt_pace_series = calculate_qt_pace(data_dict['fed_assets'], periods_1m=4) if 'fed_assets' in data_dict else None
-    reserve_regime = classify_reserve_regime(
-        data_dict['reserve_balances'] / 1e9,
-        reverse_repo=(data_dict.get('reverse_repo') / 1e9) if 'reverse_repo' in data_dict else None,
-    ) if 'reserve_balances' in data_dict else None
-    money_market = detect_money_market_stress(data_dict['reverse_repo'] / 1e9) if 'reverse_repo' in data_dict else None
-    lending_stress = calculate_fed_lending_stress(data_dict['fed_lending'] / 1e9) if 'fed_lending' in data_dict else None
+    fed_ctx = MetricsContext.from_data_dict(data_dict)
+    qt_pace_series = calculate_qt_pace(periods_1m=4, ctx=fed_ctx) if fed_ctx.fed_assets is not None else None
+    reserve_regime = classify_reserve_regime(ctx=fed_ctx) if fed_ctx.reserves is not None else None
+    money_market = detect_money_market_stress(ctx=fed_ctx) if fed_ctx.reverse_repo is not None else None
+    lending_stress = calculate_fed_lending_stress(ctx=fed_ctx) if fed_ctx.fed_lending is not None else None
     pause_signal = _qt_pause_signal_summary(data_dict)
 
     st.markdown("### Snapshot")
     render_kpi_strip([
         {'label': 'QT 페이스', 'value': f"{_latest(qt_pace_series):+.2f}% 1M" if qt_pace_series is not None and _latest(qt_pace_series) is not None else '—'},
-        {'label': '준비금 레짐', 'value': str(reserve_regime.iloc[-1]) if reserve_regime is not None and len(reserve_regime) > 0 else '—'},
+        {'label': '준비금 레짐', 'value': str(reserve_regime.iat[-1]) if reserve_regime is not None and len(reserve_regime) > 0 else '—'},
         {'label': 'MM Stress', 'value': f"{_latest(money_market['stress_score']):.0f}/100" if money_market else '—'},
         {'label': 'Pause 신호', 'value': pause_signal['level']},
     ])
@@ -701,7 +714,7 @@ def render_qt_monitor(data_dict: Dict[str, pd.Series]) -> None:
             qt_chart_data['Fed Assets (T)'] = data_dict['fed_assets'] / 1e12
         if qt_pace_series is not None:
             qt_chart_data['QT Pace (%)'] = qt_pace_series
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             qt_chart_data,
             title='Fed 자산과 QT 페이스',
             secondary_y=['QT Pace (%)'] if 'QT Pace (%)' in qt_chart_data else None,
@@ -715,7 +728,7 @@ def render_qt_monitor(data_dict: Dict[str, pd.Series]) -> None:
             reserve_data['Reserve Balances (T)'] = data_dict['reserve_balances'] / 1e12
         if 'reverse_repo' in data_dict:
             reserve_data['Reverse Repo (T)'] = data_dict['reverse_repo'] / 1e12
-        fig = create_multi_line_chart(
+        fig = cached_multi_line_chart(
             reserve_data,
             title='준비금과 RRP',
             height_preset='compact',
@@ -835,3 +848,24 @@ def render_diagnostics(data_dict: Dict[str, pd.Series], regime_result, alert_con
         render_belief_and_leverage(data_dict, alert_config)
     else:
         render_qt_monitor(data_dict)
+
+
+@st.fragment
+def render_diagnostics_workspace(data_dict: Dict[str, pd.Series], regime_result, alert_config: AlertConfig) -> None:
+    """Render the diagnostics selector and view; switching views reruns only this fragment."""
+    diagnostic_view = st.segmented_control(
+        "Diagnostics",
+        options=DIAGNOSTIC_VIEW_OPTIONS,
+        default=st.session_state['ui_state'].get('diagnostic_view', 'Liquidity Engine'),
+        selection_mode='single',
+        label_visibility='collapsed',
+    )
+    if diagnostic_view:
+        st.session_state['ui_state']['diagnostic_view'] = diagnostic_view
+
+    render_diagnostics(
+        data_dict=data_dict,
+        regime_result=regime_result,
+        alert_config=alert_config,
+        diagnostic_view=st.session_state['ui_state']['diagnostic_view'],
+    )
@@ -4,13 +4,15 @@ Leverage & Marginal Buyer Page
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from components.charts import create_timeseries_chart, create_multi_line_chart
-from indicators.transforms import calc_zscore, calc_3m_annualized, calc_yoy
+from components.views import build_views
+from indicators.transforms import calc_zscore, calc_3m_annualized, calc_yoy, latest_3m_annualized
 from components.styles import render_page_header, render_score_display
 def render_leverage(data_dict, regime_result=None):
     render_page_header(
@@ -25,23 +27,24 @@ def render_leverage(data_dict, regime_result=None):
         return
     
     
+    views = build_views(data_dict)
+    credit_growth = latest_3m_annualized(views['bank_credit'].values, 13) if 'bank_credit' in views else None
+    
     # Leverage Score
-    def calculate_leverage_score(data):
+    def calculate_leverage_score():
         scores = []
-        if 'bank_credit' in data:
-            g = calc_3m_annualized(data['bank_credit'], 13).iloc[-1]
-            scores.append(min(100, max(0, 30 + g * 4.5)))
-        if 'hy_spread' in data and len(data['hy_spread']) > 10:
-            s = data['hy_spread']
-            pct = (s.iloc[-1] - s.min()) / (s.max() - s.min()) * 100
-            scores.append(100 - pct)
-        if 'vix' in data and len(data['vix']) > 10:
-            v = data['vix']
-            pct = (v.iloc[-1] - v.min()) / (v.max() - v.min()) * 100
-            scores.append(100 - pct)
+        if credit_growth is not None:
+            scores.append(min(100, max(0, 30 + credit_growth * 4.5)))
+        for key in ('hy_spread', 'vix'):
+            v = views.get(key)
+            if v and v.length > 10:
+                # One snapshot per series: latest value within its full-history range
+                low, high = np.nanmin(v.values), np.nanmax(v.values)
+                pct = (v.last - low) / (high - low) * 100
+                scores.append(100 - pct)
         return sum(scores) / len(scores) if scores else 50
     
-    score = calculate_leverage_score(data_dict)
+    score = calculate_leverage_score()
     render_score_display(
         score=score,
         max_score=100,
@@ -61,13 +64,12 @@ def render_leverage(data_dict, regime_result=None):
     st.markdown("---")
     st.markdown("### 👤 한계 투자자 추정")
     characteristics = []
-    if 'bank_credit' in data_dict:
-        g = calc_3m_annualized(data_dict['bank_credit'], 13).iloc[-1]
-        if g > 10: characteristics.append("레버리지 투자자 (높은 신용 성장)")
-        elif g < 0: characteristics.append("디레버리지 투자자 (신용 축소)")
-    if 'vix' in data_dict and data_dict['vix'].iloc[-1] < 15:
+    if credit_growth is not None:
+        if credit_growth > 10: characteristics.append("레버리지 투자자 (높은 신용 성장)")
+        elif credit_growth < 0: characteristics.append("디레버리지 투자자 (신용 축소)")
+    if 'vix' in views and views['vix'].last < 15:
         characteristics.append("위험선호 투자자 (낮은 변동성)")
-    elif 'vix' in data_dict and data_dict['vix'].iloc[-1] > 30:
+    elif 'vix' in views and views['vix'].last > 30:
         characteristics.append("위험회피 투자자 (높은 변동성)")
     
     for c in characteristics: st.markdown(f"• {c}")
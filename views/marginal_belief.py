@@ -8,7 +8,6 @@ Marginal Belief Page
 - "신념 과열" 신호: 밸류에이션 확장 속도 > 이익/생산성 개선 속도
 """
 import streamlit as st
-import pandas as pd
 import numpy as np
 import sys
 import os
@@ -16,17 +15,16 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime
-from components.charts import (
-    create_timeseries_chart, 
-    create_multi_line_chart,
-    create_valuation_scatter,
-)
+from components.charts import create_valuation_scatter
+from components.charts_cached import cached_multi_line_chart, cached_timeseries_chart
 from components.cards import render_alert_card
 from components.reports import generate_belief_analysis, generate_fundamental_check
 from indicators.transforms import (
     calc_zscore, 
     calc_zscore_change,
-    calc_1m_change,
+    latest_3m_annualized,
+    latest_pct_change,
+    latest_zscore,
 )
 from indicators.alerts import check_belief_overheating, AlertLevel
 from components.styles import render_page_header, render_numbered_list, COLOR_PALETTE
@@ -72,12 +70,14 @@ def render_marginal_belief(data_dict, regime_result=None):
     st.markdown("### 📊 주요 지표")
     
     col1, col2, col3, col4 = st.columns(4)
+    pe_latest_z = None  # Reused by the belief analysis below
+    eps_change_3m = None
     
     with col1:
         if 'real_yield' in data_dict:
             ry = data_dict['real_yield']
-            latest = ry.iloc[-1] if len(ry) > 0 else 0
-            change_1m = calc_1m_change(ry).iloc[-1] if len(ry) > 4 else None
+            latest = ry.iat[-1] if len(ry) > 0 else 0
+            change_1m = latest_pct_change(ry.to_numpy(dtype=np.float64), 21) if len(ry) > 4 else None
             
             st.metric(
                 "실질금리 (10Y)",
@@ -89,8 +89,8 @@ def render_marginal_belief(data_dict, regime_result=None):
     with col2:
         if 'breakeven' in data_dict:
             be = data_dict['breakeven']
-            latest = be.iloc[-1] if len(be) > 0 else 0
-            change_1m = calc_1m_change(be).iloc[-1] if len(be) > 4 else None
+            latest = be.iat[-1] if len(be) > 0 else 0
+            change_1m = latest_pct_change(be.to_numpy(dtype=np.float64), 21) if len(be) > 4 else None
             
             st.metric(
                 "기대인플레이션 (10Y)",
@@ -101,8 +101,9 @@ def render_marginal_belief(data_dict, regime_result=None):
     with col3:
         if 'pe_ratio' in data_dict:
             pe = data_dict['pe_ratio']
-            latest = pe.iloc[-1] if len(pe) > 0 else 0
-            zscore = calc_zscore(pe, window_years=3, periods_per_year=52).iloc[-1] if len(pe) > 156 else None
+            latest = pe.iat[-1] if len(pe) > 0 else 0
+            pe_latest_z = latest_zscore(pe.to_numpy(dtype=np.float64), window=3 * 52)
+            zscore = pe_latest_z if len(pe) > 156 else None
             
             st.metric(
                 "P/E Ratio",
@@ -114,13 +115,14 @@ def render_marginal_belief(data_dict, regime_result=None):
     with col4:
         if 'forward_eps' in data_dict:
             eps = data_dict['forward_eps']
-            latest = eps.iloc[-1] if len(eps) > 0 else 0
-            change_3m = (eps.iloc[-1] / eps.iloc[-13] - 1) * 100 if len(eps) > 13 else None
+            latest = eps.iat[-1] if len(eps) > 0 else 0
+            if len(eps) > 13:
+                eps_change_3m = latest_pct_change(eps.to_numpy(dtype=np.float64), 12)
             
             st.metric(
                 "Forward EPS",
                 f"${latest:.1f}",
-                f"{change_3m:+.1f}% (3M)" if change_3m else None,
+                f"{eps_change_3m:+.1f}% (3M)" if eps_change_3m else None,
             )
     
     
@@ -141,12 +143,12 @@ def render_marginal_belief(data_dict, regime_result=None):
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = create_multi_line_chart(
+            fig = cached_multi_line_chart(
                 rate_data,
                 title='실질금리 vs 기대인플레이션 (%)',
                 height=400,
+                threshold_lines=[{'value': 0, 'color': 'gray', 'dash': 'dash', 'opacity': 0.5}],
             )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
             st.plotly_chart(fig, width="stretch")
         
         with col2:
@@ -154,16 +156,16 @@ def render_marginal_belief(data_dict, regime_result=None):
             if 'real_yield' in data_dict and 'breakeven' in data_dict:
                 ry = data_dict['real_yield']
                 be = data_dict['breakeven']
-                common_idx = ry.index.intersection(be.index)
-                nominal = ry.loc[common_idx] + be.loc[common_idx]
+                ry, be = ry.align(be, join='inner')
+                nominal = ry + be
                 
                 implied_data = {
-                    'Real Yield': ry.loc[common_idx],
-                    'Breakeven': be.loc[common_idx],
+                    'Real Yield': ry,
+                    'Breakeven': be,
                     'Implied Nominal': nominal,
                 }
                 
-                fig = create_multi_line_chart(
+                fig = cached_multi_line_chart(
                     implied_data,
                     title='금리 분해 (실질 + 기대인플레)',
                     height=400,
@@ -182,31 +184,30 @@ def render_marginal_belief(data_dict, regime_result=None):
     if 'pe_ratio' in data_dict and 'forward_eps' in data_dict:
         pe = data_dict['pe_ratio']
         eps = data_dict['forward_eps']
+        pe_zscore = calc_zscore(pe, window_years=3, periods_per_year=52)
+        eps_zscore = calc_zscore(eps, window_years=3, periods_per_year=52)
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Time series comparison
-            pe_zscore = calc_zscore(pe, window_years=3, periods_per_year=52)
-            eps_zscore = calc_zscore(eps, window_years=3, periods_per_year=52)
-            
             zscore_data = {
                 'PE Z-Score': pe_zscore,
                 'EPS Z-Score': eps_zscore,
             }
             
-            fig = create_multi_line_chart(
+            fig = cached_multi_line_chart(
                 zscore_data,
                 title='밸류에이션 vs 이익추정 Z-Score',
                 height=400,
+                threshold_lines=[{'value': 0, 'color': 'gray', 'dash': 'dash', 'opacity': 0.5}],
             )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
             st.plotly_chart(fig, width="stretch")
         
         with col2:
             # Scatter plot: valuation change vs earnings change
-            val_change = calc_zscore_change(pe, window_years=3, change_periods=4, periods_per_year=52)
-            earn_change = calc_zscore_change(eps, window_years=3, change_periods=4, periods_per_year=52)
+            val_change = calc_zscore_change(pe, window_years=3, change_periods=4, periods_per_year=52, zscore=pe_zscore)
+            earn_change = calc_zscore_change(eps, window_years=3, change_periods=4, periods_per_year=52, zscore=eps_zscore)
             
             if len(val_change.dropna()) > 10 and len(earn_change.dropna()) > 10:
                 fig = create_valuation_scatter(
@@ -222,31 +223,22 @@ def render_marginal_belief(data_dict, regime_result=None):
         # Gap analysis
         st.markdown("#### 밸류에이션-이익 Gap")
         
-        pe_z = calc_zscore(pe, window_years=3, periods_per_year=52)
-        eps_z = calc_zscore(eps, window_years=3, periods_per_year=52)
-        
-        common_idx = pe_z.index.intersection(eps_z.index)
-        gap = pe_z.loc[common_idx] - eps_z.loc[common_idx]
-        
-        gap_df = pd.DataFrame({
-            'date': gap.index,
-            'value': gap.values,
-            'indicator': 'PE-EPS Gap'
-        })
+        pe_aligned, eps_aligned = pe_zscore.align(eps_zscore, join='inner')
+        gap = pe_aligned - eps_aligned
         
-        fig = create_timeseries_chart(
-            gap_df,
+        fig = cached_timeseries_chart(
+            gap,
             title='밸류에이션-이익 Gap (PE z-score - EPS z-score)',
             height=350,
+            threshold_lines=[
+                {'value': 0, 'color': 'gray', 'dash': 'solid', 'opacity': 0.3},
+                {'value': 0.5, 'label': '경계', 'color': 'orange', 'dash': 'dash', 'opacity': 0.5},
+                {'value': 1.0, 'label': '과열', 'color': 'red', 'dash': 'dash', 'opacity': 0.5},
+            ],
         )
-        fig.add_hline(y=0, line_dash="solid", line_color="gray", opacity=0.3)
-        fig.add_hline(y=0.5, line_dash="dash", line_color="orange", opacity=0.5,
-                     annotation_text="경계", annotation_position="right")
-        fig.add_hline(y=1.0, line_dash="dash", line_color="red", opacity=0.5,
-                     annotation_text="과열", annotation_position="right")
         st.plotly_chart(fig, width="stretch")
         
-        latest_gap = gap.iloc[-1] if len(gap) > 0 else 0
+        latest_gap = gap.iat[-1] if len(gap) > 0 else 0
         
         if latest_gap > 1.0:
             st.error(f"🔴 **신념 과열**: 밸류에이션이 이익추정을 {latest_gap:.1f}σ 초과")
@@ -269,15 +261,13 @@ def render_marginal_belief(data_dict, regime_result=None):
     # Get metrics for analysis
     credit_growth = None
     if 'bank_credit' in data_dict:
-        from indicators.transforms import calc_3m_annualized
         credit = data_dict['bank_credit']
-        credit_3m = calc_3m_annualized(credit, periods_3m=13)
-        credit_growth = credit_3m.iloc[-1] if len(credit_3m) > 0 else None
+        credit_growth = latest_3m_annualized(credit.to_numpy(dtype=np.float64), periods_3m=13) if len(credit) > 0 else None
     
-    real_yield = data_dict['real_yield'].iloc[-1] if 'real_yield' in data_dict and len(data_dict['real_yield']) > 0 else None
-    breakeven = data_dict['breakeven'].iloc[-1] if 'breakeven' in data_dict and len(data_dict['breakeven']) > 0 else None
-    pe_zscore = calc_zscore(pe, window_years=3, periods_per_year=52).iloc[-1] if 'pe_ratio' in data_dict else None
-    eps_growth_val = (eps.iloc[-1] / eps.iloc[-13] - 1) * 100 if 'forward_eps' in data_dict and len(eps) > 13 else None
+    real_yield = data_dict['real_yield'].iat[-1] if 'real_yield' in data_dict and len(data_dict['real_yield']) > 0 else None
+    breakeven = data_dict['breakeven'].iat[-1] if 'breakeven' in data_dict and len(data_dict['breakeven']) > 0 else None
+    pe_zscore = pe_latest_z
+    eps_growth_val = eps_change_3m
     
     analysis = generate_belief_analysis(
         regime=regime_result.primary_regime,
@@ -17,18 +17,19 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime, REGIME_COLORS
 from components.cards import render_regime_badge, render_metric_card, render_vulnerability_card
-from components.charts import create_timeseries_chart, create_regime_gauge, create_regime_history_chart
+from components.charts import create_timeseries_chart, create_multi_line_chart, create_regime_gauge, create_regime_history_chart
 from components.reports import (
     generate_daily_summary, 
     generate_belief_analysis, 
     generate_vulnerability_report
 )
 from components.styles import render_page_header, render_info_box, render_numbered_list, COLOR_PALETTE
+from components.views import build_views
 from indicators.transforms import (
-    calc_zscore, 
-    calc_1m_change, 
-    calc_3m_annualized,
-    calc_percentile
+    latest_3m_annualized,
+    latest_pct_change,
+    latest_percentile,
+    latest_zscore,
 )
 
 
@@ -45,42 +46,39 @@ def build_overview_metrics(data_dict):
         'breakeven': None,
     }
 
-    if 'bank_credit' in data_dict:
-        credit = data_dict['bank_credit']
-        credit_3m = calc_3m_annualized(credit, periods_3m=13)
-        metrics['credit_growth_3m'] = credit_3m.iloc[-1] if len(credit_3m) > 0 else None
+    views = build_views(data_dict)
 
-    if 'hy_spread' in data_dict:
-        spread = data_dict['hy_spread']
-        spread_z = calc_zscore(spread, window_years=3, periods_per_year=52)
-        metrics['spread_zscore'] = spread_z.iloc[-1] if len(spread_z) > 0 else None
+    v = views.get('bank_credit')
+    if v:
+        metrics['credit_growth_3m'] = latest_3m_annualized(v.values, periods_3m=13)
 
-    if 'vix' in data_dict:
-        vix = data_dict['vix']
-        vix_pct = calc_percentile(vix, window_years=3, periods_per_year=252)
-        metrics['vix_percentile'] = vix_pct.iloc[-1] if len(vix_pct) > 0 else None
+    v = views.get('hy_spread')
+    if v:
+        metrics['spread_zscore'] = latest_zscore(v.values, window=3 * 52)
 
-    if 'sp500' in data_dict:
-        equity = data_dict['sp500']
-        equity_1m = calc_1m_change(equity)
-        metrics['equity_1m'] = equity_1m.iloc[-1] if len(equity_1m) > 0 else None
+    v = views.get('vix')
+    if v:
+        metrics['vix_percentile'] = latest_percentile(v.values, window=3 * 252)
 
-    if 'pe_ratio' in data_dict:
-        pe = data_dict['pe_ratio']
-        pe_zscore = calc_zscore(pe, window_years=3, periods_per_year=52)
-        metrics['pe_zscore'] = pe_zscore.iloc[-1] if len(pe_zscore) > 0 else None
+    v = views.get('sp500')
+    if v:
+        metrics['equity_1m'] = latest_pct_change(v.values, 21)
 
-    if 'forward_eps' in data_dict:
-        eps = data_dict['forward_eps']
-        eps_growth = calc_1m_change(eps)
-        latest_eps_growth = eps_growth.iloc[-1] if len(eps_growth) > 0 else None
-        metrics['eps_growth'] = latest_eps_growth * 12 if latest_eps_growth is not None else None
+    v = views.get('pe_ratio')
+    if v:
+        metrics['pe_zscore'] = latest_zscore(v.values, window=3 * 52)
 
-    if 'real_yield' in data_dict and len(data_dict['real_yield']) > 0:
-        metrics['real_yield'] = data_dict['real_yield'].iloc[-1]
+    v = views.get('forward_eps')
+    if v:
+        metrics['eps_growth'] = latest_pct_change(v.values, 21) * 12
 
-    if 'breakeven' in data_dict and len(data_dict['breakeven']) > 0:
-        metrics['breakeven'] = data_dict['breakeven'].iloc[-1]
+    v = views.get('real_yield')
+    if v:
+        metrics['real_yield'] = v.last
+
+    v = views.get('breakeven')
+    if v:
+        metrics['breakeven'] = v.last
 
     return metrics
 
@@ -95,6 +93,7 @@ def render_overview(data_dict, regime_result=None):
         return
         
     metrics = build_overview_metrics(data_dict)
+    views = build_views(data_dict)
         
     # ============================================================================
     # KEY METRICS CARDS (6개 핵심 카드)
@@ -106,16 +105,15 @@ def render_overview(data_dict, regime_result=None):
     
     with col1:
         # Credit Growth
-        if 'bank_credit' in data_dict:
-            credit = data_dict['bank_credit']
-            latest = credit.iloc[-1] / 1e12 if len(credit) > 0 else 0
-            change_1m = calc_1m_change(credit).iloc[-1] if len(credit) > 21 else None
+        v = views.get('bank_credit')
+        if v:
+            change_1m = latest_pct_change(v.values, 21) if v.length > 21 else None
             
             render_metric_card(
                 title="🏦 은행 신용",
-                value=latest,
+                value=v.display_last,
                 format_str="${:.2f}",
-                unit="T",
+                unit=v.unit,
                 change_1m=change_1m if change_1m and not np.isnan(change_1m) else None
             )
         else:
@@ -123,16 +121,15 @@ def render_overview(data_dict, regime_result=None):
     
     with col2:
         # Credit Spread
-        if 'hy_spread' in data_dict:
-            spread = data_dict['hy_spread']
-            latest = spread.iloc[-1] * 100 if len(spread) > 0 else 0
-            change_1m = calc_1m_change(spread).iloc[-1] if len(spread) > 4 else None
+        v = views.get('hy_spread')
+        if v:
+            change_1m = latest_pct_change(v.values, 21) if v.length > 4 else None
             
             render_metric_card(
                 title="📈 HY 스프레드",
-                value=latest,
+                value=v.display_last,
                 format_str="{:.0f}",
-                unit=" bps",
+                unit=v.unit,
                 change_1m=change_1m if change_1m and not np.isnan(change_1m) else None,
                 invert=True
             )
@@ -141,10 +138,10 @@ def render_overview(data_dict, regime_result=None):
     
     with col3:
         # VIX
-        if 'vix' in data_dict:
-            vix = data_dict['vix']
-            latest = vix.iloc[-1] if len(vix) > 0 else 0
-            change_1m = calc_1m_change(vix).iloc[-1] if len(vix) > 21 else None
+        v = views.get('vix')
+        if v:
+            latest = v.last
+            change_1m = latest_pct_change(v.values, 21) if v.length > 21 else None
             
             render_metric_card(
                 title="⚡ VIX",
@@ -160,10 +157,10 @@ def render_overview(data_dict, regime_result=None):
     
     with col4:
         # Real Yield
-        if 'real_yield' in data_dict:
-            ry = data_dict['real_yield']
-            latest = ry.iloc[-1] if len(ry) > 0 else 0
-            change_1m = calc_1m_change(ry).iloc[-1] if len(ry) > 4 else None
+        v = views.get('real_yield')
+        if v:
+            latest = v.last
+            change_1m = latest_pct_change(v.values, 21) if v.length > 4 else None
             
             render_metric_card(
                 title="💰 실질금리 (10Y)",
@@ -178,10 +175,10 @@ def render_overview(data_dict, regime_result=None):
     
     with col5:
         # S&P 500
-        if 'sp500' in data_dict:
-            sp = data_dict['sp500']
-            latest = sp.iloc[-1] if len(sp) > 0 else 0
-            ret_1m = calc_1m_change(sp).iloc[-1] if len(sp) > 21 else None
+        v = views.get('sp500')
+        if v:
+            latest = v.last
+            ret_1m = latest_pct_change(v.values, 21) if v.length > 21 else None
             
             render_metric_card(
                 title="📊 S&P 500",
@@ -194,10 +191,10 @@ def render_overview(data_dict, regime_result=None):
     
     with col6:
         # PE Ratio
-        if 'pe_ratio' in data_dict:
-            pe = data_dict['pe_ratio']
-            latest = pe.iloc[-1] if len(pe) > 0 else 0
-            zscore = calc_zscore(pe, window_years=3, periods_per_year=52).iloc[-1] if len(pe) > 156 else None
+        v = views.get('pe_ratio')
+        if v:
+            latest = v.last
+            zscore = metrics['pe_zscore'] if v.length > 156 else None
             
             render_metric_card(
                 title="📐 P/E Ratio",
@@ -230,7 +227,6 @@ def render_overview(data_dict, regime_result=None):
             if 'm2' in data_dict:
                 chart_data['M2'] = data_dict['m2'] / 1e12
             
-            from components.charts import create_multi_line_chart
             fig = create_multi_line_chart(chart_data, title='대차대조표 규모 (조 달러)', normalize=False)
             st.plotly_chart(fig, width="stretch")
     
@@ -243,7 +239,6 @@ def render_overview(data_dict, regime_result=None):
             if 'hy_spread' in data_dict:
                 chart_data['HY Spread (%)'] = data_dict['hy_spread'] * 100
             
-            from components.charts import create_multi_line_chart
             fig = create_multi_line_chart(
                 chart_data, 
                 title='리스크 지표', 
@@ -12,14 +12,22 @@ QT (Quantitative Tightening) Monitoring Page
 import streamlit as st
 import pandas as pd
 import numpy as np
+import plotly.graph_objects as go
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Regime
-from components.charts import create_timeseries_chart, create_multi_line_chart, create_zscore_heatmap
+from components.charts import (
+    create_multi_line_chart,
+    create_timeseries_chart,
+    create_zscore_heatmap,
+    get_active_timeframe,
+)
+from components.charts_cached import cached_timeseries_chart
 from components.cards import render_metric_card
+from components.views import build_views
 from indicators.transforms import (
     calc_yoy,
     calc_3m_annualized,
@@ -30,6 +38,96 @@ from indicators.transforms import (
     calc_percentile,
 )
 from components.styles import render_page_header
+
+# Dashed zero reference for the QT pace and cumulative charts
+ZERO_LINE = [{'value': 0, 'dash': 'dash', 'color': 'white', 'opacity': 0.5}]
+
+# Regime / stress zones shaded behind the reserve, RRP and lending charts (billions)
+RESERVE_REGIME_BANDS = [
+    {'y0': 2500, 'y1': 3500, 'fillcolor': 'rgba(34, 197, 94, 0.1)', 'line_color': 'green', 'line_width': 1, 'label': 'Abundant'},
+    {'y0': 1500, 'y1': 2500, 'fillcolor': 'rgba(59, 130, 246, 0.1)', 'line_color': 'blue', 'line_width': 1, 'label': 'Ample'},
+    {'y0': 500, 'y1': 1500, 'fillcolor': 'rgba(245, 158, 11, 0.1)', 'line_color': 'orange', 'line_width': 1, 'label': 'Tight'},
+    {'y0': 0, 'y1': 500, 'fillcolor': 'rgba(239, 68, 68, 0.1)', 'line_color': 'red', 'line_width': 1, 'label': 'Scarce'},
+]
+# Reserve regime card: (floor in billions, label, marker, description), highest first
+RESERVE_REGIMES = (
+    (2500, "Abundant", "🟢", "준비금 과잉\n(QT 진행 여유)"),
+    (1500, "Ample", "🔵", "준비금 충분\n(정상 수준)"),
+    (500, "Tight", "🟡", "준비금 부족\n(스트레스 신호)"),
+    (-np.inf, "Scarce", "🔴", "준비금 부족\n(경색 위험)"),
+)
+RRP_STRESS_BANDS = [
+    {'y0': 0, 'y1': 500, 'fillcolor': 'rgba(34, 197, 94, 0.1)', 'label': 'Normal'},
+    {'y0': 500, 'y1': 1500, 'fillcolor': 'rgba(245, 158, 11, 0.1)', 'label': 'Elevated'},
+    {'y0': 1500, 'y1': 2500, 'fillcolor': 'rgba(239, 68, 68, 0.1)', 'label': 'Crisis'},
+]
+QT_PACE_BANDS = [
+    {'y0': -100, 'y1': 0, 'fillcolor': 'rgba(239, 68, 68, 0.1)', 'line_width': 0, 'label': 'Aggressive QT'},
+]
+LENDING_STRESS_BANDS = [
+    {'y0': 0, 'y1': 100, 'fillcolor': 'rgba(34, 197, 94, 0.1)', 'label': 'Normal'},
+    {'y0': 100, 'y1': 300, 'fillcolor': 'rgba(245, 158, 11, 0.1)', 'label': 'Elevated'},
+    {'y0': 300, 'y1': 1000, 'fillcolor': 'rgba(239, 68, 68, 0.1)', 'label': 'Crisis'},
+]
+
+
+def _qt_pace_frames(fed: pd.Series) -> dict:
+    """
+    Derive the QT pace series and scalars shared by the three pace tabs.
+    QT 페이스 탭 공용 파생 시리즈/지표 계산
+    """
+    # 4-week change (approximately monthly); the first 4 weeks have no change
+    values = fed.to_numpy(dtype=np.float64)
+    changes = values[4:] - values[:-4]
+    monthly_change = np.full_like(values, np.nan)
+    monthly_change[4:] = changes
+    peak_val = fed.max()
+    return {
+        'level_t': fed / 1e12,
+        'monthly_change_b': pd.Series(monthly_change / 1e9, index=fed.index, name=fed.name),
+        'cumulative_t': (fed - peak_val) / 1e12,
+        # Means over the defined changes only (NaN when there are none)
+        'last_4_weeks_pace': changes[-4:].mean() if len(changes) > 0 else np.nan,
+        'prev_4_weeks_pace': changes[-8:-4].mean() if len(changes) > 4 else np.nan,
+        'peak_val': peak_val,
+        'cumulative_qt': (fed.iat[-1] - peak_val) / 1e12,
+    }
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _fed_assets_chart(level_t: pd.Series, timeframe: str) -> go.Figure:
+    """
+    Fed total assets chart with QE/QT period shading (cached and shared; do not mutate).
+    QE/QT 구간 음영이 포함된 Fed 총자산 차트 (캐시)
+    """
+    fig = create_timeseries_chart(
+        level_t,
+        title='Fed 총자산 (조 달러)',
+        height=400,
+        timeframe=timeframe,
+    )
+
+    # Add QE/QT regions
+    fig.add_vrect(
+        x0=pd.Timestamp('2020-03-01'), x1=pd.Timestamp('2021-12-31'),
+        fillcolor="rgba(34, 197, 94, 0.1)",
+        layer="below",
+        line_width=0,
+        annotation_text="QE Period",
+        annotation_position="top left",
+    )
+
+    fig.add_vrect(
+        x0=pd.Timestamp('2022-01-01'), x1=level_t.index[-1],
+        fillcolor="rgba(239, 68, 68, 0.1)",
+        layer="below",
+        line_width=0,
+        annotation_text="QT Period",
+        annotation_position="top left",
+    )
+    return fig
+
+
 def render_qt_monitoring(data_dict, regime_result=None):
     render_page_header(
         icon="🔄",
@@ -59,99 +157,48 @@ def render_qt_monitoring(data_dict, regime_result=None):
     - **TGA Balance** (Δ TGA): 재정 수정자, 높을수록 준비금 흡수
     """)
     
-    # Create 5-component display
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        if 'fed_assets' in data_dict:
-            fed = data_dict['fed_assets']
-            latest = fed.iloc[-1] / 1e12 if len(fed) > 0 else 0
-            month_ago = fed.iloc[-5] / 1e12 if len(fed) > 5 else latest
-            delta = latest - month_ago
-    
-            st.metric(
-                "Fed Total Assets",
-                f"${latest:.2f}T",
-                f"{delta:+.2f}T (1M)",
-                border=True,
-            )
-    
-    with col2:
-        if 'reserve_balances' in data_dict:
-            reserves = data_dict['reserve_balances']
-            latest = reserves.iloc[-1] / 1e12 if len(reserves) > 0 else 0
-            month_ago = reserves.iloc[-5] / 1e12 if len(reserves) > 5 else latest
-            delta = latest - month_ago
-    
-            st.metric(
-                "Reserve Balances",
-                f"${latest:.2f}T",
-                f"{delta:+.2f}T (1M)",
-                border=True,
-            )
-    
-    with col3:
-        if 'fed_lending' in data_dict:
-            lending = data_dict['fed_lending']
-            latest = lending.iloc[-1] / 1e9 if len(lending) > 0 else 0
-            month_ago = lending.iloc[-5] / 1e9 if len(lending) > 5 else latest
-            delta = latest - month_ago
-    
-            st.metric(
-                "Fed Lending",
-                f"${latest:.1f}B",
-                f"{delta:+.1f}B (1M)",
-                border=True,
-            )
-    
-    with col4:
-        if 'reverse_repo' in data_dict:
-            rrp = data_dict['reverse_repo']
-            latest = rrp.iloc[-1] / 1e9 if len(rrp) > 0 else 0
-            month_ago = rrp.iloc[-5] / 1e9 if len(rrp) > 5 else latest
-            delta = latest - month_ago
-    
-            st.metric(
-                "Reverse Repo (RRP)",
-                f"${latest:.1f}B",
-                f"{delta:+.1f}B (1M)",
-                border=True,
-            )
-    
-    with col5:
-        if 'tga_balance' in data_dict:
-            tga = data_dict['tga_balance']
-            latest = tga.iloc[-1] / 1e9 if len(tga) > 0 else 0
-            month_ago = tga.iloc[-5] / 1e9 if len(tga) > 5 else latest
-            delta = latest - month_ago
-    
-            st.metric(
-                "TGA Balance",
-                f"${latest:.1f}B",
-                f"{delta:+.1f}B (1M)",
-                border=True,
-            )
+    views = build_views(data_dict)
+
+    # Snapshots reused across sections; None when the indicator is missing or empty
+    fed_view = views.get('fed_assets')
+    reserves_view = views.get('reserve_balances')
+    rrp_view = views.get('reverse_repo')
+    lending_view = views.get('fed_lending')
+
+    # Create 5-component display: (key, label, decimals in display units)
+    identity_cards = [
+        ('fed_assets', 'Fed Total Assets', 2),
+        ('reserve_balances', 'Reserve Balances', 2),
+        ('fed_lending', 'Fed Lending', 1),
+        ('reverse_repo', 'Reverse Repo (RRP)', 1),
+        ('tga_balance', 'TGA Balance', 1),
+    ]
+    for col, (key, label, decimals) in zip(st.columns(5), identity_cards):
+        v = views.get(key)
+        if v:
+            with col:
+                st.metric(
+                    label,
+                    f"${v.display_last:.{decimals}f}{v.unit}",
+                    f"{v.change(4) * v.scale:+.{decimals}f}{v.unit} (1M)",
+                    border=True,
+                )
     
     # Identity verification
     col1, col2 = st.columns([2, 1])
+    identity_error = None
     
     with col1:
         # Calculate each component of the identity
         st.markdown("**항등식 검증**")
     
-        if all(k in data_dict for k in ['fed_assets', 'reserve_balances', 'fed_lending', 'reverse_repo', 'tga_balance']):
-            fed = data_dict['fed_assets']
-            reserves = data_dict['reserve_balances']
-            lending = data_dict['fed_lending']
-            rrp = data_dict['reverse_repo']
-            tga = data_dict['tga_balance']
-    
-            # Monthly changes
-            fed_chg = fed.iloc[-1] - fed.iloc[-5] if len(fed) > 5 else 0
-            lending_chg = lending.iloc[-1] - lending.iloc[-5] if len(lending) > 5 else 0
-            rrp_chg = rrp.iloc[-1] - rrp.iloc[-5] if len(rrp) > 5 else 0
-            tga_chg = tga.iloc[-1] - tga.iloc[-5] if len(tga) > 5 else 0
-            reserves_chg = reserves.iloc[-1] - reserves.iloc[-5] if len(reserves) > 5 else 0
+        if all(k in views for k, _, _ in identity_cards):
+            # Monthly changes (4 weekly observations), reused from the cards
+            fed_chg = views['fed_assets'].change(4)
+            lending_chg = views['fed_lending'].change(4)
+            rrp_chg = views['reverse_repo'].change(4)
+            tga_chg = views['tga_balance'].change(4)
+            reserves_chg = views['reserve_balances'].change(4)
     
             # Calculate identity components
             soma_effect = fed_chg / 1e9
@@ -177,7 +224,7 @@ def render_qt_monitoring(data_dict, regime_result=None):
             """)
     
     with col2:
-        if identity_error < 50:  # Less than 50B error is acceptable
+        if identity_error is not None and identity_error < 50:  # Less than 50B error is acceptable
             st.success("✅ 항등식 성립")
             st.markdown("*대차대조표 항등식이 부호 수준에서 검증됨*")
         else:
@@ -193,80 +240,26 @@ def render_qt_monitoring(data_dict, regime_result=None):
     st.markdown("### 📊 QT 페이스 추적 (Pace of Tightening)")
     
     tab1, tab2, tab3 = st.tabs(["Fed 자산 추이", "월간 QT 페이스", "QT 누적"])
+
+    # One pass over the Fed assets series, shared by all three tabs
+    qt_frames = _qt_pace_frames(fed_view.series) if fed_view is not None else None
     
     with tab1:
         # Fed Total Assets level
-        if 'fed_assets' in data_dict:
-            fed = data_dict['fed_assets']
-            fed_df = pd.DataFrame({
-                'date': fed.index,
-                'value': fed.values / 1e12,
-                'indicator': 'Fed Total Assets'
-            })
-    
-            fig = create_timeseries_chart(
-                fed_df,
-                title='Fed 총자산 (조 달러)',
-                date_col='date',
-                value_col='value',
-                height=400,
-            )
-    
-            # Add QE/QT regions
-            fig.add_vrect(
-                x0=pd.Timestamp('2020-03-01'), x1=pd.Timestamp('2021-12-31'),
-                fillcolor="rgba(34, 197, 94, 0.1)",
-                layer="below",
-                line_width=0,
-                annotation_text="QE Period",
-                annotation_position="top left",
-            )
-    
-            fig.add_vrect(
-                x0=pd.Timestamp('2022-01-01'), x1=fed.index[-1],
-                fillcolor="rgba(239, 68, 68, 0.1)",
-                layer="below",
-                line_width=0,
-                annotation_text="QT Period",
-                annotation_position="top left",
-            )
-    
+        if qt_frames is not None:
+            fig = _fed_assets_chart(qt_frames['level_t'], get_active_timeframe())
             st.plotly_chart(fig, width="stretch")
     
     with tab2:
         # Monthly QT pace
-        if 'fed_assets' in data_dict:
-            fed = data_dict['fed_assets']
-    
-            # Calculate monthly change
-            monthly_change = fed.diff(periods=4)  # 4-week change (approximately monthly)
-            monthly_pct = (fed.pct_change(periods=4) * 100)
-    
-            pace_df = pd.DataFrame({
-                'date': monthly_change.index,
-                'value': monthly_change.values / 1e9,
-                'indicator': 'Monthly Change'
-            })
-    
-            fig = create_timeseries_chart(
-                pace_df,
+        if qt_frames is not None:
+            # Zero line and stress zone
+            fig = cached_timeseries_chart(
+                qt_frames['monthly_change_b'],
                 title='월간 QT 페이스 (10억 달러)',
-                date_col='date',
-                value_col='value',
                 height=350,
-            )
-    
-            # Add zero line
-            fig.add_hline(y=0, line_dash="dash", line_color="white", opacity=0.5)
-    
-            # Add stress zones
-            fig.add_hrect(
-                y0=-100, y1=0,
-                fillcolor="rgba(239, 68, 68, 0.1)",
-                layer="below",
-                line_width=0,
-                annotation_text="Aggressive QT",
-                annotation_position="right",
+                threshold_lines=ZERO_LINE,
+                horizontal_bands=QT_PACE_BANDS,
             )
     
             st.plotly_chart(fig, width="stretch")
@@ -275,7 +268,7 @@ def render_qt_monitoring(data_dict, regime_result=None):
             col1, col2, col3 = st.columns(3)
     
             with col1:
-                recent_pace = monthly_change.iloc[-4:].mean() / 1e9
+                recent_pace = qt_frames['last_4_weeks_pace'] / 1e9
                 st.metric(
                     "최근 4주 평균 QT 페이스",
                     f"{recent_pace:+.1f}B",
@@ -284,8 +277,8 @@ def render_qt_monitoring(data_dict, regime_result=None):
     
             with col2:
                 # Detect tapering
-                last_4_weeks_pace = monthly_change.iloc[-4:].mean()
-                prev_4_weeks_pace = monthly_change.iloc[-8:-4].mean()
+                last_4_weeks_pace = qt_frames['last_4_weeks_pace']
+                prev_4_weeks_pace = qt_frames['prev_4_weeks_pace']
                 tapering = last_4_weeks_pace > prev_4_weeks_pace  # Less negative = tapering
     
                 if tapering and last_4_weeks_pace < 0:
@@ -300,10 +293,8 @@ def render_qt_monitoring(data_dict, regime_result=None):
     
             with col3:
                 # QE/QT cumulative since peak
-                peak_idx = fed.idxmax()
-                peak_val = fed.max()
-                current_val = fed.iloc[-1]
-                cumulative_qt = (current_val - peak_val) / 1e12
+                peak_val = qt_frames['peak_val']
+                cumulative_qt = qt_frames['cumulative_qt']
     
                 st.metric(
                     "누적 QT (피크 이후)",
@@ -313,27 +304,14 @@ def render_qt_monitoring(data_dict, regime_result=None):
     
     with tab3:
         # Cumulative QT visualization
-        if 'fed_assets' in data_dict:
-            fed = data_dict['fed_assets']
-            peak_val = fed.max()
-            cumulative_qt = fed - peak_val
-    
-            cumul_df = pd.DataFrame({
-                'date': cumulative_qt.index,
-                'value': cumulative_qt.values / 1e12,
-                'indicator': 'Cumulative QT'
-            })
-    
-            fig = create_timeseries_chart(
-                cumul_df,
+        if qt_frames is not None:
+            fig = cached_timeseries_chart(
+                qt_frames['cumulative_t'],
                 title='누적 QT (피크 기준, 조 달러)',
-                date_col='date',
-                value_col='value',
                 height=350,
+                threshold_lines=ZERO_LINE,
             )
     
-            fig.add_hline(y=0, line_dash="dash", line_color="white", opacity=0.5)
-    
             st.plotly_chart(fig, width="stretch")
     
     
@@ -347,99 +325,37 @@ def render_qt_monitoring(data_dict, regime_result=None):
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        if 'reserve_balances' in data_dict:
-            reserves = data_dict['reserve_balances']
-            reserves_t = reserves / 1e9  # Billions
-    
-            reserve_df = pd.DataFrame({
-                'date': reserves.index,
-                'value': reserves_t.values,
-                'indicator': 'Reserve Balances'
-            })
-    
-            fig = create_timeseries_chart(
-                reserve_df,
+        if reserves_view is not None:
+            reserves_t = reserves_view.series / 1e9  # Billions
+    
+            fig = cached_timeseries_chart(
+                reserves_t,
                 title='준비금 수준 (10억 달러)',
-                date_col='date',
-                value_col='value',
                 height=350,
-            )
-    
-            # Add regime zones
-            fig.add_hrect(
-                y0=2500, y1=3500,
-                fillcolor="rgba(34, 197, 94, 0.1)",
-                layer="below",
-                line_width=1,
-                line_color="green",
-                annotation_text="Abundant",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=1500, y1=2500,
-                fillcolor="rgba(59, 130, 246, 0.1)",
-                layer="below",
-                line_width=1,
-                line_color="blue",
-                annotation_text="Ample",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=500, y1=1500,
-                fillcolor="rgba(245, 158, 11, 0.1)",
-                layer="below",
-                line_width=1,
-                line_color="orange",
-                annotation_text="Tight",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=0, y1=500,
-                fillcolor="rgba(239, 68, 68, 0.1)",
-                layer="below",
-                line_width=1,
-                line_color="red",
-                annotation_text="Scarce",
-                annotation_position="right",
+                horizontal_bands=RESERVE_REGIME_BANDS,
             )
     
             st.plotly_chart(fig, width="stretch")
     
     with col2:
-        if 'reserve_balances' in data_dict:
-            reserves = data_dict['reserve_balances']
-            latest = reserves.iloc[-1] / 1e9
-    
-            # Classify regime
-            if latest >= 2500:
-                regime_label = "Abundant"
-                regime_color = "🟢"
-                regime_desc = "준비금 과잉\n(QT 진행 여유)"
-            elif latest >= 1500:
-                regime_label = "Ample"
-                regime_color = "🔵"
-                regime_desc = "준비금 충분\n(정상 수준)"
-            elif latest >= 500:
-                regime_label = "Tight"
-                regime_color = "🟡"
-                regime_desc = "준비금 부족\n(스트레스 신호)"
-            else:
-                regime_label = "Scarce"
-                regime_color = "🔴"
-                regime_desc = "준비금 부족\n(경색 위험)"
+        if reserves_view is not None:
+            latest = reserves_view.last / 1e9
+    
+            # Classify regime (first floor the latest level reaches; NaN falls to Scarce)
+            _, regime_label, regime_color, regime_desc = next(
+                (regime for regime in RESERVE_REGIMES if latest >= regime[0]),
+                RESERVE_REGIMES[-1],
+            )
     
-            st.markdown(f"### {regime_color} {regime_label}")
-            st.markdown(f"**${latest:.0f}B**")
-            st.markdown(regime_desc)
+            # One markdown element per card instead of one per line
+            regime_blocks = [f"### {regime_color} {regime_label}", f"**${latest:.0f}B**", regime_desc]
     
             # Distance to threshold
             if latest < 2500:
                 distance = 2500 - latest
-                st.markdown(f"---")
-                st.markdown(f"Abundant까지 **${distance:.0f}B** 필요")
+                regime_blocks += ["---", f"Abundant까지 **${distance:.0f}B** 필요"]
+    
+            st.markdown("\n\n".join(regime_blocks))
     
     
     # ============================================================================
@@ -452,47 +368,14 @@ def render_qt_monitoring(data_dict, regime_result=None):
     tab1, tab2 = st.tabs(["역레포 수요", "Fed 대출 시설"])
     
     with tab1:
-        if 'reverse_repo' in data_dict:
-            rrp = data_dict['reverse_repo']
-            rrp_b = rrp / 1e9
-    
-            rrp_df = pd.DataFrame({
-                'date': rrp.index,
-                'value': rrp_b.values,
-                'indicator': 'Reverse Repo'
-            })
-    
-            fig = create_timeseries_chart(
-                rrp_df,
+        if rrp_view is not None:
+            rrp_b = rrp_view.series / 1e9
+    
+            fig = cached_timeseries_chart(
+                rrp_b,
                 title='역레포 (Reverse Repo) 수요 (10억 달러)',
-                date_col='date',
-                value_col='value',
                 height=350,
-            )
-    
-            # Add stress zones
-            fig.add_hrect(
-                y0=0, y1=500,
-                fillcolor="rgba(34, 197, 94, 0.1)",
-                layer="below",
-                annotation_text="Normal",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=500, y1=1500,
-                fillcolor="rgba(245, 158, 11, 0.1)",
-                layer="below",
-                annotation_text="Elevated",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=1500, y1=2500,
-                fillcolor="rgba(239, 68, 68, 0.1)",
-                layer="below",
-                annotation_text="Crisis",
-                annotation_position="right",
+                horizontal_bands=RRP_STRESS_BANDS,
             )
     
             st.plotly_chart(fig, width="stretch")
@@ -500,14 +383,17 @@ def render_qt_monitoring(data_dict, regime_result=None):
             # RRP metrics
             col1, col2, col3 = st.columns(3)
     
+            # Tail reads on the plotted array instead of through the Series indexer
+            rrp_values = rrp_b.to_numpy()
+
             with col1:
-                latest_rrp = rrp_b.iloc[-1]
+                latest_rrp = rrp_values[-1]
                 st.metric("현재 RRP 수요", f"${latest_rrp:.0f}B")
     
             with col2:
-                # RRP spike detection
-                recent_avg = rrp_b.iloc[-13:].mean()
-                prev_avg = rrp_b.iloc[-26:-13].mean()
+                # RRP spike detection (no prior quarter yet -> no spike)
+                recent_avg = rrp_values[-13:].mean()
+                prev_avg = rrp_values[-26:-13].mean() if len(rrp_values) > 13 else 0.0
                 spike = (recent_avg - prev_avg) / prev_avg * 100 if prev_avg > 0 else 0
     
                 st.metric(
@@ -534,47 +420,14 @@ def render_qt_monitoring(data_dict, regime_result=None):
                     )
     
     with tab2:
-        if 'fed_lending' in data_dict:
-            lending = data_dict['fed_lending']
-            lending_b = lending / 1e9
-    
-            lending_df = pd.DataFrame({
-                'date': lending.index,
-                'value': lending_b.values,
-                'indicator': 'Fed Lending'
-            })
-    
-            fig = create_timeseries_chart(
-                lending_df,
+        if lending_view is not None:
+            lending_b = lending_view.series / 1e9
+    
+            fig = cached_timeseries_chart(
+                lending_b,
                 title='Fed 대출 시설 (10억 달러)',
-                date_col='date',
-                value_col='value',
                 height=350,
-            )
-    
-            # Add stress zones
-            fig.add_hrect(
-                y0=0, y1=100,
-                fillcolor="rgba(34, 197, 94, 0.1)",
-                layer="below",
-                annotation_text="Normal",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=100, y1=300,
-                fillcolor="rgba(245, 158, 11, 0.1)",
-                layer="below",
-                annotation_text="Elevated",
-                annotation_position="right",
-            )
-    
-            fig.add_hrect(
-                y0=300, y1=1000,
-                fillcolor="rgba(239, 68, 68, 0.1)",
-                layer="below",
-                annotation_text="Crisis",
-                annotation_position="right",
+                horizontal_bands=LENDING_STRESS_BANDS,
             )
     
             st.plotly_chart(fig, width="stretch")
@@ -583,7 +436,7 @@ def render_qt_monitoring(data_dict, regime_result=None):
             col1, col2 = st.columns(2)
     
             with col1:
-                latest_lending = lending_b.iloc[-1]
+                latest_lending = lending_view.last / 1e9
                 st.metric("현재 Fed 대출", f"${latest_lending:.1f}B")
     
             with col2:
@@ -611,9 +464,9 @@ def render_qt_monitoring(data_dict, regime_result=None):
     with col1:
         st.markdown("**준비금 충분성 메트릭**")
     
-        if 'reserve_balances' in data_dict and 'reverse_repo' in data_dict:
-            reserves = data_dict['reserve_balances'].iloc[-1] / 1e9
-            rrp = data_dict['reverse_repo'].iloc[-1] / 1e9
+        if reserves_view is not None and rrp_view is not None:
+            reserves = reserves_view.last / 1e9
+            rrp = rrp_view.last / 1e9
     
             # Reserve demand proxy (RRP as % of total liquidity)
             total_liquidity = reserves + rrp
@@ -645,9 +498,8 @@ def render_qt_monitoring(data_dict, regime_result=None):
     with col2:
         st.markdown("**2019 레포 위기와의 비교**")
     
-        if 'reserve_balances' in data_dict:
-            reserves = data_dict['reserve_balances']
-            current = reserves.iloc[-1] / 1e9
+        if reserves_view is not None:
+            current = reserves_view.last / 1e9
     
             # 2019 repo crisis level (Sep 2019)
             crisis_2019_reserves = 1500  # Approx level
@@ -671,45 +523,28 @@ def render_qt_monitoring(data_dict, regime_result=None):
     with col3:
         st.markdown("**위험 신호 스캔**")
     
-        warning_count = 0
-        warnings = []
-    
-        # Signal 1: RRP > 1000B
-        if 'reverse_repo' in data_dict:
-            rrp_latest = data_dict['reverse_repo'].iloc[-1] / 1e9
-            if rrp_latest > 1000:
-                warning_count += 1
-                warnings.append("⚠️ RRP > $1000B")
-    
-        # Signal 2: Reserves declining rapidly
-        if 'reserve_balances' in data_dict:
-            reserves = data_dict['reserve_balances']
-            if len(reserves) > 4:
-                recent_decline = (reserves.iloc[-1] - reserves.iloc[-4]) / 1e9
-                if recent_decline < -100:
-                    warning_count += 1
-                    warnings.append("⚠️ 준비금 급격히 감소")
-    
-        # Signal 3: Fed Lending elevated
-        if 'fed_lending' in data_dict:
-            lending = data_dict['fed_lending'].iloc[-1] / 1e9
-            if lending > 100:
-                warning_count += 1
-                warnings.append("⚠️ Fed 대출 증가")
-    
-        # Signal 4: VIX elevated
-        if 'vix' in data_dict:
-            vix = data_dict['vix'].iloc[-1]
-            if vix > 25:
-                warning_count += 1
-                warnings.append("⚠️ VIX > 25")
+        vix_view = views.get('vix')
+
+        # (triggered, label) per signal, read from the per-render snapshots
+        signal_checks = [
+            # Signal 1: RRP > 1000B
+            (rrp_view is not None and rrp_view.last / 1e9 > 1000, "⚠️ RRP > $1000B"),
+            # Signal 2: Reserves declining rapidly (3-week drop > 100B)
+            (reserves_view is not None and reserves_view.length > 4
+             and reserves_view.change(3) / 1e9 < -100, "⚠️ 준비금 급격히 감소"),
+            # Signal 3: Fed Lending elevated
+            (lending_view is not None and lending_view.last / 1e9 > 100, "⚠️ Fed 대출 증가"),
+            # Signal 4: VIX elevated
+            (vix_view is not None and vix_view.last > 25, "⚠️ VIX > 25"),
+        ]
+        warnings = [label for triggered, label in signal_checks if triggered]
+        warning_count = len(warnings)
     
         st.metric("활성 경고", warning_count, "개")
     
         if warning_count > 0:
             st.error(f"**위험 신호 {warning_count}개 감지**")
-            for w in warnings:
-                st.markdown(f"• {w}")
+            st.markdown("  \n".join(f"• {w}" for w in warnings))
         else:
             st.success("**안전 상태**")
             st.markdown("* 현재 주요 경고 없음")